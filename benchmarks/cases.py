@@ -0,0 +1,231 @@
+"""
+Benchmark cases for the simulator and gym hot paths.
+
+Each case is a setup function registered with @case. Setup builds whatever
+state the case needs and returns a zero-argument callable; the runner times
+calls to that callable.
+"""
+from typing import Callable, Dict
+from itertools import cycle
+import numpy as np
+from craps.bets import PassLine, ComeBets, PlaceBets, Field, DontPass, DontComeBets, LayBets, HardwayBets
+from craps.bets.model import Bet
+from craps.constants import POINTS
+from craps.dice import RandomDice
+from craps.phase import TablePhase
+from craps.state import TableConfig, TableState
+from craps.gym.config import CrapsEnvConfig
+from craps.gym.codec import SpaceCodec
+from craps.gym.env import CrapsEnv
+from craps.gym.reward import cpt_utility_from_returns
+from craps.gym.wrappers import FlattenActionWrapper, CPTBuffer, CPTRewardWrapper
+
+CASES: Dict[str, Callable[[], Callable[[], None]]] = {}
+
+TABLE_CONFIG = TableConfig(table_min=15, table_max=75, odds_max=3, prop_min=5)
+ENV_CONFIG = CrapsEnvConfig(
+    init_bankroll=1000.0,
+    max_bankroll=2000.0,
+    max_points=30,
+    min_bet_inc=5,
+    entertainment_cost=5.0,
+)
+
+
+def case(name: str):
+    def decorator(fn: Callable[[], Callable[[], None]]):
+        CASES[name] = fn
+        return fn
+    return decorator
+
+
+def _rolls(n: int = 4096, seed: int = 0):
+    dice = RandomDice(seed)
+    return cycle([dice.next_roll() for _ in range(n)])
+
+
+def _all_bets() -> Dict[str, Bet]:
+    init_phase = TablePhase()
+    return {
+        'pass_line': PassLine(init_phase),
+        'come': ComeBets(init_phase),
+        'place': PlaceBets(init_phase),
+        'field': Field(init_phase),
+    }
+
+
+def _arm(bet: Bet):
+    """Put a wager on every target the bet currently accepts."""
+    for tgt in bet.set_stake_targets():
+        if bet.get_stake(target=tgt) == 0 and bet.can_set_stake(target=tgt):
+            bet.set_stake(30.0, target=tgt)
+    for tgt in bet.set_odds_targets():
+        if bet.get_odds(target=tgt) == 0 and bet.can_set_odds(target=tgt):
+            bet.set_odds(30.0, target=tgt)
+
+
+def _arm_state(state: TableState, key: str):
+    """Like _arm(), but through the TableState so it tracks the active bets."""
+    bet = state.bets[key]
+    for tgt in bet.set_stake_targets():
+        if bet.get_stake(target=tgt) == 0 and bet.can_set_stake(target=tgt):
+            state.set_bet_stake(key, 30.0, target=tgt)
+    for tgt in bet.set_odds_targets():
+        if bet.get_odds(target=tgt) == 0 and bet.can_set_odds(target=tgt):
+            state.set_bet_odds(key, 30.0, target=tgt)
+
+
+def _state_step_case(bet_cls):
+    def setup():
+        bet = bet_cls(TablePhase())
+        state = TableState(TABLE_CONFIG, {'bet': bet}, 1e12)
+        rolls = _rolls()
+
+        def run():
+            _arm_state(state, 'bet')
+            state.step(next(rolls))
+        return run
+    return setup
+
+
+def _settle_case(bet_cls):
+    def setup():
+        bet = bet_cls(TablePhase())
+        rolls = _rolls()
+
+        def run():
+            _arm(bet)
+            bet.settle(next(rolls))
+        return run
+    return setup
+
+
+for _name, _cls in (
+        ('pass_line', PassLine), ('come', ComeBets), ('place', PlaceBets), ('field', Field),
+        ('dont_pass', DontPass), ('dont_come', DontComeBets), ('lay', LayBets),
+        ('hardways', HardwayBets)):
+    case(f"state_step.{_name}")(_state_step_case(_cls))
+    case(f"bet_settle.{_name}")(_settle_case(_cls))
+
+
+@case("state_step.empty")
+def _state_step_empty():
+    state = TableState(TABLE_CONFIG, _all_bets(), 1e12)
+    rolls = _rolls()
+    return lambda: state.step(next(rolls))
+
+
+def _codec_and_state():
+    bets = _all_bets()
+    codec = SpaceCodec(TABLE_CONFIG, bets, ENV_CONFIG.init_bankroll, ENV_CONFIG.max_points, ENV_CONFIG.min_bet_inc)
+    state = TableState(TABLE_CONFIG, bets, ENV_CONFIG.init_bankroll)
+    state.step(RandomDice(0).next_roll())
+    state.set_bet_stake('place', 30.0, target=6) if state.get_phase().point else None
+    return codec, state
+
+
+@case("codec.encode_observation")
+def _encode_observation():
+    codec, state = _codec_and_state()
+    return lambda: codec.encode_observation(state, n_points=3)
+
+
+@case("codec.build_action_mask")
+def _build_action_mask():
+    codec, state = _codec_and_state()
+    return lambda: codec.build_action_mask(state)
+
+
+@case("codec.decode_action")
+def _decode_action():
+    codec, _ = _codec_and_state()
+    action = {key: 1 for key in codec.action_space.spaces}
+    return lambda: list(codec.decode_action(action))
+
+
+def _env_case(wrap):
+    def setup():
+        env = wrap(CrapsEnv(ENV_CONFIG, TABLE_CONFIG, _all_bets()))
+        env.reset(seed=0)
+        env.action_space.seed(0)
+        actions = cycle([env.action_space.sample() for _ in range(256)])
+
+        def run():
+            _, _, done, trunc, _ = env.step(next(actions))
+            if done or trunc:
+                env.reset()
+        return run
+    return setup
+
+
+case("env_step.raw")(_env_case(lambda env: env))
+case("env_step.flatten")(_env_case(FlattenActionWrapper))
+case("env_step.flatten_cpt")(_env_case(
+    lambda env: CPTRewardWrapper(FlattenActionWrapper(env), CPTBuffer(), ENV_CONFIG.init_bankroll, ENV_CONFIG.entertainment_cost)
+))
+
+
+@case("reward.cpt_utility_from_returns")
+def _cpt_utility():
+    returns = np.random.default_rng(0).normal(-0.05, 0.3, size=256).astype(np.float32)
+    return lambda: cpt_utility_from_returns(returns)
+
+
+@case("batch_step.1024_tables")
+def _batch_step():
+    from craps.batch import BatchTableConfig, BatchTableState
+    config = BatchTableConfig(table_min=np.repeat([5.0, 15.0, 25.0, 50.0], 256), table_max=5000, odds_max=3, prop_min=1)
+    bets = {'pass_line': PassLine, 'come': ComeBets, 'place': PlaceBets, 'field': Field}
+    state = BatchTableState(config, bets, 1e12)
+    outcomes = np.random.default_rng(0).integers(0, 36, size=(4096, len(config)))
+    rows = cycle(outcomes)
+
+    def run():
+        state.apply_bets([('pass_line', 'stake', 50.0, None)])
+        state.apply_bets([('field', 'stake', 50.0, None)])
+        state.step(next(rows))
+    return run
+
+
+@case("dsl.1024_tables")
+def _dsl_batch():
+    from craps.batch import BatchTableConfig
+    from craps.dsl import RuleStrategy, rule, comeout, point_on, stake, set_stake, set_odds, POINT
+    strategy = RuleStrategy(
+        {'pass_line': PassLine, 'place_bets': PlaceBets},
+        [
+            rule(comeout(), set_stake('pass_line', 15)),
+            rule(point_on() & (stake('pass_line') > 0), set_odds('pass_line', 30, POINT)),
+            rule(point_on(), set_stake('place_bets', 18, 6), set_stake('place_bets', 18, 8)),
+        ],
+    )
+    config = BatchTableConfig(table_min=np.repeat([5.0, 15.0], 512), table_max=5000, odds_max=3, prop_min=1)
+    state = strategy.make_batch(config, 1e12)
+    rows = cycle(np.random.default_rng(0).integers(0, 36, size=(4096, len(config))))
+
+    def run():
+        strategy.act_batch(state)
+        state.step(next(rows))
+    return run
+
+
+@case("state.roll_risk")
+def _roll_risk():
+    state = TableState(TABLE_CONFIG, _all_bets(), 1e12)
+    rolls = _rolls()
+    while state.get_phase().point is None:
+        state.step(next(rolls))
+    for key in state.bets:
+        _arm_state(state, key)
+    return state.get_roll_risk
+
+
+@case("state.snapshot_restore")
+def _snapshot_restore():
+    state = TableState(TABLE_CONFIG, _all_bets(), 1e12)
+    for key in state.bets:
+        _arm_state(state, key)
+
+    def run():
+        state.restore(state.snapshot())
+    return run
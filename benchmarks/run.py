@@ -0,0 +1,165 @@
+#!/usr/bin/env python
+"""
+Runs the benchmark cases and compares results against a stored baseline.
+
+Usage:
+    python benchmarks/run.py run [--filter PATTERN] [--output FILE]
+    python benchmarks/run.py compare BASELINE CURRENT [--threshold 0.10]
+    python benchmarks/run.py scaling [--workers 1,2,4,8] [--executor thread|process] [--output FILE]
+
+Results are JSON files mapping each case to its best time per call (ns).
+compare exits with status 1 if any case got slower than the threshold.
+scaling times the parallel session runner at each worker count and reports
+throughput and speedup over one worker.
+"""
+import argparse
+import fnmatch
+import json
+import os
+import platform
+import sys
+import time
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines", "baseline.json")
+
+
+def time_case(setup, repeat: int, min_time: float) -> float:
+    """Return the best time per call in nanoseconds."""
+    fn = setup()
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    number = max(number, int(number * min_time / 0.2))
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e9
+
+
+def run(args) -> int:
+    from cases import CASES
+    results = {}
+    for name, setup in CASES.items():
+        if args.filter and not fnmatch.fnmatch(name, args.filter):
+            continue
+        ns = time_case(setup, args.repeat, args.min_time)
+        results[name] = {"ns_per_call": ns}
+        print(f"{name:40s} {ns:12.1f} ns")
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+        print(f"Saved {len(results)} results to {args.output}")
+    return 0
+
+
+def compare(args) -> int:
+    with open(args.baseline) as f:
+        baseline = json.load(f)["results"]
+    with open(args.current) as f:
+        current = json.load(f)["results"]
+
+    regressions = []
+    for name in sorted(set(baseline) | set(current)):
+        if name not in baseline or name not in current:
+            status = "new" if name not in baseline else "missing"
+            print(f"{name:40s} {status}")
+            continue
+        base = baseline[name]["ns_per_call"]
+        curr = current[name]["ns_per_call"]
+        ratio = curr / base
+        flag = ""
+        if ratio > 1.0 + args.threshold:
+            flag = "REGRESSION"
+            regressions.append(name)
+        elif ratio < 1.0 - args.threshold:
+            flag = "faster"
+        print(f"{name:40s} {base:12.1f} -> {curr:12.1f} ns  x{ratio:5.2f}  {flag}")
+
+    if regressions:
+        print(f"{len(regressions)} regression(s) above {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+def scaling(args) -> int:
+    from craps.parallel import run_sessions, gil_enabled, default_executor
+    from craps.state import TableConfig
+    from craps.strategies import ThreePointMolly
+
+    executor = args.executor or default_executor()
+    config = TableConfig(table_min=15, table_max=10000, odds_max=3, prop_min=5)
+    workers = [int(w) for w in args.workers.split(",")]
+    print(f"executor={executor} gil_enabled={gil_enabled()} cpus={os.cpu_count()}")
+
+    results = {}
+    base = None
+    for n in workers:
+        start = time.perf_counter()
+        run_sessions(ThreePointMolly(), args.sessions, config, 500.0, args.rolls,
+                     max_workers=n, executor=executor)
+        elapsed = time.perf_counter() - start
+        rate = args.sessions / elapsed
+        base = base or rate
+        results[str(n)] = {"sessions_per_s": rate, "speedup": rate / base}
+        print(f"{n:4d} workers {rate:12.1f} sessions/s  x{rate / base:5.2f}  efficiency {rate / base / n:5.0%}")
+
+    if args.output:
+        report = {
+            "meta": {
+                "python": platform.python_version(),
+                "executor": executor,
+                "gil_enabled": gil_enabled(),
+                "cpus": os.cpu_count(),
+                "sessions": args.sessions,
+                "rolls": args.rolls,
+            },
+            "results": results,
+        }
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+        print(f"Saved scaling curve to {args.output}")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = sub.add_parser("run", help="Run the benchmarks")
+    run_parser.add_argument("--filter", type=str, default=None, help="Glob pattern for case names")
+    run_parser.add_argument("--output", type=str, default=None, help="Save results to this JSON file")
+    run_parser.add_argument("--repeat", type=int, default=5, help="Timing repeats per case (best is kept)")
+    run_parser.add_argument("--min-time", type=float, default=0.2, help="Minimum seconds per repeat")
+    run_parser.set_defaults(func=run)
+
+    compare_parser = sub.add_parser("compare", help="Compare results against a baseline")
+    compare_parser.add_argument("baseline", nargs="?", default=DEFAULT_BASELINE)
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.10, help="Relative slowdown that counts as a regression")
+    compare_parser.set_defaults(func=compare)
+
+    scaling_parser = sub.add_parser("scaling", help="Measure parallel session throughput per worker count")
+    scaling_parser.add_argument("--workers", type=str, default=",".join(str(2 ** i) for i in range(((os.cpu_count() or 1)).bit_length())),
+                                help="Comma-separated worker counts")
+    scaling_parser.add_argument("--executor", choices=["thread", "process"], default=None, help="Defaults to threads on free-threaded builds")
+    scaling_parser.add_argument("--sessions", type=int, default=2000)
+    scaling_parser.add_argument("--rolls", type=int, default=100, help="Rolls per session")
+    scaling_parser.add_argument("--output", type=str, default=None, help="Save the curve to this JSON file")
+    scaling_parser.set_defaults(func=scaling)
+
+    args = parser.parse_args()
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
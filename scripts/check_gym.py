@@ -1,17 +1,18 @@
 #!/usr/bin/env python
 """Validate CrapsEnv compatibility with Stable Baselines3."""
 
-from stable_baselines3.common.env_checker import check_env
-
-from craps.gym.env import CrapsEnv
 from craps.gym.config import CrapsEnvConfig
-from craps.gym.wrappers import FlattenActionWrapper
 from craps.state import TableConfig
 from craps.phase import TablePhase
 from craps.bets import PassLine, PlaceBets, Field
 
 
 def main():
+    # Heavy imports live here so importing this script stays cheap
+    from stable_baselines3.common.env_checker import check_env
+    from craps.gym.env import CrapsEnv
+    from craps.gym.wrappers import FlattenActionWrapper
+
     # Configure environment
     env_config = CrapsEnvConfig(
         init_bankroll=1000.0,
@@ -1,39 +1,40 @@
 import argparse
-from sb3_contrib import MaskablePPO
-from stable_baselines3.common.vec_env import SubprocVecEnv
-from stable_baselines3.common.callbacks import BaseCallback
-import wandb
-from wandb.integration.sb3 import WandbCallback
-from craps.gym.env import CrapsEnv
-from craps.gym.config import CrapsEnvConfig
-from craps.gym.wrappers import FlattenActionWrapper, CPTBuffer, CPTRewardWrapper
-from craps.state import TableConfig
-from craps.phase import TablePhase
-from craps.bets import PassLine, PlaceBets, Field, ComeBets
+import json
+
+# Heavy dependencies (gymnasium, torch, stable_baselines3, wandb) are imported
+# inside the functions that need them, so `--help` and spawned env workers
+# start quickly.
 
 N_ENVS = 8
 
+# Where each local sink writes when --metrics-path is not given
+DEFAULT_METRICS_PATHS = {
+    "tensorboard": "runs/",
+    "jsonl": "metrics.jsonl",
+    "parquet": "metrics.parquet",
+}
+
+
+def make_sink(name: str, path: str):
+    from craps.gym.sinks import WandbSink, TensorBoardSink, JsonlSink, ParquetSink
+    if name == "wandb":
+        return WandbSink()
+    if name == "tensorboard":
+        return TensorBoardSink(path)
+    if name == "jsonl":
+        return JsonlSink(path)
+    if name == "parquet":
+        return ParquetSink(path)
+    raise ValueError(f"Unknown metrics sink: {name}")
 
-class CrapsMetricsCallback(BaseCallback):
-    def _on_step(self):
-        for info in self.locals["infos"]:
-            if "ep_reward_total" in info:
-                wandb.log({
-                    "reward/total": info["ep_reward_total"],
-                    "reward/cpt_delta": info["ep_cpt_delta"],
-                    "reward/cpt_utility": info["ep_cpt_utility"],
-                    "session/terminal_bankroll": info["terminal_bankroll"],
-                    "session/total_steps": info["total_steps"],
-                    "session/n_points": info["n_points"],
-                    "session/illegal_actions": info["ep_illegal_actions"],
-                    "session/adjusted_ref": info["adjusted_ref"],
-                    "session/fractional_return": info["fractional_return"],
-                })
-        return True
-
-
-def make_env(env_config, table_config, seed):
+
+def make_env(env_config, table_config, seeds, node, env_index):
     def _init():
+        from craps.gym.env import CrapsEnv
+        from craps.gym.wrappers import FlattenActionWrapper, CPTBuffer, CPTRewardWrapper
+        from craps.phase import TablePhase
+        from craps.bets import PassLine, PlaceBets, Field, ComeBets
+
         init_phase = TablePhase()
         bets = {
             'pass_line': PassLine(init_phase),
@@ -41,19 +42,55 @@ def make_env(env_config, table_config, seed):
             'place': PlaceBets(init_phase),
             'field': Field(init_phase),
         }
-        env = FlattenActionWrapper(CrapsEnv(env_config, table_config, bets))
+        # Every episode of this env rolls from its own seed path
+        # (node, 0, env_index, episode). Episode indices advance on every
+        # reset, including the ones during setup, so the path is stored in
+        # each finished episode's record and written to --episode-log
+        dice = seeds.dice(node=node, env=env_index)
+        env = FlattenActionWrapper(CrapsEnv(env_config, table_config, bets, dice=dice))
         buffer = CPTBuffer()
         env = CPTRewardWrapper(
             env, buffer,
             init_bankroll=env_config.init_bankroll,
             entertainment_cost=env_config.entertainment_cost
         )
-        env.reset(seed=seed)
+        env.reset(seed=seeds.int_seed(node, 0, env_index))
         return env
     return _init
 
 
+def parse_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--resume", type=str, default=None, help="Path to a saved model zip to resume from")
+    parser.add_argument("--metrics-sink", choices=["wandb", "tensorboard", "jsonl", "parquet"], default="wandb")
+    parser.add_argument("--metrics-path", type=str, default=None,
+                        help="Output path for local/tensorboard sinks (default: runs/, metrics.jsonl or metrics.parquet)")
+    parser.add_argument("--metrics-window", type=int, default=1000, help="Episodes covered by each metrics summary")
+    parser.add_argument("--episode-log", type=str, default="episodes.jsonl",
+                        help="Per-episode records with seed paths, for replaying episodes")
+    parser.add_argument("--seed", type=int, default=None, help="Root seed for the run (fresh entropy if omitted)")
+    parser.add_argument("--node", type=int, default=0, help="Index of this machine in a multi-node sweep")
+    parser.add_argument("--seed-file", type=str, default="seeds.json", help="Where to record the run's seed tree")
+    args = parser.parse_args()
+    if args.metrics_path is None:
+        args.metrics_path = DEFAULT_METRICS_PATHS.get(args.metrics_sink)
+    return args
+
+
 def main():
+    args = parse_args()
+
+    from sb3_contrib import MaskablePPO
+    from stable_baselines3.common.vec_env import SubprocVecEnv
+    import wandb
+    from wandb.integration.sb3 import WandbCallback
+    from craps.gym.callbacks import CrapsMetricsCallback
+    from craps.gym.config import CrapsEnvConfig
+    from craps.gym.metrics import MetricsAggregator
+    from craps.gym.sinks import JsonlEpisodeLog
+    from craps.state import TableConfig
+    from craps.seeding import SeedTree
+
     # Configure environment
     env_config = CrapsEnvConfig(
         init_bankroll=1000.0,
@@ -69,21 +106,23 @@ def main():
         prop_min=5
     )
 
+    # Derive every env's streams from one recorded root seed
+    seeds = SeedTree(args.seed)
+    seed_metadata = {**seeds.metadata(), 'node': args.node, 'n_envs': N_ENVS}
+    with open(args.seed_file, "w") as f:
+        json.dump(seed_metadata, f, indent=2)
+
     # Create vectorized environment
-    env = SubprocVecEnv([make_env(env_config, table_config, seed=i) for i in range(N_ENVS)])
+    env = SubprocVecEnv([make_env(env_config, table_config, seeds, args.node, i) for i in range(N_ENVS)])
 
     # Create or load agent
-    parser = argparse.ArgumentParser()
-    parser.add_argument("--resume", type=str, default=None, help="Path to a saved model zip to resume from")
-    args = parser.parse_args()
-
     if args.resume:
         model = MaskablePPO.load(args.resume, env=env)
     else:
-        model = MaskablePPO("MultiInputPolicy", env, verbose=1)
+        model = MaskablePPO("MultiInputPolicy", env, verbose=1, seed=seeds.int_seed(args.node))
 
     # Train agent
-    wandb.init(project="craps-rl")
+    wandb.init(project="craps-rl", config={'seeds': seed_metadata})
     model.learn(
         5_000_000,
         callback=[
@@ -93,9 +132,15 @@ def main():
                 model_save_freq=50_000,
                 verbose=2
             ),
-            CrapsMetricsCallback(),
+            CrapsMetricsCallback(
+                MetricsAggregator(
+                    [make_sink(args.metrics_sink, args.metrics_path)],
+                    window=args.metrics_window,
+                    episode_log=JsonlEpisodeLog(args.episode_log)
+                )
+            ),
         ]
     )
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
@@ -1,13 +1,15 @@
 from pprint import pprint
-from sb3_contrib import MaskablePPO
-from craps.gym.env import CrapsEnv
 from craps.gym.config import CrapsEnvConfig
-from craps.gym.wrappers import FlattenActionWrapper
 from craps.state import TableConfig
 from craps.phase import TablePhase
 from craps.bets import PassLine, PlaceBets, Field, ComeBets
 
 def main():
+    # Heavy imports live here so importing this script stays cheap
+    from sb3_contrib import MaskablePPO
+    from craps.gym.env import CrapsEnv
+    from craps.gym.wrappers import FlattenActionWrapper
+
     # Configure environment
     env_config = CrapsEnvConfig(
         init_bankroll=1000.0,
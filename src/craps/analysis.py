@@ -0,0 +1,263 @@
+"""
+Exact evaluation of bet layouts with an absorbing Markov chain.
+
+States are (table phase, wager layout) pairs reached by settling the bets
+against every roll total, or every dice pair when a bet (e.g. a hardway)
+depends on more than the total. Payouts come from the bet classes themselves, so
+any Bet implementation can be analyzed without rolling dice.
+"""
+from typing import Dict, Tuple, List
+from dataclasses import dataclass
+import numpy as np
+from craps.bets.model import Bet
+from craps.constants import POINTS
+from craps.dice import Roll, ROLLS
+from craps.state import TableState
+
+# Table phases in matrix order: come-out, then the point numbers
+PHASES = (None,) + POINTS
+
+# Probability of each dice total, and one roll that produces it
+TOTAL_PROBS = {t: (6 - abs(t - 7)) / 36 for t in range(2, 13)}
+TOTAL_ROLLS = {t: Roll((max(1, t - 6), t - max(1, t - 6))) for t in range(2, 13)}
+OUTCOME_PROBS = tuple((roll, 1 / 36) for roll in ROLLS)
+
+MAX_STATES = 100_000
+
+
+@dataclass
+class LayoutAnalysis:
+    """
+    Exact statistics for a bet layout played until every wager resolves,
+    with no further betting.
+
+    Attributes:
+        expected_value: Expected net result (payouts minus amount wagered).
+        variance: Variance of the net result.
+        wagered: Total amount on the table when the analysis started.
+        expected_rolls: Expected number of rolls until every wager resolves.
+        house_edge: Expected loss per dollar wagered.
+        edge_per_roll: Expected loss per dollar wagered per roll.
+    """
+    expected_value: float
+    variance: float
+    wagered: float
+    expected_rolls: float
+    house_edge: float
+    edge_per_roll: float
+
+
+def phase_transition_matrix() -> np.ndarray:
+    """
+    Returns the 7x7 roll-by-roll transition matrix over PHASES.
+    """
+    index = {phase: i for i, phase in enumerate(PHASES)}
+    matrix = np.zeros((len(PHASES), len(PHASES)))
+    for phase in PHASES:
+        for total, p in TOTAL_PROBS.items():
+            if phase is None:
+                nxt = total if total in POINTS else None
+            else:
+                nxt = None if total in (phase, 7) else phase
+            matrix[index[phase], index[nxt]] += p
+    return matrix
+
+
+def analyze_state(state: TableState) -> LayoutAnalysis:
+    """
+    Analyzes the wagers currently on the table. The state is not modified.
+    """
+    return analyze_bets(state.bets)
+
+
+def analyze_bets(bets: Dict[str, Bet]) -> LayoutAnalysis:
+    """
+    Computes the exact expected value, variance and house edge of the wagers
+    on the given bets, played from their current phase until all resolve.
+
+    Raises:
+        ValueError: If no wager is on the table, or the layout never resolves.
+    """
+    bet_list = list(bets.values())
+    initial = _snapshot(bet_list)
+    wagered = _total_wager(bet_list)
+    if wagered <= 0:
+        raise ValueError("Cannot analyze a layout with nothing wagered.")
+
+    try:
+        states, transitions = _explore(bet_list, initial)
+    finally:
+        _restore(bet_list, initial)
+
+    # Transient states are everything except the empty layout
+    n = len(states)
+    q = np.zeros((n, n))
+    reward = np.zeros(n)
+    reward_sq = np.zeros(n)
+    for i, edges in enumerate(transitions):
+        for p, payout, j in edges:
+            if j is not None:
+                q[i, j] += p
+            reward[i] += p * payout
+            reward_sq[i] += p * payout * payout
+
+    a = np.eye(n) - q
+    try:
+        value = np.linalg.solve(a, reward)
+        rolls = np.linalg.solve(a, np.ones(n))
+    except np.linalg.LinAlgError:
+        raise ValueError("The layout never resolves.")
+
+    # Second moment: M[s] = sum_t p (r^2 + 2 r E[s'] + M[s'])
+    cross = np.zeros(n)
+    for i, edges in enumerate(transitions):
+        for p, payout, j in edges:
+            if j is not None:
+                cross[i] += 2.0 * p * payout * value[j]
+    second = np.linalg.solve(a, reward_sq + cross)
+
+    expected_payout = float(value[0])
+    expected_value = expected_payout - wagered
+    variance = max(0.0, float(second[0]) - expected_payout ** 2)
+    expected_rolls = float(rolls[0])
+    house_edge = -expected_value / wagered
+    return LayoutAnalysis(
+        expected_value=expected_value,
+        variance=variance,
+        wagered=wagered,
+        expected_rolls=expected_rolls,
+        house_edge=house_edge,
+        edge_per_roll=house_edge / expected_rolls
+    )
+
+
+def exponential_moment(bets: Dict[str, Bet], theta: float) -> float:
+    """
+    Computes E[exp(theta * net)] for the wagers on the given bets played
+    until all resolve, where net is the change in bankroll plus wagers.
+
+    Raises:
+        ValueError: If nothing is wagered, or the moment is infinite.
+    """
+    moments, _ = _exponential_moments(list(bets.values()), theta)
+    return moments[0]
+
+
+def tilted_roll_probs(bets: Dict[str, Bet], theta: float) -> Tuple[float, ...]:
+    """
+    Returns the probability of each outcome in ROLLS under the exponential
+    tilt of the layout's remaining play: fair odds reweighted by
+    exp(theta * net of the roll) times the exponential moment of the layout
+    it leaves. Played until resolution, these rolls give every path the
+    likelihood ratio exp(-theta * net) * exponential_moment(bets, theta).
+
+    Raises:
+        ValueError: If nothing is wagered, or the moment is infinite.
+    """
+    moments, edges = _exponential_moments(list(bets.values()), theta)
+    probs = [0.0] * len(ROLLS)
+    for total_or_roll, weight in edges:
+        if isinstance(total_or_roll, int):
+            # Spread a total's weight evenly over the dice pairs that make it
+            matching = [i for i, roll in enumerate(ROLLS) if roll.total() == total_or_roll]
+            for i in matching:
+                probs[i] += float(weight / moments[0]) / len(matching)
+        else:
+            probs[total_or_roll.outcome_index()] += float(weight / moments[0])
+    return tuple(probs)
+
+
+def _exponential_moments(bets: List[Bet], theta: float) -> Tuple[np.ndarray, List[Tuple]]:
+    """
+    Solves G[s] = sum over rolls of p * exp(theta * net) * G[s'] with G = 1
+    once every wager resolves. Returns G for each reachable layout, and for
+    the initial layout the (total or roll, p * exp(theta * net) * G[s'])
+    weight of each branch.
+    """
+    initial = _snapshot(bets)
+    if _total_wager(bets) <= 0:
+        raise ValueError("Cannot analyze a layout with nothing wagered.")
+    try:
+        states, transitions = _explore(bets, initial)
+        wagers = []
+        for state in states:
+            _restore(bets, state)
+            wagers.append(_total_wager(bets))
+    finally:
+        _restore(bets, initial)
+
+    n = len(states)
+    q = np.zeros((n, n))
+    resolved = np.zeros(n)
+    for i, edges in enumerate(transitions):
+        for p, payout, j in edges:
+            after = wagers[j] if j is not None else 0.0
+            weight = p * np.exp(theta * (payout + after - wagers[i]))
+            if j is None:
+                resolved[i] += weight
+            else:
+                q[i, j] += weight
+    try:
+        moments = np.linalg.solve(np.eye(n) - q, resolved)
+    except np.linalg.LinAlgError:
+        moments = np.full(n, -1.0)
+    if not np.all(np.isfinite(moments)) or np.any(moments <= 0):
+        raise ValueError(f"The exponential moment of this layout is infinite at theta={theta}.")
+
+    if all(bet.settles_by_total for bet in bets):
+        labels = list(TOTAL_PROBS)
+    else:
+        labels = list(ROLLS)
+    branches = []
+    for label, (p, payout, j) in zip(labels, transitions[0]):
+        after = wagers[j] if j is not None else 0.0
+        branches.append((label, p * np.exp(theta * (payout + after - wagers[0])) * (moments[j] if j is not None else 1.0)))
+    return moments, branches
+
+
+def _explore(bets: List[Bet], initial: Tuple) -> Tuple[List[Tuple], List[List[Tuple]]]:
+    """
+    Breadth-first enumeration of the reachable layouts.
+
+    Returns the transient states and, for each, a list of
+    (probability, payout, next state index or None if resolved) edges.
+    """
+    if all(bet.settles_by_total for bet in bets):
+        branches = tuple((TOTAL_ROLLS[total], p) for total, p in TOTAL_PROBS.items())
+    else:
+        branches = OUTCOME_PROBS
+    states = [initial]
+    index = {initial: 0}
+    transitions = []
+    i = 0
+    while i < len(states):
+        edges = []
+        for roll, p in branches:
+            _restore(bets, states[i])
+            payout = sum(bet.settle(roll) for bet in bets)
+            if _total_wager(bets) == 0:
+                edges.append((p, payout, None))
+                continue
+            nxt = _snapshot(bets)
+            if nxt not in index:
+                if len(states) >= MAX_STATES:
+                    raise ValueError(f"Layout has more than {MAX_STATES} reachable states.")
+                index[nxt] = len(states)
+                states.append(nxt)
+            edges.append((p, payout, index[nxt]))
+        transitions.append(edges)
+        i += 1
+    return states, transitions
+
+
+def _snapshot(bets: List[Bet]) -> Tuple:
+    return tuple(bet.snapshot() for bet in bets)
+
+
+def _restore(bets: List[Bet], snapshot: Tuple):
+    for bet, bet_snapshot in zip(bets, snapshot):
+        bet.restore(bet_snapshot)
+
+
+def _total_wager(bets: List[Bet]) -> float:
+    return sum(bet.get_total_wager() for bet in bets)
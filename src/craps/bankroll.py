@@ -41,6 +41,14 @@ class Bankroll:
             raise InsufficientFunds(f"Not enough funds.")
         self._size -= amount
     
+    def restore(self, size: float):
+        """
+        Sets the bankroll back to a previously recorded size.
+        """
+        if size < 0.0:
+            raise ValueError(f"Cannot restore bankroll to a negative value.")
+        self._size = size
+
     def get_size(self) -> float:
         """
         Returns the size of the bankroll.
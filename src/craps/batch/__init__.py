@@ -0,0 +1,7 @@
+"""
+Vectorized simulator that runs many tables, each with its own limits, in
+lockstep with numpy.
+"""
+from craps.batch.config import BatchTableConfig
+from craps.batch.kernels import BetKernel, kernel_for
+from craps.batch.state import BatchTableState, BatchBetOp
@@ -0,0 +1,63 @@
+"""
+Per-table limits for the batch simulator.
+"""
+from typing import Sequence, Iterable
+from dataclasses import dataclass
+from itertools import product
+import numpy as np
+from craps.state import TableConfig
+
+
+@dataclass
+class BatchTableConfig:
+    """
+    Table limits for a batch of tables, one entry per table.
+    """
+    table_min: np.ndarray
+    table_max: np.ndarray
+    odds_max: np.ndarray
+    prop_min: np.ndarray
+
+    def __post_init__(self):
+        arrays = [np.asarray(a, dtype=np.float64) for a in
+                  (self.table_min, self.table_max, self.odds_max, self.prop_min)]
+        n = max(a.size for a in arrays)
+        self.table_min, self.table_max, self.odds_max, self.prop_min = (
+            np.broadcast_to(a, (n,)).copy() for a in arrays
+        )
+
+    def __len__(self) -> int:
+        return len(self.table_min)
+
+    def get_config(self, i: int) -> TableConfig:
+        """Returns the scalar TableConfig of table i."""
+        return TableConfig(
+            table_min=float(self.table_min[i]),
+            table_max=float(self.table_max[i]),
+            odds_max=float(self.odds_max[i]),
+            prop_min=float(self.prop_min[i]),
+        )
+
+    @staticmethod
+    def from_configs(configs: Sequence[TableConfig]) -> "BatchTableConfig":
+        return BatchTableConfig(
+            table_min=[c.table_min for c in configs],
+            table_max=[c.table_max for c in configs],
+            odds_max=[c.odds_max for c in configs],
+            prop_min=[c.prop_min for c in configs],
+        )
+
+    @staticmethod
+    def grid(
+        table_min: Iterable[float],
+        table_max: Iterable[float],
+        odds_max: Iterable[float],
+        prop_min: Iterable[float],
+        repeat: int = 1
+    ) -> "BatchTableConfig":
+        """
+        Every combination of the given limits, each repeated `repeat` times
+        (e.g. to run several sessions per configuration).
+        """
+        combos = [c for c in product(table_min, table_max, odds_max, prop_min) for _ in range(repeat)]
+        return BatchTableConfig.from_configs([TableConfig(*c) for c in combos])
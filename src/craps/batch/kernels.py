@@ -0,0 +1,124 @@
+"""
+Vectorized settlement kernels generated from bet specs.
+
+A kernel holds the wagers of one bet type for every table in a batch, one
+column per slot of the bet's BetSpec, and settles them with the same
+compiled (phase, outcome) tables the scalar TableBet uses. Point arrays use
+0 for the come-out.
+"""
+from typing import Optional, Tuple, Callable
+from functools import lru_cache
+import numpy as np
+from craps.bets.spec import BetSpec, PHASES, compile_spec
+from craps.bets.table_bet import TableBet
+from craps.constants import POINTS
+from craps.dice import ROLLS
+
+# Dice total of each outcome index (0-35)
+OUTCOME_TOTALS = np.array([roll.total() for roll in ROLLS], dtype=np.int64)
+
+# Row of each point value (0 for the come-out) in the phase tables
+PHASE_ROW = np.zeros(13, dtype=np.int64)
+PHASE_ROW[list(POINTS)] = np.arange(1, len(POINTS) + 1)
+
+IS_POINT = np.isin(np.arange(13), POINTS)
+
+
+@lru_cache(maxsize=None)
+def _dense_tables(spec: BetSpec) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns (returns, dest) arrays of shape (7 phases, 36 outcomes, slots).
+    dest is the slot a wager ends up in, or -1 if it leaves the table.
+    """
+    compiled = compile_spec(spec)
+    n_slots = len(compiled.slots)
+    returns = np.zeros((len(PHASES), len(ROLLS), n_slots))
+    dest = np.broadcast_to(np.arange(n_slots), returns.shape).copy()
+    for row, point in enumerate(PHASES):
+        for k, actions in enumerate(compiled.actions[point]):
+            for i, r, d in actions:
+                returns[row, k, i] = r
+                dest[row, k, i] = -1 if d is None else d
+    return returns, dest
+
+
+class BetKernel:
+    """Wagers and settlement rules of one bet type across N tables."""
+
+    def __init__(self, spec: BetSpec, n: int):
+        self.n = n
+        self.spec = spec
+        self.is_prop = spec.is_prop
+        compiled = compile_spec(spec)
+        self._compiled = compiled
+        self.stake_targets = compiled.targets['stake']
+        self.odds_targets = compiled.targets['odds']
+        self.set_stake_targets = compiled.set_targets['stake']
+        self.set_odds_targets = compiled.set_targets['odds']
+        self._settable = np.array([[p in s for p in PHASES] for s in compiled.settable], dtype=bool)
+        self._returns, self._dest = _dense_tables(spec)
+        self._rows = np.arange(n)
+        self.wagers = np.zeros((n, len(compiled.slots)))
+
+    def _slot(self, kind: str, target: Optional[int], settable: bool = False) -> int:
+        targets = (self._compiled.set_targets if settable else self._compiled.targets)[kind]
+        if target not in targets:
+            raise ValueError(f"'target' must be one of: {targets}. Got: {target}")
+        return self._compiled.index[(kind, target)]
+
+    def get_stake(self, point: np.ndarray, target: Optional[int] = None) -> np.ndarray:
+        return self.wagers[:, self._slot('stake', target)]
+
+    def get_odds(self, point: np.ndarray, target: Optional[int] = None) -> np.ndarray:
+        if not self.odds_targets:
+            raise RuntimeError("This bet does not have odds.")
+        return self.wagers[:, self._slot('odds', target)]
+
+    def set_stake(self, amount: np.ndarray, mask: np.ndarray, target: Optional[int] = None):
+        """Sets the stake on the tables selected by mask."""
+        self.wagers[mask, self._slot('stake', target, settable=True)] = amount[mask]
+
+    def set_odds(self, amount: np.ndarray, mask: np.ndarray, target: Optional[int] = None):
+        """Sets the odds on the tables selected by mask."""
+        self.wagers[mask, self._slot('odds', target, settable=True)] = amount[mask]
+
+    def can_set_stake(self, point: np.ndarray, target: Optional[int] = None) -> np.ndarray:
+        return self._can_set(point, self._slot('stake', target, settable=True))
+
+    def can_set_odds(self, point: np.ndarray, target: Optional[int] = None) -> np.ndarray:
+        if target not in self.set_odds_targets:
+            return np.zeros(self.n, dtype=bool)
+        return self._can_set(point, self._slot('odds', target, settable=True))
+
+    def _can_set(self, point: np.ndarray, i: int) -> np.ndarray:
+        ok = self._settable[i][PHASE_ROW[point]]
+        required = self._compiled.requires[i]
+        if required is not None:
+            ok = ok & (self.wagers[:, required] > 0)
+        return ok
+
+    def settle(self, point: np.ndarray, outcomes: np.ndarray) -> np.ndarray:
+        """Settles every table against its dice outcome (0-35) and returns the
+        payouts. Called before the point is updated for the roll."""
+        phase = PHASE_ROW[point]
+        returns = self._returns[phase, outcomes]
+        dest = self._dest[phase, outcomes]
+        wagers = self.wagers
+        payout = (wagers * returns).sum(axis=1)
+        moved = np.zeros_like(wagers)
+        for i in range(wagers.shape[1]):
+            d = dest[:, i]
+            keep = d >= 0
+            moved[self._rows[keep], d[keep]] += wagers[keep, i]
+        self.wagers = moved
+        return payout
+
+    def total_wager(self) -> np.ndarray:
+        return self.wagers.sum(axis=1)
+
+
+def kernel_for(bet_cls: type) -> Callable[[int], BetKernel]:
+    """Returns a factory for the batch kernel of a scalar Bet class."""
+    if not (isinstance(bet_cls, type) and issubclass(bet_cls, TableBet)) or getattr(bet_cls, 'spec', None) is None:
+        raise ValueError(f"No batch kernel for {getattr(bet_cls, '__name__', bet_cls)}; it has no BetSpec.")
+    return lambda n: BetKernel(bet_cls.spec, n)
@@ -0,0 +1,178 @@
+from typing import Optional, Dict, Type, Iterable, Tuple, Union
+import numpy as np
+from craps.bets.model import Bet
+from craps.constants import POINTS, SEVEN_OUT
+from craps.state import ActionStatus
+from craps.batch.config import BatchTableConfig
+from craps.batch.kernels import BetKernel, OUTCOME_TOTALS, IS_POINT, kernel_for
+
+# (bet_name, bet_type, amount, target); amount is a scalar or one value per table
+BatchBetOp = Tuple[str, str, Union[float, np.ndarray], Optional[int]]
+
+
+class BatchTableState:
+    """
+    N independent tables advanced in lockstep, each with its own limits.
+
+    Mirrors TableState: every table follows the same rules as a scalar
+    TableState with config.get_config(i), but wagers, bankrolls and phases
+    live in arrays and each roll settles all tables at once. Points are
+    stored as integers with 0 for the come-out.
+    """
+    def __init__(
+            self,
+            config: BatchTableConfig,
+            bets: Dict[str, Type[Bet]],
+            init_bankroll: Union[float, np.ndarray]
+        ):
+        self.config = config
+        self.n = len(config)
+
+        init_bankroll = np.broadcast_to(np.asarray(init_bankroll, dtype=np.float64), (self.n,)).copy()
+        if np.any(init_bankroll < 0.0):
+            raise ValueError(f"Cannot initialize bankroll to a negative value.")
+
+        # State
+        self._point = np.zeros(self.n, dtype=np.int64)
+        self._bankroll = init_bankroll
+        self._roll_count = 0
+        self._last_total = np.zeros(self.n, dtype=np.int64)
+
+        # Bets
+        self.bets: Dict[str, BetKernel] = {key: kernel_for(cls)(self.n) for key, cls in bets.items()}
+
+    def step(self, outcomes: np.ndarray):
+        """
+        Progresses every table by one roll.
+
+        Args:
+            outcomes: One outcome index (0-35, see Roll.outcome_index()) per table.
+        """
+        outcomes = np.asarray(outcomes)
+        total = OUTCOME_TOTALS[outcomes]
+        for bet in self.bets.values():
+            self._bankroll += bet.settle(self._point, outcomes)
+
+        point = self._point
+        comeout = point == 0
+        establish = comeout & IS_POINT[total]
+        clear = ~comeout & ((total == point) | (total == SEVEN_OUT))
+        self._point = np.where(establish, total, np.where(clear, 0, point))
+        self._last_total = total
+        self._roll_count += 1
+
+    def set_bet_stake(self, key: str, amount, target: Optional[int] = None, where: Optional[np.ndarray] = None) -> np.ndarray:
+        """Sets a stake on the tables where the change is legal and affordable.
+        Returns the per-table ActionStatus."""
+        return self.apply_bets([(key, 'stake', amount, target)], where=where)
+
+    def set_bet_odds(self, key: str, amount, target: Optional[int] = None, where: Optional[np.ndarray] = None) -> np.ndarray:
+        """Sets odds on the tables where the change is legal and affordable.
+        Returns the per-table ActionStatus."""
+        return self.apply_bets([(key, 'odds', amount, target)], where=where)
+
+    def get_bet_stake(self, key: str, target: Optional[int] = None) -> np.ndarray:
+        return self.bets[key].get_stake(self._point, target=target).copy()
+
+    def get_bet_odds(self, key: str, target: Optional[int] = None) -> np.ndarray:
+        return self.bets[key].get_odds(self._point, target=target).copy()
+
+    def check_bets(self, ops: Iterable[BatchBetOp], where: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Validates a batch of stake/odds changes on every table without
+        applying them, using the same rules as TableState.check_bets().
+
+        Returns:
+            An int8 array of ActionStatus values, one per table. Tables
+            outside `where` are reported as OK and left untouched.
+        """
+        status, _ = self._check(ops, where)
+        return status
+
+    def apply_bets(self, ops: Iterable[BatchBetOp], where: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Applies a batch of stake/odds changes to every table in `where` whose
+        whole batch is valid. Tables that reject the batch are left unchanged.
+
+        Returns:
+            An int8 array of ActionStatus values, one per table.
+        """
+        ops = list(ops)
+        status, costs = self._check(ops, where)
+        ok = status == ActionStatus.OK
+        if where is not None:
+            ok &= where
+        for key, bet_type, amount, target in ops:
+            amount = self._amount(amount)
+            if bet_type == 'stake':
+                self.bets[key].set_stake(amount, ok, target=target)
+            else:
+                self.bets[key].set_odds(amount, ok, target=target)
+        self._bankroll[ok] -= costs[ok]
+        return status
+
+    def _check(self, ops: Iterable[BatchBetOp], where: Optional[np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        config = self.config
+        point = self._point
+        status = np.full(self.n, ActionStatus.OK, dtype=np.int8)
+        active = np.ones(self.n, dtype=bool) if where is None else np.asarray(where, dtype=bool).copy()
+        bankroll = self._bankroll.copy()
+        spent = np.zeros(self.n)
+        pending: Dict[Tuple, np.ndarray] = {}
+
+        def fail(mask: np.ndarray, reason: ActionStatus):
+            mask = mask & active
+            status[mask] = reason
+            active[mask] = False
+
+        for key, bet_type, amount, target in ops:
+            bet = self.bets[key]
+            amount = self._amount(amount)
+            min_bet = config.prop_min if bet.is_prop else config.table_min
+            fail((amount > config.table_max) | ((amount != 0) & (amount < min_bet)), ActionStatus.ILLEGAL)
+
+            if bet_type == 'stake':
+                fail((amount > 0) & ~bet.can_set_stake(point, target=target), ActionStatus.ILLEGAL)
+                curr = pending.get((key, 'stake', target))
+                if curr is None:
+                    curr = bet.get_stake(point, target=target)
+            else:
+                stake_target = target if target in bet.stake_targets else None
+                stake = pending.get((key, 'stake', stake_target))
+                if stake is None:
+                    stake = bet.get_stake(point, target=stake_target)
+                fail(amount > stake * config.odds_max, ActionStatus.ILLEGAL)
+                fail((amount > 0) & ~bet.can_set_odds(point, target=target), ActionStatus.ILLEGAL)
+                curr = pending.get((key, 'odds', target))
+                if curr is None:
+                    curr = bet.get_odds(point, target=target)
+
+            cost = amount - curr
+            fail(cost > bankroll, ActionStatus.INSUFFICIENT_FUNDS)
+            bankroll = bankroll - cost
+            spent = spent + cost
+            pending[(key, bet_type, target)] = amount
+        return status, spent
+
+    def _amount(self, amount) -> np.ndarray:
+        return np.broadcast_to(np.asarray(amount, dtype=np.float64), (self.n,))
+
+    def get_bankroll(self) -> np.ndarray:
+        return self._bankroll.copy()
+
+    def get_total_wager(self) -> np.ndarray:
+        total = np.zeros(self.n)
+        for bet in self.bets.values():
+            total += bet.total_wager()
+        return total
+
+    def get_point(self) -> np.ndarray:
+        """Returns the point of every table, 0 on the come-out."""
+        return self._point.copy()
+
+    def get_roll_count(self) -> int:
+        return self._roll_count
+
+    def get_last_total(self) -> np.ndarray:
+        """Returns the total of every table's last roll, 0 before the first roll."""
+        return self._last_total.copy()
@@ -1,4 +1,9 @@
 from craps.bets.pass_line import PassLine
 from craps.bets.come_bets import ComeBets
 from craps.bets.place_bets import PlaceBets
-from craps.bets.field import Field
\ No newline at end of file
+from craps.bets.field import Field
+from craps.bets.dont_pass import DontPass
+from craps.bets.dont_come import DontComeBets
+from craps.bets.lay_bets import LayBets
+from craps.bets.hardways import HardwayBets
+from craps.bets.props import AnySeven, AnyCraps, Yo, Aces, Boxcars, Horn, HiLo, HopBets
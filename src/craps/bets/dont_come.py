@@ -0,0 +1,61 @@
+from typing import Optional
+from craps.dice import Roll
+from craps.constants import POINTS, NATURAL_WINNERS, SEVEN_OUT
+from craps.bets.spec import BetSpec, Slot, Outcome, PHASES, STAY, LOSE, win, move
+from craps.bets.table_bet import TableBet
+from craps.bets.dont_pass import BAR
+from craps.bets.utils import LAY_ODDS, LAY_ODDS_INCREMENT
+
+
+def settle_dont_come_bet(slot: Slot, point: Optional[int], roll: Roll) -> Outcome:
+    """Settle don't come bets for the given roll.
+
+    Pending don't come bet (point phase only):
+        - Natural (7, 11): loses.
+        - 2 or 3: wins even money.
+        - 12: push (barred).
+        - Point number: moves the stake behind that number.
+
+    Established don't come bets and lay odds:
+        - Seven: win, the odds at true odds.
+        - Their number: lose.
+        - Any other total: no action.
+    """
+    total = roll.total()
+    if slot.target is None:
+        if point is None:
+            return STAY
+        if total in NATURAL_WINNERS:
+            return LOSE
+        if total == BAR:
+            return STAY
+        if total in POINTS:
+            return move('stake', total)
+        return win(2.0)
+
+    if total == SEVEN_OUT:
+        return win(2.0 if slot.kind == 'stake' else 1.0 + LAY_ODDS[slot.target])
+    if total == slot.target:
+        return LOSE
+    return STAY
+
+
+DONT_COME_BETS = BetSpec(
+    slots=(Slot('stake', None, phases=POINTS),)
+    + tuple(Slot('stake', n, phases=()) for n in POINTS)
+    + tuple(Slot('odds', n, LAY_ODDS_INCREMENT[n], phases=PHASES, requires=('stake', n)) for n in POINTS),
+    rule=settle_dont_come_bet,
+)
+
+
+class DontComeBets(TableBet):
+    """Manages all don't come bets on the table.
+
+    A don't come bet behaves like a don't pass bet but can only be placed
+    after a point is established. A pending bet wins on 2 or 3, loses on a
+    natural, pushes on 12, and otherwise moves behind the number rolled.
+    Established bets and their lay odds win on any seven, including on the
+    come-out, and lose when their number is rolled.
+    """
+
+    spec = DONT_COME_BETS
@@ -0,0 +1,62 @@
+from typing import Optional
+from craps.dice import Roll
+from craps.constants import NATURAL_WINNERS, SEVEN_OUT, POINTS
+from craps.bets.spec import BetSpec, Slot, Outcome, STAY, LOSE, win
+from craps.bets.table_bet import TableBet
+from craps.bets.utils import LAY_ODDS, LAY_ODDS_INCREMENT
+
+# Barred total: a push for the don'ts on the come-out
+BAR = 12
+
+
+def settle_dont_pass(slot: Slot, point: Optional[int], roll: Roll) -> Outcome:
+    """Settle the don't pass bet for the given roll.
+
+    Come-out phase:
+        - Natural (7, 11): loses stake.
+        - 2 or 3: pays 2x stake.
+        - 12: push (barred).
+        - Any other total: no action (point is established elsewhere).
+
+    Point phase:
+        - Seven-out: pays 2x stake plus lay odds at true odds.
+        - Rolling the point: loses both stake and lay odds.
+        - Any other total: no action.
+    """
+    total = roll.total()
+    if slot.kind == 'stake':
+        if point is None:
+            if total in NATURAL_WINNERS:
+                return LOSE
+            if total == BAR or total in POINTS:
+                return STAY
+            return win(2.0)
+    elif point != slot.target:
+        # Lay odds only work behind their own point
+        return STAY
+
+    if total == SEVEN_OUT:
+        return win(2.0 if slot.kind == 'stake' else 1.0 + LAY_ODDS[point])
+    if total == point:
+        return LOSE
+    return STAY
+
+
+DONT_PASS = BetSpec(
+    slots=(Slot('stake', None, phases=(None,)),) + tuple(
+        Slot('odds', n, LAY_ODDS_INCREMENT[n], phases=(n,), requires=('stake', None)) for n in POINTS
+    ),
+    rule=settle_dont_pass,
+)
+
+
+class DontPass(TableBet):
+    """A don't pass bet in craps.
+
+    The opposite of the pass line: on the come-out a 2 or 3 wins even money,
+    a natural loses and a 12 is a push. Once a point is established, a
+    seven-out wins and hitting the point loses. Lay odds can be placed behind
+    the don't pass after a point is established, paying at true odds.
+    """
+
+    spec = DONT_PASS
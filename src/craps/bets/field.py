@@ -1,77 +1,22 @@
-from typing import Optional, Tuple
-from craps.phase import TablePhase
+from typing import Optional
 from craps.dice import Roll
-from craps.bets.model import Bet, forbids_target, forbids_odds__do_not_call
+from craps.bets.spec import BetSpec, Slot, Outcome, win
+from craps.bets.table_bet import TableBet
 
-class Field(Bet):
-    def __init__(self, init_phase: TablePhase):
-        super().__init__(init_phase)
-        self._stake = 0
+# Amount returned per dollar of stake; every other total loses
+FIELD_RETURNS = {2: 3.0, 3: 2.0, 4: 2.0, 9: 2.0, 10: 2.0, 11: 2.0, 12: 4.0}
 
-    @property
-    def is_prop(self) -> bool:
-        return False
 
-    def set_stake_targets(self) -> Tuple[Optional[int]]:
-        return (None,)
-    
-    def get_stake_targets(self) -> Tuple[Optional[int]]:
-        return (None,)
-    
-    def set_odds_targets(self) -> Tuple[Optional[int]]:
-        return ()
-    
-    def get_odds_targets(self) -> Tuple[Optional[int]]:
-        return ()
+def settle_field(slot: Slot, point: Optional[int], roll: Roll) -> Outcome:
+    """Settle the field bet based on the roll total. Resolves every roll."""
+    return win(FIELD_RETURNS.get(roll.total(), 0.0))
 
-    @forbids_target
-    def get_stake_increment(self, target: Optional[int] = None) -> int:
-        return 1
 
-    @forbids_target
-    def get_odds_increment(self, target: Optional[int] = None) -> Optional[int]:
-        return None
+FIELD = BetSpec(slots=(Slot('stake', None),), rule=settle_field)
 
-    @forbids_target
-    def can_set_stake(self, target=None) -> bool:
-        return True
 
-    @forbids_target
-    def can_set_odds(self, target=None) -> bool:
-        return False
+class Field(TableBet):
+    """A one-roll bet on 2, 3, 4, 9, 10, 11 or 12. The 2 pays double and the
+    12 pays triple."""
 
-    def _settle(self, roll: Roll) -> float:
-        """Settle the field bet based on the roll total."""
-        total = roll.total()
-        winnings = 0
-        if total in [3, 4, 9, 10, 11]:
-            winnings = self._stake * 2.0
-        elif total == 2:
-            winnings = self._stake * 3.0
-        elif total == 12:
-            winnings = self._stake * 4.0
-        self._clear()
-        return winnings
-        
-    @forbids_target
-    def _set_stake(self, amount: float, target: Optional[None]=None):
-        """Set the stake amount for the field bet."""
-        self._stake = amount
-
-    @forbids_target
-    def _get_stake(self, target: Optional[None]=None) -> float:
-        """Get the current stake amount for the field bet."""
-        return self._stake
-
-    @forbids_odds__do_not_call
-    def _set_odds(self, amount: float, target: Optional[None]=None):
-        """Field bets do not support odds."""
-        pass
-
-    @forbids_odds__do_not_call
-    def _get_odds(self, target: Optional[None]=None) -> float:
-        """Field bets do not support odds."""
-        pass
-
-    def _clear(self):
-        self._stake = 0
+    spec = FIELD
@@ -0,0 +1,44 @@
+from typing import Optional
+from craps.dice import Roll
+from craps.constants import HARDWAYS, SEVEN_OUT
+from craps.bets.spec import BetSpec, Slot, Outcome, STAY, LOSE, pay
+from craps.bets.table_bet import TableBet
+
+# Amount won per dollar on the hard way
+HARDWAY_ODDS = {
+    4: 7.0,
+    6: 9.0,
+    8: 9.0,
+    10: 7.0
+}
+
+
+def settle_hardway(slot: Slot, point: Optional[int], roll: Roll) -> Outcome:
+    """Settle hardways based on the individual dice. Off on come-out."""
+    if point is None:
+        # Note: Hardways are off on come-out
+        return STAY
+    total = roll.total()
+    if total == SEVEN_OUT:
+        return LOSE
+    if total == slot.target:
+        if roll[0] == roll[1]:
+            # Note: After a win the original stake remains
+            return pay(HARDWAY_ODDS[total])
+        return LOSE
+    return STAY
+
+
+HARDWAY_BETS = BetSpec(
+    slots=tuple(Slot('stake', n) for n in HARDWAYS),
+    rule=settle_hardway,
+    is_prop=True,
+)
+
+
+class HardwayBets(TableBet):
+    """Hardway bets on 4, 6, 8 and 10. Each wins when its number is rolled
+    as a pair and loses on a seven or when the number is rolled the easy
+    way. Working only while a point is on."""
+
+    spec = HARDWAY_BETS
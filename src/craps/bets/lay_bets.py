@@ -0,0 +1,42 @@
+from typing import Optional
+from craps.dice import Roll
+from craps.constants import POINTS, SEVEN_OUT
+from craps.bets.spec import BetSpec, Slot, Outcome, STAY, LOSE, pay
+from craps.bets.table_bet import TableBet
+from craps.bets.utils import LAY_ODDS
+
+# Commission taken from the winnings of a lay bet
+LAY_VIG = 0.05
+
+LAY_INCREMENT = {
+    4: 40,  # wins 20, $1 vig
+    5: 30,  # wins 20, $1 vig
+    6: 24,  # wins 20, $1 vig
+    8: 24,  # wins 20, $1 vig
+    9: 30,  # wins 20, $1 vig
+    10: 40,  # wins 20, $1 vig
+}
+
+
+def settle_lay_bet(slot: Slot, point: Optional[int], roll: Roll) -> Outcome:
+    """Settle lay bets based on the roll. Working on every roll, including the come-out."""
+    total = roll.total()
+    if total == SEVEN_OUT:
+        # Note: After a win the original stake remains
+        return pay(LAY_ODDS[slot.target] * (1.0 - LAY_VIG))
+    if total == slot.target:
+        return LOSE
+    return STAY
+
+
+LAY_BETS = BetSpec(
+    slots=tuple(Slot('stake', n, LAY_INCREMENT[n]) for n in POINTS),
+    rule=settle_lay_bet,
+)
+
+
+class LayBets(TableBet):
+    """Lay bets against specific point numbers (4, 5, 6, 8, 9, 10). A seven
+    pays true odds less a 5% commission on the win."""
+
+    spec = LAY_BETS
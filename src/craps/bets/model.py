@@ -2,9 +2,13 @@ from abc import ABC, abstractmethod
 from typing import Callable, Tuple
 from typing import Optional
 from craps.phase import TablePhase, transition_phase
-from craps.dice import Roll
+from craps.dice import Roll, ROLLS, TOTALS, OUTCOME_TOTALS, TOTAL_WAYS
 
 class Bet(ABC):
+    # True if settle() only depends on the dice total, so the per-total
+    # vectors are exact. Set by bets that implement _roll_table().
+    settles_by_total = False
+
     def __init__(self, init_phase: TablePhase):
         self._phase = init_phase
 
@@ -36,6 +40,15 @@ class Bet(ABC):
         # No additional logic here. Just abstracting to _get_odds() for API consitency in the child class.
         return self._get_odds(target=target)
     
+    def get_total_wager(self) -> float:
+        """Get the total amount wagered on this bet across all targets (stakes + odds)."""
+        total = 0.0
+        for tgt in self.get_stake_targets():
+            total += self.get_stake(target=tgt)
+        for tgt in self.get_odds_targets():
+            total += self.get_odds(target=tgt)
+        return total
+
     def settle(self, roll: Roll) -> float:
         """Settle the bet for the given roll and advance the internal phase.
 
@@ -48,7 +61,69 @@ class Bet(ABC):
         result = self._settle(roll)
         self._phase = transition_phase(self._phase, roll)
         return result
+
+    def advance_phase(self, roll: Roll):
+        """Advance the internal phase without settling.
+
+        Equivalent to settle() for a bet with nothing wagered.
+        """
+        self._phase = transition_phase(self._phase, roll)
+
+    def has_wagers(self) -> bool:
+        """Return True if any stake or odds amount is non-zero."""
+        return self.get_total_wager() > 0
     
+    def get_payouts_by_total(self) -> Tuple[float, ...]:
+        """Return what settle() would pay for each total 2-12, without
+        changing the bet.
+
+        Bets that depend on the dice themselves (e.g. hardways) report the
+        average over the dice pairs making each total.
+        """
+        table = self._roll_table()
+        if table is not None:
+            return table[0]
+        return _average_by_total(self.get_payouts_by_outcome())
+
+    def get_payouts_by_outcome(self) -> Tuple[float, ...]:
+        """Return what settle() would pay for each of the 36 outcomes in ROLLS."""
+        return self._outcome_vectors()[0]
+
+    def get_net_by_total(self) -> Tuple[float, ...]:
+        """Return the change in this bet's value (payout plus wagers left on
+        the table, minus wagers now) for each total 2-12."""
+        table = self._roll_table()
+        if table is not None:
+            wager = self.get_total_wager()
+            return tuple(p + r - wager for p, r in zip(*table))
+        return _average_by_total(self.get_net_by_outcome())
+
+    def get_net_by_outcome(self) -> Tuple[float, ...]:
+        """Like get_net_by_total(), for each of the 36 outcomes in ROLLS."""
+        payouts, remaining = self._outcome_vectors()
+        wager = self.get_total_wager()
+        return tuple(p + r - wager for p, r in zip(payouts, remaining))
+
+    def _roll_table(self) -> Optional[Tuple[Tuple[float, ...], Tuple[float, ...]]]:
+        """Return (payouts, remaining wagers) for each total 2-12 from lookup
+        tables, or None to fall back to settling a copy of the bet against
+        every outcome. Override for bets that only depend on the total."""
+        return None
+
+    def _outcome_vectors(self) -> Tuple[Tuple[float, ...], Tuple[float, ...]]:
+        table = self._roll_table()
+        if table is not None:
+            payouts, remaining = table
+            return (tuple(payouts[t - 2] for t in OUTCOME_TOTALS),
+                    tuple(remaining[t - 2] for t in OUTCOME_TOTALS))
+        snapshot = self.snapshot()
+        payouts, remaining = [], []
+        for roll in ROLLS:
+            payouts.append(self.settle(roll))
+            remaining.append(self.get_total_wager())
+            self.restore(snapshot)
+        return tuple(payouts), tuple(remaining)
+
     @abstractmethod
     def set_stake_targets(self) -> Tuple[Optional[int]]:
         raise NotImplementedError
@@ -120,6 +195,37 @@ class Bet(ABC):
         self._clear()
         self._phase = TablePhase()
 
+    def snapshot(self) -> Tuple:
+        """Return a compact, hashable record of the bet's phase and wagers."""
+        return (self._phase.point,) + self._get_wagers()
+
+    def restore(self, snapshot: Tuple):
+        """Restore the phase and wagers from a record made by snapshot()."""
+        self._phase = TablePhase(point=snapshot[0])
+        self._set_wagers(snapshot[1:])
+
+    def _get_wagers(self) -> Tuple:
+        """Return all wager amounts as a flat tuple.
+
+        Subclasses should override this with a flat tuple of floats. The
+        fallback copies every attribute other than the phase.
+        """
+        return tuple(
+            (name, isinstance(value, dict), tuple(value.items()) if isinstance(value, dict) else value)
+            for name, value in vars(self).items() if name != '_phase'
+        )
+
+    def _set_wagers(self, wagers: Tuple):
+        """Inverse of _get_wagers()."""
+        for name, is_dict, value in wagers:
+            setattr(self, name, dict(value) if is_dict else value)
+
+def _average_by_total(by_outcome: Tuple[float, ...]) -> Tuple[float, ...]:
+    sums = [0.0] * len(TOTALS)
+    for total, value in zip(OUTCOME_TOTALS, by_outcome):
+        sums[total - 2] += value
+    return tuple(s / ways for s, ways in zip(sums, TOTAL_WAYS))
+
 def requires_target(allowed: Tuple[int]):
     def decorator(fn: Callable):
         def wrapper(self, *args, **kwargs):
@@ -1,13 +1,52 @@
-from typing import Optional, Tuple
-from craps.phase import TablePhase
+from typing import Optional
 from craps.dice import Roll
 from craps.constants import NATURAL_WINNERS, CRAPS, SEVEN_OUT, POINTS
-from craps.bets.model import Bet, forbids_target, requires_target
+from craps.bets.spec import BetSpec, Slot, Outcome, STAY, LOSE, win
+from craps.bets.table_bet import TableBet
 from craps.bets.utils import TRUE_ODDS, TRUE_ODDS_INCREMENT
-from craps.exceptions import IllegalAction
 
 
-class PassLine(Bet):
+def settle_pass_line(slot: Slot, point: Optional[int], roll: Roll) -> Outcome:
+    """Settle the pass line bet for the given roll.
+
+    Come-out phase:
+        - Natural (7, 11): pays 2x stake.
+        - Craps (2, 3, 12): loses stake.
+        - Any other total: no action (point is established elsewhere).
+
+    Point phase:
+        - Rolling the point: pays 2x stake plus odds at true odds.
+        - Seven-out: loses both stake and odds.
+        - Any other total: no action.
+    """
+    total = roll.total()
+    if slot.kind == 'stake':
+        if point is None:
+            if total in NATURAL_WINNERS:
+                return win(2.0)
+            if total in CRAPS:
+                return LOSE
+            return STAY
+    elif point != slot.target:
+        # Odds only work behind their own point
+        return STAY
+
+    if total == point:
+        return win(2.0 if slot.kind == 'stake' else 1.0 + TRUE_ODDS[total])
+    if total == SEVEN_OUT:
+        return LOSE
+    return STAY
+
+
+PASS_LINE = BetSpec(
+    slots=(Slot('stake', None, phases=(None,)),) + tuple(
+        Slot('odds', n, TRUE_ODDS_INCREMENT[n], phases=(n,), requires=('stake', None)) for n in POINTS
+    ),
+    rule=settle_pass_line,
+)
+
+
+class PassLine(TableBet):
     """A pass line bet in craps.
 
     During the come-out phase, a natural (7 or 11) wins even money and craps
@@ -16,128 +55,4 @@ class PassLine(Bet):
     placed behind the pass line after a point is established, paying at true odds.
     """
 
-    def __init__(self, init_phase: TablePhase):
-        super().__init__(init_phase)
-        self._stake = 0
-        self._odds = 0
-
-    @property
-    def is_prop(self) -> bool:
-        return False
-
-    def set_stake_targets(self) -> Tuple[Optional[int]]:
-        return (None,)
-    
-    def get_stake_targets(self) -> Tuple[Optional[int]]:
-        return (None,)
-    
-    def set_odds_targets(self) -> Tuple[Optional[int]]:
-        return tuple(POINTS)
-
-    def get_odds_targets(self) -> Tuple[Optional[int]]:
-        return tuple(POINTS)
-
-    @forbids_target
-    def get_stake_increment(self, target: Optional[int] = None) -> int:
-        return 1
-
-    @requires_target(POINTS)
-    def get_odds_increment(self, target: Optional[int] = None) -> Optional[int]:
-        return TRUE_ODDS_INCREMENT[target]
-
-    @forbids_target
-    def can_set_stake(self, target=None) -> bool:
-        return self._phase.point is None
-
-    @requires_target(POINTS)
-    def can_set_odds(self, target=None) -> bool:
-        return (self._phase.point is not None
-                and target == self._phase.point
-                and self._stake > 0)
-
-    def _settle(self, roll: Roll) -> float:
-        """Settle the pass line bet for the given roll.
-
-        Come-out phase:
-            - Natural (7, 11): pays 2x stake.
-            - Craps (2, 3, 12): loses stake.
-            - Any other total: no action (point is established elsewhere).
-
-        Point phase:
-            - Rolling the point: pays 2x stake plus odds at true odds.
-            - Seven-out: loses both stake and odds.
-            - Any other total: no action.
-
-        Returns:
-            The total payout (stake return + winnings), or 0.0 on a loss/no-action.
-        """
-        total = roll.total()
-        if self._phase.point is None:
-            if total in NATURAL_WINNERS:
-                winnings = self._stake * 2
-                self._clear()
-                return winnings
-            elif total in CRAPS:
-                self._clear()
-                return 0.0
-            return 0.0
-
-        if total == SEVEN_OUT:
-            self._clear()
-            return 0.0
-
-        if total == self._phase.point:
-            winnings = (self._stake * 2) + (1.0 + TRUE_ODDS[total]) * self._odds
-            self._clear()
-            return winnings
-
-        return 0.0
-
-    @forbids_target
-    def _set_stake(self, amount: float, target: Optional[None] = None):
-        """Set the flat pass line wager.
-
-        Can only be set during the come-out phase. Once a point is established
-        the stake is locked until the bet resolves.
-
-        Raises:
-            IllegalAction: If a point is already established.
-        """
-        if amount > 0 and not self.can_set_stake():
-            raise IllegalAction("Cannot set stake during point phase.")
-        self._stake = amount
-
-    @forbids_target
-    def _get_stake(self, target: Optional[None] = None) -> float:
-        """Return the current flat pass line wager."""
-        return self._stake
-
-    @requires_target(POINTS)
-    def _set_odds(self, amount: float, target: Optional[int] = None):
-        """Set the odds bet behind the pass line.
-
-        Odds can only be placed after a point is established, must match
-        the current point, and require an existing flat stake.
-
-        Raises:
-            IllegalAction: If no point is established, target doesn't match
-                the current point, or no flat stake exists.
-        """
-        if amount > 0 and not self.can_set_odds(target=target):
-            raise IllegalAction("Cannot set odds in the current state.")
-        self._odds = amount
-
-    @requires_target(POINTS)
-    def _get_odds(self, target: Optional[int] = None) -> float:
-        """Return the odds bet amount for the given target.
-
-        Returns the odds if target matches the current point, otherwise 0.
-        """
-        if self._phase.point == target:
-            return self._odds
-        return 0.0
-
-    def _clear(self):
-        """Reset stake and odds to zero after the bet resolves."""
-        self._stake = 0
-        self._odds = 0
+    spec = PASS_LINE
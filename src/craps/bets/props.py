@@ -0,0 +1,102 @@
+"""
+One-roll proposition bets. Every prop is settled on the next roll: the
+amount returned per dollar comes from a table indexed by dice total, or
+by the dice themselves for hop bets.
+"""
+from typing import Dict, Optional
+from craps.dice import Roll
+from craps.constants import CRAPS, HORN, SEVEN_OUT
+from craps.bets.spec import BetSpec, Slot, Outcome, win
+from craps.bets.table_bet import TableBet
+
+
+def _one_roll_spec(returns: Dict[int, float], increment: int = 1) -> BetSpec:
+    """A prop on the next roll's total. `returns` maps winning totals to the
+    amount returned per dollar, stake included; every other total loses."""
+    def rule(slot: Slot, point: Optional[int], roll: Roll) -> Outcome:
+        return win(returns.get(roll.total(), 0.0))
+    return BetSpec(slots=(Slot('stake', None, increment),), rule=rule, is_prop=True)
+
+
+ANY_SEVEN = _one_roll_spec({SEVEN_OUT: 5.0})                    # 4:1
+ANY_CRAPS = _one_roll_spec({t: 8.0 for t in CRAPS})             # 7:1
+YO = _one_roll_spec({11: 16.0})                                 # 15:1
+ACES = _one_roll_spec({2: 31.0})                                # 30:1
+BOXCARS = _one_roll_spec({12: 31.0})                            # 30:1
+# Split evenly across 2, 3, 11 and 12; the winning quarter pays 30:1 or 15:1
+HORN_BET = _one_roll_spec({t: (31.0 if t in (2, 12) else 16.0) / len(HORN) for t in HORN}, increment=4)
+# Split evenly across 2 and 12; the winning half pays 30:1
+HI_LO = _one_roll_spec({2: 31.0 / 2, 12: 31.0 / 2}, increment=2)
+
+
+class AnySeven(TableBet):
+    """One-roll bet on any 7. Pays 4:1."""
+
+    spec = ANY_SEVEN
+
+
+class AnyCraps(TableBet):
+    """One-roll bet on 2, 3 or 12. Pays 7:1."""
+
+    spec = ANY_CRAPS
+
+
+class Yo(TableBet):
+    """One-roll bet on 11. Pays 15:1."""
+
+    spec = YO
+
+
+class Aces(TableBet):
+    """One-roll bet on 2. Pays 30:1."""
+
+    spec = ACES
+
+
+class Boxcars(TableBet):
+    """One-roll bet on 12. Pays 30:1."""
+
+    spec = BOXCARS
+
+
+class Horn(TableBet):
+    """One-roll bet split into four equal parts on 2, 3, 11 and 12. Stakes
+    come in multiples of 4."""
+
+    spec = HORN_BET
+
+
+class HiLo(TableBet):
+    """One-roll bet split into two equal parts on 2 and 12. Stakes come in
+    multiples of 2."""
+
+    spec = HI_LO
+
+
+# Hop targets: the two dice as d1 * 10 + d2 with d1 <= d2 (e.g. 25 for 2-5)
+HOP_TARGETS = tuple(d1 * 10 + d2 for d1 in range(1, 7) for d2 in range(d1, 7))
+
+HOP_HARD_ODDS = 30.0
+HOP_EASY_ODDS = 15.0
+
+
+def settle_hop(slot: Slot, point: Optional[int], roll: Roll) -> Outcome:
+    """Settle hop bets on the exact dice, in either order."""
+    d1, d2 = min(roll), max(roll)
+    if slot.target != d1 * 10 + d2:
+        return win(0.0)
+    return win(1.0 + (HOP_HARD_ODDS if d1 == d2 else HOP_EASY_ODDS))
+
+
+HOP_BETS = BetSpec(
+    slots=tuple(Slot('stake', t) for t in HOP_TARGETS),
+    rule=settle_hop,
+    is_prop=True,
+)
+
+
+class HopBets(TableBet):
+    """One-roll bets on an exact dice combination. A pair (1 way in 36) pays
+    30:1 and any other combination (2 ways) pays 15:1."""
+
+    spec = HOP_BETS
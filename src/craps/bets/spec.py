@@ -0,0 +1,175 @@
+"""
+Declarative bet definitions.
+
+A BetSpec lists a bet's wager slots (stake or odds on a target), whether it
+is a prop bet, and a settlement rule. The rule says what happens
+to one slot for one (phase, dice outcome) pair. compile_spec() evaluates
+it for every phase and all 36 outcomes once, producing the lookup tables
+that drive both the scalar TableBet and the batch kernels.
+"""
+from typing import Callable, Dict, Optional, Tuple
+from dataclasses import dataclass
+from functools import lru_cache
+from craps.constants import POINTS
+from craps.dice import Roll, ROLLS, TOTALS
+
+# Table phases: come-out, then each point
+PHASES: Tuple[Optional[int], ...] = (None,) + POINTS
+
+# ('stake' | 'odds', target)
+SlotKey = Tuple[str, Optional[int]]
+
+_SELF = ('self', None)
+
+
+@dataclass(frozen=True)
+class Slot:
+    """
+    One place a wager can sit.
+
+    Attributes:
+        kind: 'stake' or 'odds'.
+        target: The number the wager is on, or None.
+        increment: Casino-friendly increment for the amount.
+        phases: Phases in which the player may put money on the slot. Slots
+            with no phases only receive money moved by settlement (e.g. an
+            established come bet).
+        requires: A slot that must already hold a wager (e.g. the flat bet
+            under an odds bet).
+    """
+    kind: str
+    target: Optional[int] = None
+    increment: int = 1
+    phases: Tuple[Optional[int], ...] = PHASES
+    requires: Optional[SlotKey] = None
+
+    @property
+    def key(self) -> SlotKey:
+        return (self.kind, self.target)
+
+
+@dataclass(frozen=True)
+class Outcome:
+    """
+    What one roll does to the money in one slot.
+
+    Attributes:
+        returns: Amount paid to the player per dollar in the slot.
+        moves_to: Where the wager goes afterwards: the slot itself (it
+            stays up), another slot, or None (off the table).
+    """
+    returns: float = 0.0
+    moves_to: Optional[SlotKey] = _SELF
+
+
+STAY = Outcome()
+LOSE = Outcome(0.0, None)
+
+
+def win(returns: float) -> Outcome:
+    """The wager wins and comes down: `returns` per dollar, stake included."""
+    return Outcome(returns, None)
+
+
+def pay(returns: float) -> Outcome:
+    """The wager wins `returns` per dollar and stays up."""
+    return Outcome(returns, _SELF)
+
+
+def move(kind: str, target: Optional[int]) -> Outcome:
+    """The wager moves to another slot of the same bet."""
+    return Outcome(0.0, (kind, target))
+
+
+# rule(slot, point, roll) -> Outcome
+SettleRule = Callable[[Slot, Optional[int], Roll], Outcome]
+
+
+@dataclass(frozen=True)
+class BetSpec:
+    """
+    Attributes:
+        slots: Every place a wager can sit, with its increment and when the
+            player may bet on it.
+        rule: Settles one slot for one (point, roll). Only called by
+            compile_spec().
+        is_prop: Whether prop_min applies instead of table_min.
+    """
+    slots: Tuple[Slot, ...]
+    rule: SettleRule
+    is_prop: bool = False
+
+
+# (slot index, returns per dollar, destination slot index or None)
+SlotAction = Tuple[int, float, Optional[int]]
+
+
+@dataclass(frozen=True)
+class CompiledSpec:
+    """
+    Lookup tables built from a BetSpec.
+
+    Attributes:
+        index: Slot index by (kind, target).
+        get_index: Slot index by target, per kind.
+        set_index: Like get_index, for slots the player can bet on.
+        actions: Per phase, per outcome index: the slots the roll changes.
+            Slots that simply stay up are left out.
+        settles_by_total: True if every outcome with the same total has the
+            same actions.
+    """
+    slots: Tuple[Slot, ...]
+    index: Dict[SlotKey, int]
+    get_index: Dict[str, Dict[Optional[int], int]]
+    set_index: Dict[str, Dict[Optional[int], int]]
+    targets: Dict[str, Tuple[Optional[int], ...]]
+    set_targets: Dict[str, Tuple[Optional[int], ...]]
+    settable: Tuple[frozenset, ...]
+    requires: Tuple[Optional[int], ...]
+    actions: Dict[Optional[int], Tuple[Tuple[SlotAction, ...], ...]]
+    settles_by_total: bool
+
+
+@lru_cache(maxsize=None)
+def compile_spec(spec: BetSpec) -> CompiledSpec:
+    slots = spec.slots
+    index = {slot.key: i for i, slot in enumerate(slots)}
+    if len(index) != len(slots):
+        raise ValueError("Bet slots must be unique.")
+
+    targets = {kind: tuple(s.target for s in slots if s.kind == kind) for kind in ('stake', 'odds')}
+    set_targets = {kind: tuple(s.target for s in slots if s.kind == kind and s.phases) for kind in ('stake', 'odds')}
+    get_index = {kind: {t: index[(kind, t)] for t in targets[kind]} for kind in targets}
+    set_index = {kind: {t: index[(kind, t)] for t in set_targets[kind]} for kind in set_targets}
+    requires = tuple(None if s.requires is None else index[s.requires] for s in slots)
+
+    actions = {}
+    for point in PHASES:
+        by_outcome = []
+        for roll in ROLLS:
+            row = []
+            for i, slot in enumerate(slots):
+                outcome = spec.rule(slot, point, roll)
+                dest = i if outcome.moves_to == _SELF else (
+                    None if outcome.moves_to is None else index[outcome.moves_to])
+                if outcome.returns or dest != i:
+                    row.append((i, float(outcome.returns), dest))
+            by_outcome.append(tuple(row))
+        actions[point] = tuple(by_outcome)
+
+    settles_by_total = all(
+        len({actions[point][k] for k, roll in enumerate(ROLLS) if roll.total() == total}) == 1
+        for point in PHASES for total in TOTALS
+    )
+    return CompiledSpec(
+        slots=slots,
+        index=index,
+        get_index=get_index,
+        set_index=set_index,
+        targets=targets,
+        set_targets=set_targets,
+        settable=tuple(frozenset(s.phases) for s in slots),
+        requires=requires,
+        actions=actions,
+        settles_by_total=settles_by_total,
+    )
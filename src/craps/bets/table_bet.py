@@ -0,0 +1,180 @@
+from typing import Optional, Tuple
+from craps.phase import TablePhase
+from craps.dice import Roll, ROLLS, TOTALS
+from craps.exceptions import IllegalAction
+from craps.bets.model import Bet
+from craps.bets.spec import BetSpec, compile_spec
+
+# One outcome index per total 2-12
+_TOTAL_OUTCOMES = tuple(next(k for k, roll in enumerate(ROLLS) if roll.total() == t) for t in TOTALS)
+
+
+def _check_target(targets: Tuple[Optional[int], ...], target: Optional[int]):
+    if target in targets:
+        return
+    if target is not None and (not targets or targets == (None,)):
+        raise ValueError(f"A value for 'target' was provided but the method does not use the 'target' kwarg.")
+    if target is None:
+        raise ValueError(f"A value for 'target' must be provided.")
+    raise ValueError(f"'target' must be one of: {','.join(str(t) for t in targets)}. Got: {target}")
+
+
+class TableBet(Bet):
+    """A Bet implemented from a BetSpec.
+
+    Subclasses only set `spec`. Wagers live in a flat list with one entry
+    per slot, and settlement reads the compiled (phase, outcome) tables.
+    """
+
+    spec: BetSpec
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if getattr(cls, 'spec', None) is not None:
+            compiled = compile_spec(cls.spec)
+            cls._compiled = compiled
+            cls._actions = compiled.actions
+            cls.settles_by_total = compiled.settles_by_total
+
+    def __init__(self, init_phase: TablePhase):
+        super().__init__(init_phase)
+        self._wagers = [0.0] * len(self._compiled.slots)
+
+    @property
+    def is_prop(self) -> bool:
+        return self.spec.is_prop
+
+    def set_stake_targets(self) -> Tuple[Optional[int]]:
+        return self._compiled.set_targets['stake']
+
+    def get_stake_targets(self) -> Tuple[Optional[int]]:
+        return self._compiled.targets['stake']
+
+    def set_odds_targets(self) -> Tuple[Optional[int]]:
+        return self._compiled.set_targets['odds']
+
+    def get_odds_targets(self) -> Tuple[Optional[int]]:
+        return self._compiled.targets['odds']
+
+    def get_stake_increment(self, target: Optional[int] = None) -> int:
+        return self._compiled.slots[self._slot('stake', target)].increment
+
+    def get_odds_increment(self, target: Optional[int] = None) -> Optional[int]:
+        if not self._compiled.targets['odds']:
+            _check_target((None,), target)
+            return None
+        return self._compiled.slots[self._slot('odds', target)].increment
+
+    def can_set_stake(self, target: Optional[int] = None) -> bool:
+        return self._can_set('stake', target)
+
+    def can_set_odds(self, target: Optional[int] = None) -> bool:
+        if not self._compiled.targets['odds']:
+            _check_target((None,), target)
+            return False
+        return self._can_set('odds', target)
+
+    def _can_set(self, kind: str, target: Optional[int]) -> bool:
+        compiled = self._compiled
+        try:
+            i = compiled.set_index[kind][target]
+        except KeyError:
+            _check_target(compiled.set_targets[kind], target)
+            raise
+        if self._phase.point not in compiled.settable[i]:
+            return False
+        required = compiled.requires[i]
+        return required is None or self._wagers[required] > 0
+
+    def _slot(self, kind: str, target: Optional[int]) -> int:
+        try:
+            return self._compiled.get_index[kind][target]
+        except KeyError:
+            targets = self._compiled.targets[kind]
+            if not targets:
+                raise RuntimeError(f"This bet does not have odds.")
+            _check_target(targets, target)
+            raise
+
+    def _set(self, kind: str, amount: float, target: Optional[int]):
+        if not self._compiled.targets[kind]:
+            raise RuntimeError(f"This bet does not have odds.")
+        if amount > 0 and not self._can_set(kind, target):
+            raise IllegalAction(f"Cannot set {kind} on {target} in the current state.")
+        try:
+            i = self._compiled.set_index[kind][target]
+        except KeyError:
+            _check_target(self._compiled.set_targets[kind], target)
+            raise
+        self._wagers[i] = amount
+
+    def _set_stake(self, amount: float, target: Optional[int] = None):
+        self._set('stake', amount, target)
+
+    def _get_stake(self, target: Optional[int] = None) -> float:
+        return self._wagers[self._slot('stake', target)]
+
+    def _set_odds(self, amount: float, target: Optional[int] = None):
+        self._set('odds', amount, target)
+
+    def _get_odds(self, target: Optional[int] = None) -> float:
+        return self._wagers[self._slot('odds', target)]
+
+    def _settle(self, roll: Roll) -> float:
+        actions = self._actions[self._phase.point][roll.outcome_index()]
+        if not actions:
+            return 0.0
+        wagers = self._wagers
+        payout = 0.0
+        moves = []
+        for i, returns, dest in actions:
+            amount = wagers[i]
+            if not amount:
+                continue
+            payout += amount * returns
+            if dest != i:
+                wagers[i] = 0.0
+                if dest is not None:
+                    moves.append((dest, amount))
+        for dest, amount in moves:
+            wagers[dest] += amount
+        return payout
+
+    def _clear(self):
+        self._wagers = [0.0] * len(self._wagers)
+
+    def get_total_wager(self) -> float:
+        return float(sum(self._wagers))
+
+    def has_wagers(self) -> bool:
+        return any(self._wagers)
+
+    def _get_wagers(self) -> Tuple:
+        return tuple(self._wagers)
+
+    def _set_wagers(self, wagers: Tuple):
+        self._wagers = list(wagers)
+
+    def _roll_table(self) -> Optional[Tuple[Tuple[float, ...], Tuple[float, ...]]]:
+        if not self.settles_by_total:
+            return None
+        by_outcome = self._actions[self._phase.point]
+        return self._vectors([by_outcome[k] for k in _TOTAL_OUTCOMES])
+
+    def _outcome_vectors(self) -> Tuple[Tuple[float, ...], Tuple[float, ...]]:
+        return self._vectors(self._actions[self._phase.point])
+
+    def _vectors(self, rows) -> Tuple[Tuple[float, ...], Tuple[float, ...]]:
+        wagers = self._wagers
+        total = sum(wagers)
+        payouts, remaining = [], []
+        for actions in rows:
+            payout, leaving = 0.0, 0.0
+            for i, returns, dest in actions:
+                amount = wagers[i]
+                payout += amount * returns
+                if dest is None:
+                    leaving += amount
+            payouts.append(payout)
+            remaining.append(total - leaving)
+        return tuple(payouts), tuple(remaining)
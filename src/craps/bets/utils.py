@@ -17,3 +17,15 @@ TRUE_ODDS_INCREMENT = {
     10: 1
 }
 
+
+# Lay odds pay the inverse of true odds
+LAY_ODDS = {n: 1 / odds for n, odds in TRUE_ODDS.items()}
+
+LAY_ODDS_INCREMENT = {
+    4: 2,   # 1:2 payout
+    5: 3,   # 2:3 payout
+    6: 6,   # 5:6 payout
+    8: 6,   # 5:6 payout
+    9: 3,   # 2:3 payout
+    10: 2   # 1:2 payout
+}
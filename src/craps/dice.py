@@ -1,3 +1,7 @@
+from typing import Optional, Sequence, Tuple
+import random
+from abc import ABC, abstractmethod
+
 class Roll(tuple):
     """
     Represents the roll of 2 six-sided dice.
@@ -9,3 +13,89 @@ class Roll(tuple):
         Returns the dice total.
         """
         return self[0] + self[1]
+
+    def outcome_index(self) -> int:
+        """
+        Returns the index (0-35) of this ordered dice pair in ROLLS.
+        """
+        return (self[0] - 1) * 6 + (self[1] - 1)
+
+# All 36 ordered dice pairs, indexed by Roll.outcome_index()
+ROLLS = tuple(Roll((d1, d2)) for d1 in range(1, 7) for d2 in range(1, 7))
+
+# Dice totals 2-12, the total of each outcome index, and the number of
+# outcomes that produce each total
+TOTALS = tuple(range(2, 13))
+OUTCOME_TOTALS = tuple(roll.total() for roll in ROLLS)
+TOTAL_WAYS = tuple(6 - abs(t - 7) for t in TOTALS)
+
+def roll_from_index(index: int) -> Roll:
+    """
+    Returns the interned Roll for an outcome index (0-35).
+    """
+    return ROLLS[index]
+
+class DiceSource(ABC):
+    """
+    A stream of rolls that can drive a TableState or a CrapsEnv.
+    """
+    @abstractmethod
+    def next_roll(self) -> Roll:
+        """
+        Returns the next roll.
+        """
+        raise NotImplementedError
+
+    def new_episode(self):
+        """
+        Called when an environment episode starts. Does nothing by default.
+        """
+        pass
+
+    def get_seed_path(self) -> Optional[Tuple[int, ...]]:
+        """
+        Returns the seed path that regenerates the current episode's rolls
+        (see craps.seeding), or None if the source is not seeded that way.
+        """
+        return None
+
+class GeneratorDice(DiceSource):
+    """
+    Rolls two dice with a random generator exposing integers(low, high),
+    such as numpy.random.Generator.
+    """
+    def __init__(self, rng):
+        self.rng = rng
+
+    def next_roll(self) -> Roll:
+        dice1 = int(self.rng.integers(1, 7))
+        dice2 = int(self.rng.integers(1, 7))
+        return ROLLS[(dice1 - 1) * 6 + (dice2 - 1)]
+
+class RandomDice(DiceSource):
+    """
+    Rolls with Python's random module. Useful where numpy is not wanted.
+    """
+    def __init__(self, seed: Optional[int] = None):
+        self.rng = random.Random(seed)
+
+    def next_roll(self) -> Roll:
+        return ROLLS[self.rng.randrange(36)]
+
+class SequenceDice(DiceSource):
+    """
+    Replays a fixed sequence of rolls.
+
+    Raises:
+        EOFError: From next_roll() when the sequence is exhausted.
+    """
+    def __init__(self, rolls: Sequence[Roll]):
+        self._rolls = rolls
+        self._pos = 0
+
+    def next_roll(self) -> Roll:
+        if self._pos >= len(self._rolls):
+            raise EOFError("Roll sequence exhausted.")
+        roll = self._rolls[self._pos]
+        self._pos += 1
+        return roll
@@ -0,0 +1,390 @@
+"""
+Declarative betting strategies that run on one table or on a whole batch.
+
+A strategy is a list of rules. Each rule pairs a condition with the wagers
+to set when it holds, for example:
+
+    iron_cross = RuleStrategy(
+        {'place_bets': PlaceBets, 'field': Field},
+        [
+            rule(point_on(), set_stake('field', 15)),
+            rule(point_on(), set_stake('place_bets', 15, 5),
+                 set_stake('place_bets', 18, 6), set_stake('place_bets', 18, 8)),
+        ],
+    )
+
+Conditions and amounts are expressions over the table (point(), stake(),
+bankroll(), hits(), ...) combined with the usual operators. They are
+evaluated on arrays with one entry per table, so the same rules drive a
+BatchTableState through act_batch() and, as a Strategy, a scalar
+TableState through act() for verification.
+
+Rules run in order before every roll. The wagers of one rule are applied
+as a single batch with apply_bets(), so a table either takes all of them or
+none. Wagers that already have the requested amount are left alone.
+"""
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Type, Union
+from dataclasses import dataclass
+from abc import ABC, abstractmethod
+import numpy as np
+from craps.bets.model import Bet
+from craps.constants import POINTS, SEVEN_OUT
+from craps.phase import TablePhase
+from craps.state import TableState, ActionStatus
+from craps.strategies import Strategy
+from craps.batch.state import BatchTableState
+
+
+class _Point:
+    def __repr__(self) -> str:
+        return "POINT"
+
+
+# Target placeholder for the current point (e.g. odds behind the pass line)
+POINT = _Point()
+
+Target = Union[None, int, _Point]
+
+
+@dataclass
+class _Context:
+    """What expressions are evaluated against."""
+    table: "_Table"
+    memory: "_Memory"
+    point_target: Optional[int] = None
+
+    def target(self, target: Target) -> Optional[int]:
+        return self.point_target if target is POINT else target
+
+
+class Expr(ABC):
+    """An array-valued expression over the tables, with one entry per table."""
+
+    @abstractmethod
+    def evaluate(self, ctx: _Context) -> np.ndarray:
+        """Returns the expression's value for every table in ctx."""
+        raise NotImplementedError
+
+    def uses_point_target(self) -> bool:
+        return False
+
+    def __and__(self, other): return _Op(np.logical_and, self, other)
+    def __or__(self, other): return _Op(np.logical_or, self, other)
+    def __invert__(self): return _Op(np.logical_not, self)
+    def __eq__(self, other): return _Op(np.equal, self, other)
+    def __ne__(self, other): return _Op(np.not_equal, self, other)
+    def __lt__(self, other): return _Op(np.less, self, other)
+    def __le__(self, other): return _Op(np.less_equal, self, other)
+    def __gt__(self, other): return _Op(np.greater, self, other)
+    def __ge__(self, other): return _Op(np.greater_equal, self, other)
+    def __add__(self, other): return _Op(np.add, self, other)
+    def __radd__(self, other): return _Op(np.add, other, self)
+    def __sub__(self, other): return _Op(np.subtract, self, other)
+    def __rsub__(self, other): return _Op(np.subtract, other, self)
+    def __mul__(self, other): return _Op(np.multiply, self, other)
+    def __rmul__(self, other): return _Op(np.multiply, other, self)
+    def __truediv__(self, other): return _Op(np.true_divide, self, other)
+
+    __hash__ = object.__hash__
+
+
+def _expr(value) -> Expr:
+    return value if isinstance(value, Expr) else _Const(value)
+
+
+class _Const(Expr):
+    def __init__(self, value):
+        self.value = value
+
+    def evaluate(self, ctx: _Context) -> np.ndarray:
+        return np.full(ctx.table.n, self.value)
+
+
+class _Op(Expr):
+    def __init__(self, fn: Callable, *args):
+        self.fn = fn
+        self.args = tuple(_expr(a) for a in args)
+
+    def evaluate(self, ctx: _Context) -> np.ndarray:
+        return self.fn(*(a.evaluate(ctx) for a in self.args))
+
+    def uses_point_target(self) -> bool:
+        return any(a.uses_point_target() for a in self.args)
+
+
+class _Leaf(Expr):
+    def __init__(self, fn: Callable[[_Context], np.ndarray], uses_point: bool = False):
+        self.fn = fn
+        self.uses_point = uses_point
+
+    def evaluate(self, ctx: _Context) -> np.ndarray:
+        return self.fn(ctx)
+
+    def uses_point_target(self) -> bool:
+        return self.uses_point
+
+
+class _Hits(Expr):
+    def __init__(self, totals: Tuple[int, ...]):
+        self.totals = totals
+
+    def evaluate(self, ctx: _Context) -> np.ndarray:
+        return ctx.memory.hits[self.totals]
+
+
+def point() -> Expr:
+    """The point of each table, 0 on the come-out."""
+    return _Leaf(lambda ctx: ctx.table.get_point())
+
+
+def point_on() -> Expr:
+    return point() != 0
+
+
+def comeout() -> Expr:
+    return point() == 0
+
+
+def point_established() -> Expr:
+    """True on the first decision after a point is established."""
+    return _Leaf(lambda ctx: (ctx.memory.prev_point == 0) & (ctx.table.get_point() != 0))
+
+
+def bankroll() -> Expr:
+    return _Leaf(lambda ctx: ctx.table.get_bankroll())
+
+
+def stake(key: str, target: Target = None) -> Expr:
+    """The stake currently on a bet."""
+    return _Leaf(lambda ctx: ctx.table.get_bet_stake(key, ctx.target(target)), target is POINT)
+
+
+def odds(key: str, target: Target = None) -> Expr:
+    """The odds currently on a bet."""
+    return _Leaf(lambda ctx: ctx.table.get_bet_odds(key, ctx.target(target)), target is POINT)
+
+
+def rolled(*totals: int) -> Expr:
+    """True if the last roll's total is one of totals."""
+    return _Leaf(lambda ctx: ctx.memory.rolled & np.isin(ctx.table.get_last_total(), totals))
+
+
+def hits(*totals: int) -> Expr:
+    """
+    Number of rolls with one of totals while a point was on, since the last
+    seven-out (e.g. hits(6, 8) counts wins on place bets on the 6 and 8).
+    """
+    return _Hits(tuple(sorted(totals)))
+
+
+@dataclass(frozen=True, eq=False)
+class Action:
+    """Set a bet's stake or odds to amount."""
+    key: str
+    bet_type: str
+    amount: Expr
+    target: Target = None
+
+    def uses_point_target(self) -> bool:
+        return self.target is POINT or self.amount.uses_point_target()
+
+
+def set_stake(key: str, amount, target: Target = None) -> Action:
+    return Action(key, 'stake', _expr(amount), target)
+
+
+def set_odds(key: str, amount, target: Target = None) -> Action:
+    return Action(key, 'odds', _expr(amount), target)
+
+
+def take_down(key: str, target: Target = None) -> Action:
+    return Action(key, 'stake', _Const(0.0), target)
+
+
+def press(key: str, target: Target = None, factor: float = 2.0) -> Action:
+    """Multiply the stake on a bet, e.g. after a hit."""
+    return Action(key, 'stake', stake(key, target) * factor, target)
+
+
+@dataclass(frozen=True, eq=False)
+class Rule:
+    condition: Expr
+    actions: Tuple[Action, ...]
+
+
+def rule(condition, *actions: Action) -> Rule:
+    """When condition holds, set every wager in actions (all or nothing)."""
+    return Rule(_expr(condition), actions)
+
+
+class _Memory:
+    """Per-table history that rules can read: the last point seen and the
+    hit counters."""
+    def __init__(self, n: int, hit_totals: Iterable[Tuple[int, ...]]):
+        self.roll_count = 0
+        self.prev_point = np.zeros(n, dtype=np.int64)
+        self.point = np.zeros(n, dtype=np.int64)
+        self.rolled = False
+        self.hits = {totals: np.zeros(n, dtype=np.int64) for totals in hit_totals}
+
+    def observe(self, table: "_Table"):
+        roll_count = table.get_roll_count()
+        self.rolled = roll_count != self.roll_count
+        self.prev_point = self.point
+        if self.rolled:
+            # The point during the last roll is the one seen before it
+            last = table.get_last_total()
+            on = self.prev_point != 0
+            seven_out = on & (last == SEVEN_OUT)
+            for totals, count in self.hits.items():
+                count += on & np.isin(last, totals)
+                count[seven_out] = 0
+            self.roll_count = roll_count
+        self.point = table.get_point()
+
+
+class _Table:
+    """The array interface rules run against. BatchTableState provides it
+    directly; _ScalarTable adapts a TableState as a batch of one."""
+    n: int
+
+
+class _ScalarTable(_Table):
+    def __init__(self, state: TableState):
+        self.state = state
+        self.n = 1
+
+    def get_point(self) -> np.ndarray:
+        return np.array([self.state.get_phase().point or 0])
+
+    def get_bankroll(self) -> np.ndarray:
+        return np.array([self.state.get_bankroll_size()])
+
+    def get_bet_stake(self, key: str, target: Optional[int] = None) -> np.ndarray:
+        return np.array([self.state.get_bet_stake(key, target=target)])
+
+    def get_bet_odds(self, key: str, target: Optional[int] = None) -> np.ndarray:
+        return np.array([self.state.get_bet_odds(key, target=target)])
+
+    def get_roll_count(self) -> int:
+        return self.state.get_roll_count()
+
+    def get_last_total(self) -> np.ndarray:
+        roll = self.state.get_last_roll()
+        return np.array([0 if roll is None else roll.total()])
+
+    def apply_bets(self, ops, where: Optional[np.ndarray] = None) -> np.ndarray:
+        if where is not None and not where[0]:
+            return np.array([ActionStatus.OK], dtype=np.int8)
+        ops = [(key, bet_type, float(np.asarray(amount).reshape(-1)[0]), target)
+               for key, bet_type, amount, target in ops]
+        return np.array([self.state.apply_bets(ops)], dtype=np.int8)
+
+
+def _run(rules: Sequence[Rule], table: _Table, memory: _Memory):
+    memory.observe(table)
+    for r in rules:
+        if any(a.uses_point_target() for a in r.actions) or r.condition.uses_point_target():
+            # POINT differs between tables, so run once per point number
+            point = table.get_point()
+            for n in POINTS:
+                on_n = point == n
+                if on_n.any():
+                    _apply_rule(r, _Context(table, memory, n), on_n)
+        else:
+            _apply_rule(r, _Context(table, memory), None)
+
+
+def _apply_rule(r: Rule, ctx: _Context, where: Optional[np.ndarray]):
+    table = ctx.table
+    mask = np.asarray(r.condition.evaluate(ctx), dtype=bool)
+    if where is not None:
+        mask = mask & where
+    if not mask.any():
+        return
+
+    ops, changes = [], []
+    for action in r.actions:
+        target = ctx.target(action.target)
+        amount = np.broadcast_to(action.amount.evaluate(ctx).astype(np.float64), (table.n,))
+        if action.bet_type == 'stake':
+            current = table.get_bet_stake(action.key, target)
+        else:
+            current = table.get_bet_odds(action.key, target)
+        ops.append((action.key, action.bet_type, amount, target))
+        changes.append(amount != current)
+    if not ops:
+        return
+
+    # Tables only get the wagers that change, so group them by which ones do.
+    # Change flags are packed 64 to a word; rules with up to 64 actions sort
+    # one integer per table.
+    changed = np.stack(changes, axis=1) & mask[:, None]
+    rows = np.flatnonzero(changed.any(axis=1))
+    if not rows.size:
+        return
+    n_words = -(-len(ops) // 64)
+    packed = np.zeros((rows.size, 8 * n_words), dtype=np.uint8)
+    packed[:, :-(-len(ops) // 8)] = np.packbits(changed[rows], axis=1)
+    words = packed.view(np.uint64)
+    if n_words == 1:
+        _, first, group = np.unique(words[:, 0], return_index=True, return_inverse=True)
+    else:
+        _, first, group = np.unique(words, axis=0, return_index=True, return_inverse=True)
+    group = group.ravel()
+    for g, row in enumerate(rows[first]):
+        where = np.zeros(table.n, dtype=bool)
+        where[rows[group == g]] = True
+        table.apply_bets([op for op, flag in zip(ops, changed[row]) if flag], where=where)
+
+
+class RuleStrategy(Strategy):
+    """
+    A Strategy defined by rules (see the module docstring). It plays a
+    scalar TableState through act(), like any Strategy, and a whole
+    BatchTableState through act_batch().
+
+    Args:
+        bets: Bet class of every bet the rules use, by key.
+        rules: Evaluated in order before every roll.
+        name: Strategy name for tournaments.
+    """
+    def __init__(self, bets: Dict[str, Type[Bet]], rules: Sequence[Rule], name: str = "rules"):
+        self.bets = dict(bets)
+        self.rules = tuple(rules)
+        self.name = name
+        self._hit_totals = {e.totals for r in self.rules for e in _walk_rule(r) if isinstance(e, _Hits)}
+        self.reset()
+
+    def make_bets(self) -> Dict[str, Bet]:
+        init_phase = TablePhase()
+        return {key: cls(init_phase) for key, cls in self.bets.items()}
+
+    def make_batch(self, config, init_bankroll) -> BatchTableState:
+        """Returns a BatchTableState with this strategy's bets."""
+        return BatchTableState(config, self.bets, init_bankroll)
+
+    def reset(self):
+        self._memory: Optional[_Memory] = None
+        self._batch_memory: Optional[_Memory] = None
+
+    def act(self, state: TableState):
+        if self._memory is None:
+            self._memory = _Memory(1, self._hit_totals)
+        _run(self.rules, _ScalarTable(state), self._memory)
+
+    def act_batch(self, state: BatchTableState):
+        """Applies the rules to every table in the batch."""
+        if self._batch_memory is None:
+            self._batch_memory = _Memory(state.n, self._hit_totals)
+        _run(self.rules, state, self._batch_memory)
+
+
+def _walk_rule(r: Rule) -> List[Expr]:
+    exprs, stack = [], [r.condition] + [a.amount for a in r.actions]
+    while stack:
+        e = stack.pop()
+        exprs.append(e)
+        if isinstance(e, _Op):
+            stack.extend(e.args)
+    return exprs
@@ -0,0 +1,34 @@
+"""
+Gymnasium environment for the craps simulator.
+
+Submodules are imported on first attribute access, so importing craps.gym
+(or the dependency-free craps.gym.config) does not pull in gymnasium or
+numpy.
+"""
+from importlib import import_module
+
+_EXPORTS = {
+    "CrapsEnv": "craps.gym.env",
+    "CrapsEnvConfig": "craps.gym.config",
+    "SpaceCodec": "craps.gym.codec",
+    "BetCodec": "craps.gym.codec",
+    "FlattenActionWrapper": "craps.gym.wrappers",
+    "CPTBuffer": "craps.gym.wrappers",
+    "CPTRewardWrapper": "craps.gym.wrappers",
+    "EpisodeRecordQueue": "craps.gym.metrics",
+    "MetricsAggregator": "craps.gym.metrics",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module 'craps.gym' has no attribute '{name}'")
+    value = getattr(import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
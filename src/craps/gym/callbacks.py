@@ -0,0 +1,36 @@
+"""
+Stable Baselines3 callbacks. Importing this module imports stable_baselines3.
+"""
+import numpy as np
+from stable_baselines3.common.callbacks import BaseCallback
+from craps.gym.metrics import MetricsAggregator
+
+
+class CrapsMetricsCallback(BaseCallback):
+    """Drains episode records from every env and logs windowed summaries.
+
+    Records are drained every ``drain_freq`` steps and folded into a
+    MetricsAggregator, which writes one summary per ``flush_freq`` steps.
+    """
+
+    def __init__(self, aggregator: MetricsAggregator, drain_freq: int = 256, flush_freq: int = 2048, verbose: int = 0):
+        super().__init__(verbose)
+        self._aggregator = aggregator
+        self._drain_freq = drain_freq
+        self._flush_freq = flush_freq
+
+    def _on_step(self):
+        if self.n_calls % self._drain_freq == 0:
+            self._drain()
+        if self.n_calls % self._flush_freq == 0:
+            self._aggregator.flush(step=self.num_timesteps)
+        return True
+
+    def _on_training_end(self):
+        self._drain()
+        self._aggregator.flush(step=self.num_timesteps)
+        self._aggregator.close()
+
+    def _drain(self):
+        batches = self.training_env.env_method("drain_episode_records")
+        self._aggregator.add(np.concatenate(batches))
@@ -166,6 +166,11 @@ class SpaceCodec:
         self._action_space = self._build_action_space()
         self._observation_space = self._build_observation_space()
 
+        # Parse action keys once: (key, bet_type, bet_name, target)
+        self._action_keys = [
+            (key,) + self._parse_key(key) for key in self._action_space.spaces
+        ]
+
     @property
     def action_space(self) -> spaces.Dict:
         return self._action_space
@@ -220,16 +225,7 @@ class SpaceCodec:
         """
         masks = {}
 
-        for key in self._action_space.spaces:
-            bet_type, bet_name, target_str = key.split('-')
-            target = None if target_str == 'None' else int(target_str)
-            bet = state.bets[bet_name]
-
-            if bet_type == 'stake':
-                is_on = bet.can_set_stake(target=target)
-            else:
-                is_on = bet.can_set_odds(target=target)
-
+        for key, is_on in zip(self._action_space.spaces, self.legal_action_keys(state)):
             size = self._action_space.spaces[key].n
             if is_on:
                 mask = np.ones(size, dtype=np.int8)
@@ -240,6 +236,23 @@ class SpaceCodec:
 
         return masks
 
+    def legal_action_keys(self, state: TableState) -> Tuple[bool, ...]:
+        """Return, per action key, whether the bet accepts a non-zero wager."""
+        legal = []
+        for _, bet_type, bet_name, target in self._action_keys:
+            bet = state.bets[bet_name]
+            if bet_type == 'stake':
+                legal.append(bet.can_set_stake(target=target))
+            else:
+                legal.append(bet.can_set_odds(target=target))
+        return tuple(legal)
+
+    @staticmethod
+    def _parse_key(key: str) -> Tuple[str, str, Optional[int]]:
+        bet_type, bet_name, target_str = key.split('-')
+        target = None if target_str == 'None' else int(target_str)
+        return bet_type, bet_name, target
+
     def decode_action(self, action: Dict) -> Iterator[Tuple[str, str, float, Optional[int]]]:
         """Decode a gym action dict into bet operations.
 
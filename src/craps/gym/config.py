@@ -7,4 +7,9 @@ class CrapsEnvConfig:
     max_points: int
     min_bet_inc: int
     entertainment_cost: float = 0.0
-    illegal_action_penalty: float = 0.01
\ No newline at end of file
+    illegal_action_penalty: float = 0.01
+    step_info: bool = False
+    # Keep rolling inside step() until a phase change, a bet resolution or a
+    # newly legal action (capped at max_auto_rolls rolls per step)
+    auto_advance: bool = False
+    max_auto_rolls: int = 100
\ No newline at end of file
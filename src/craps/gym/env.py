@@ -4,9 +4,8 @@ from copy import deepcopy
 import gymnasium as gym
 import numpy as np
 from craps.bets.model import Bet
-from craps.state import TableConfig, TableState
-from craps.dice import Roll
-from craps.exceptions import IllegalAction, InsufficientFunds
+from craps.state import TableConfig, TableState, ActionStatus
+from craps.dice import Roll, DiceSource
 from craps.gym.config import CrapsEnvConfig
 from craps.gym.codec import SpaceCodec
 from craps.gym.render import (
@@ -16,10 +15,27 @@ from craps.gym.render import (
 )
 
 class CrapsEnv(gym.Env):
-    def __init__(self, env_config: CrapsEnvConfig, table_config: TableConfig, bets: Dict[str, Bet]):
+    """A craps table as a gym environment.
+
+    Args:
+        env_config: Episode and reward configuration.
+        table_config: Table limits.
+        bets: Dictionary of bet name to Bet instance.
+        dice: Optional dice source (e.g. a recorded trace). Defaults to
+            rolling with the env's seeded np_random.
+    """
+
+    def __init__(
+        self,
+        env_config: CrapsEnvConfig,
+        table_config: TableConfig,
+        bets: Dict[str, Bet],
+        dice: Optional[DiceSource] = None
+    ):
         self._env_config = env_config
         self._table_config = table_config
         self._bets = bets
+        self._dice = dice
 
         self._codec = SpaceCodec(
             table_config=table_config,
@@ -38,6 +54,10 @@ class CrapsEnv(gym.Env):
         super().reset(seed=seed)
         self._n_steps = 0
         self._n_points = 0
+        self._n_illegal_actions = 0
+        self._last_action_illegal = False
+        if self._dice is not None:
+            self._dice.new_episode()
         for bet in self._bets.values():
             bet.reset()
         self._state = TableState(self._table_config, self._bets, self._env_config.init_bankroll)
@@ -46,43 +66,81 @@ class CrapsEnv(gym.Env):
     def step(self, action: Any) -> Tuple[Any, float, bool, bool, Dict[str, Any]]:
         # Apply bets to table state
         reward = 0.0
-        illegal_action = False
-        try:
-            self._apply_action(action)
-        except (IllegalAction, InsufficientFunds):
+        illegal_action = not self._apply_action(action)
+        if illegal_action:
             reward -= self._env_config.illegal_action_penalty
-            illegal_action = True
 
-        # Capture phase before roll for point tracking
-        prev_phase = self._state.get_phase()
-
-        # Roll and progress the table state
-        roll = self._random_roll()
-        self._state.step(roll)
-
-        # Track completed point rounds
-        new_phase = self._state.get_phase()
-        if prev_phase.point is not None and new_phase.point is None:
-            self._n_points += 1
+        # Roll once, or with auto_advance keep rolling until the policy has a
+        # real decision to make
+        n_rolls = 0
+        while True:
+            # Capture state before roll for point tracking and decision checks
+            prev_phase = self._state.get_phase()
+            prev_bankroll = self._state.get_bankroll_size()
+            if self._env_config.auto_advance:
+                prev_layout = self._wager_layout()
+                prev_legal = self._codec.legal_action_keys(self._state)
+
+            # Roll and progress the table state
+            roll = self._random_roll()
+            self._state.step(roll)
+            n_rolls += 1
+
+            # Track completed point rounds
+            new_phase = self._state.get_phase()
+            if prev_phase.point is not None and new_phase.point is None:
+                self._n_points += 1
+
+            bankroll = self._state.get_bankroll_size()
+            terminated = bankroll <= 0.0 or bankroll >= self._env_config.max_bankroll
+            truncated = (not terminated) and self._n_points >= self._env_config.max_points
+            if (terminated or truncated
+                    or not self._env_config.auto_advance
+                    or n_rolls >= self._env_config.max_auto_rolls):
+                break
+            if self._is_decision_point(prev_phase, prev_bankroll, prev_layout, prev_legal):
+                break
 
         # Compute outputs
-        bankroll = self._state.get_bankroll_size()
         observation = self._codec.encode_observation(self._state, n_points=self._n_points)
-        terminated = bankroll <= 0.0 or bankroll >= self._env_config.max_bankroll
-        truncated = (not terminated) and self._n_points >= self._env_config.max_points
 
         self._n_steps += 1
-
-        info = {
-            "illegal_action": illegal_action,
-            "n_points": self._n_points,
-        }
-        if terminated or truncated:
-            info["terminal_bankroll"] = bankroll
-            info["total_steps"] = self._n_steps
+        self._n_illegal_actions += illegal_action
+        self._last_action_illegal = illegal_action
+
+        # Per-step info is opt-in. Episode stats are read through the getters.
+        info = {}
+        if self._env_config.step_info:
+            info["illegal_action"] = illegal_action
+            info["n_points"] = self._n_points
+            info["n_rolls"] = n_rolls
+            if terminated or truncated:
+                info["terminal_bankroll"] = bankroll
+                info["total_steps"] = self._n_steps
+                if self.get_seed_path() is not None:
+                    info["seed_path"] = self.get_seed_path()
 
         return observation, reward, terminated, truncated, info
 
+    def get_n_steps(self) -> int:
+        return self._n_steps
+
+    def get_n_points(self) -> int:
+        return self._n_points
+
+    def get_n_illegal_actions(self) -> int:
+        return self._n_illegal_actions
+
+    def get_last_action_illegal(self) -> bool:
+        return self._last_action_illegal
+
+    def get_bankroll_size(self) -> float:
+        return self._state.get_bankroll_size()
+
+    def get_seed_path(self) -> Optional[Tuple[int, ...]]:
+        """Seed path of the current episode's dice, if they are seeded by path."""
+        return self._dice.get_seed_path() if self._dice is not None else None
+
     def action_masks(self) -> Dict[str, np.ndarray]:
         return self._codec.build_action_mask(self._state)
 
@@ -104,14 +162,34 @@ class CrapsEnv(gym.Env):
 
         return snap
 
-    def _apply_action(self, action: Any):
-        for bet_name, bet_type, amount, target in self._codec.decode_action(action):
-            if bet_type == 'stake':
-                self._state.set_bet_stake(bet_name, amount, target=target)
-            else:
-                self._state.set_bet_odds(bet_name, amount, target=target)
+    def _apply_action(self, action: Any) -> bool:
+        """Validate the whole action first and apply it only if it is legal.
+
+        Returns:
+            True if the action was applied, False if it was rejected. A
+            rejected action leaves the table untouched.
+        """
+        return self._state.apply_bets(self._codec.decode_action(action)) == ActionStatus.OK
+
+    def _wager_layout(self) -> Tuple:
+        return tuple(bet.snapshot()[1:] for bet in self._state.bets.values())
+
+    def _is_decision_point(self, prev_phase, prev_bankroll: float, prev_layout: Tuple, prev_legal: Tuple[bool, ...]) -> bool:
+        """Whether the last roll gave the policy something new to decide.
+
+        That is a phase change, a bet resolving or paying out, or an action
+        key that was not legal before the roll becoming legal.
+        """
+        if self._state.get_phase().point != prev_phase.point:
+            return True
+        if self._state.get_bankroll_size() != prev_bankroll or self._wager_layout() != prev_layout:
+            return True
+        legal = self._codec.legal_action_keys(self._state)
+        return any(now and not before for now, before in zip(legal, prev_legal))
 
     def _random_roll(self) -> Roll:
+        if self._dice is not None:
+            return self._dice.next_roll()
         dice1 = self.np_random.integers(1, 7)
         dice2 = self.np_random.integers(1, 7)
         return Roll((dice1, dice2))
\ No newline at end of file
@@ -0,0 +1,198 @@
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+from dataclasses import dataclass
+import numpy as np
+
+EPISODE_RECORD_DTYPE = np.dtype([
+    ("reward_total", np.float64),
+    ("cpt_delta", np.float64),
+    ("cpt_utility", np.float64),
+    ("terminal_bankroll", np.float64),
+    ("total_steps", np.int64),
+    ("n_points", np.int64),
+    ("illegal_actions", np.int64),
+    ("adjusted_ref", np.float64),
+    ("fractional_return", np.float64),
+    # (node, worker, env, episode) of the episode's dice (see craps.seeding),
+    # or all -1 when the dice were not seeded by path
+    ("seed_path", np.int64, (4,)),
+])
+
+# Per-episode fields that are not averaged into summary scalars
+NON_SCALAR_FIELDS = ("seed_path",)
+
+HISTOGRAM_FIELDS = ("terminal_bankroll", "n_points", "illegal_actions", "cpt_delta")
+
+
+class EpisodeRecordQueue:
+    """A preallocated ring buffer of episode-end records.
+
+    Wrappers push one compact record per finished episode and callbacks
+    drain them in batches, instead of every step carrying the episode stats
+    through the ``info`` dict. When the queue is full the oldest record is
+    overwritten and counted in ``dropped``.
+
+    Args:
+        capacity: Maximum number of undrained records kept.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        if capacity <= 0:
+            raise ValueError("Queue capacity must be positive.")
+        self._records = np.zeros(capacity, dtype=EPISODE_RECORD_DTYPE)
+        self._capacity = capacity
+        self._start = 0
+        self._size = 0
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def push(self, **fields: Any):
+        """Append one episode record. Missing fields are left at zero, and
+        a missing seed_path at -1."""
+        idx = (self._start + self._size) % self._capacity
+        if self._size == self._capacity:
+            self._start = (self._start + 1) % self._capacity
+            self.dropped += 1
+        else:
+            self._size += 1
+        self._records[idx] = 0
+        self._records["seed_path"][idx] = -1
+        for name, value in fields.items():
+            self._records[name][idx] = value
+
+    def extend(self, records: np.ndarray):
+        """Append a batch of records, keeping only the newest on overflow."""
+        n_skipped = max(0, len(records) - self._capacity)
+        records = records[n_skipped:]
+        n = len(records)
+        idx = (self._start + self._size + np.arange(n)) % self._capacity
+        self._records[idx] = records
+        overflow = max(0, self._size + n - self._capacity)
+        self._size = min(self._capacity, self._size + n)
+        self._start = (self._start + overflow) % self._capacity
+        self.dropped += n_skipped + overflow
+
+    def peek_last(self) -> np.void:
+        """Return the most recently pushed record without removing it."""
+        if self._size == 0:
+            raise IndexError("Queue is empty.")
+        return self._records[(self._start + self._size - 1) % self._capacity]
+
+    def records(self) -> np.ndarray:
+        """Return a copy of all queued records (oldest first)."""
+        idx = (self._start + np.arange(self._size)) % self._capacity
+        return self._records[idx]
+
+    def drain(self) -> np.ndarray:
+        """Return all queued records (oldest first) and empty the queue."""
+        out = self.records()
+        self._start = 0
+        self._size = 0
+        return out
+
+
+def record_to_info(record: np.void) -> Dict[str, Any]:
+    """Convert an episode record into the legacy per-episode info keys."""
+    info = {
+        "ep_reward_total": float(record["reward_total"]),
+        "ep_cpt_delta": float(record["cpt_delta"]),
+        "ep_cpt_utility": float(record["cpt_utility"]),
+        "terminal_bankroll": float(record["terminal_bankroll"]),
+        "total_steps": int(record["total_steps"]),
+        "n_points": int(record["n_points"]),
+        "ep_illegal_actions": int(record["illegal_actions"]),
+        "adjusted_ref": float(record["adjusted_ref"]),
+        "fractional_return": float(record["fractional_return"]),
+    }
+    if record["seed_path"][0] >= 0:
+        info["seed_path"] = tuple(int(i) for i in record["seed_path"])
+    return info
+
+
+@dataclass
+class MetricsSummary:
+    """One aggregated metrics record, covering the episodes in the window."""
+    step: int
+    n_episodes: int
+    scalars: Dict[str, float]
+    histograms: Dict[str, Tuple[List[int], List[float]]]
+
+
+class MetricsAggregator:
+    """Keeps windowed means and histograms of episode records.
+
+    Records are added in batches (as drained from an ``EpisodeRecordQueue``)
+    and one ``MetricsSummary`` per flush is written to every sink, instead of
+    one logging call per finished episode.
+
+    Args:
+        sinks: Objects with ``write(summary)`` and ``close()`` methods.
+        window: Number of most recent episodes the summary covers.
+        n_bins: Number of bins for each histogram.
+        histogram_fields: Record fields to build histograms for.
+        episode_log: Optional object with ``write_records(records)`` and
+            ``close()`` that keeps every episode record, e.g. so episodes can
+            be replayed from their seed_path.
+    """
+
+    def __init__(
+        self,
+        sinks: Sequence[Any],
+        window: int = 1000,
+        n_bins: int = 20,
+        histogram_fields: Sequence[str] = HISTOGRAM_FIELDS,
+        episode_log: Optional[Any] = None
+    ):
+        self._sinks = list(sinks)
+        self._episode_log = episode_log
+        self._window = EpisodeRecordQueue(capacity=window)
+        self._n_bins = n_bins
+        self._histogram_fields = tuple(histogram_fields)
+        self._n_new = 0
+        self.n_total = 0
+
+    def add(self, records: np.ndarray):
+        """Add a batch of episode records to the window."""
+        if self._episode_log is not None and len(records):
+            self._episode_log.write_records(records)
+        self._window.extend(records)
+        self._n_new += len(records)
+        self.n_total += len(records)
+
+    def summary(self, step: int) -> MetricsSummary:
+        """Summarize the episodes currently in the window."""
+        records = self._window.records()
+        scalars = {
+            f"mean/{name}": float(records[name].mean()) if len(records) else 0.0
+            for name in EPISODE_RECORD_DTYPE.names
+            if name not in NON_SCALAR_FIELDS
+        }
+        histograms = {}
+        for name in self._histogram_fields:
+            if len(records) == 0:
+                continue
+            counts, edges = np.histogram(records[name], bins=self._n_bins)
+            histograms[name] = (counts.tolist(), edges.tolist())
+        return MetricsSummary(
+            step=step,
+            n_episodes=len(records),
+            scalars=scalars,
+            histograms=histograms
+        )
+
+    def flush(self, step: int) -> Optional[MetricsSummary]:
+        """Write a summary to every sink if episodes finished since the last flush."""
+        if self._n_new == 0:
+            return None
+        summary = self.summary(step)
+        for sink in self._sinks:
+            sink.write(summary)
+        self._n_new = 0
+        return summary
+
+    def close(self):
+        for sink in self._sinks:
+            sink.close()
+        if self._episode_log is not None:
+            self._episode_log.close()
@@ -0,0 +1,119 @@
+"""
+Destinations for MetricsAggregator summaries. Each sink has a write(summary)
+and a close() method. Heavy logging libraries are only imported when the
+matching sink is created.
+"""
+from typing import Dict, Any, List
+from dataclasses import asdict
+import json
+from craps.gym.metrics import MetricsSummary, record_to_info
+
+
+def _summary_to_row(summary: MetricsSummary) -> Dict[str, Any]:
+    row = {"step": summary.step, "n_episodes": summary.n_episodes}
+    row.update(summary.scalars)
+    return row
+
+
+class JsonlSink:
+    """Appends one JSON object per summary to a local file."""
+
+    def __init__(self, path: str):
+        self._file = open(path, "a")
+
+    def write(self, summary: MetricsSummary):
+        self._file.write(json.dumps(asdict(summary)) + "\n")
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+class JsonlEpisodeLog:
+    """Appends one JSON object per finished episode to a local file, with the
+    episode's seed_path when its dice were seeded by path. Used as a
+    MetricsAggregator episode_log."""
+
+    def __init__(self, path: str):
+        self._file = open(path, "a")
+
+    def write_records(self, records):
+        for record in records:
+            self._file.write(json.dumps(record_to_info(record)) + "\n")
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+class ParquetSink:
+    """Buffers summary scalars and writes them to a Parquet file on close.
+
+    Requires pyarrow.
+    """
+
+    def __init__(self, path: str):
+        import pyarrow  # noqa: F401  (fail early if missing)
+        self._path = path
+        self._rows: List[Dict[str, Any]] = []
+
+    def write(self, summary: MetricsSummary):
+        self._rows.append(_summary_to_row(summary))
+
+    def close(self):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        if self._rows:
+            pq.write_table(pa.Table.from_pylist(self._rows), self._path)
+        self._rows = []
+
+
+class WandbSink:
+    """Logs each summary as a single wandb.log call (requires an active run)."""
+
+    def __init__(self):
+        import wandb
+        self._wandb = wandb
+
+    def write(self, summary: MetricsSummary):
+        data: Dict[str, Any] = {
+            "metrics/global_step": summary.step,
+            "metrics/n_episodes": summary.n_episodes,
+        }
+        data.update({f"metrics/{k}": v for k, v in summary.scalars.items()})
+        for name, (counts, edges) in summary.histograms.items():
+            data[f"hist/{name}"] = self._wandb.Histogram(np_histogram=(counts, edges))
+        self._wandb.log(data)
+
+    def close(self):
+        pass
+
+
+class TensorBoardSink:
+    """Writes summary scalars and histograms to a TensorBoard log directory."""
+
+    def __init__(self, log_dir: str):
+        from torch.utils.tensorboard import SummaryWriter
+        self._writer = SummaryWriter(log_dir=log_dir)
+
+    def write(self, summary: MetricsSummary):
+        self._writer.add_scalar("metrics/n_episodes", summary.n_episodes, summary.step)
+        for name, value in summary.scalars.items():
+            self._writer.add_scalar(f"metrics/{name}", value, summary.step)
+        for name, (counts, edges) in summary.histograms.items():
+            # Approximate moments from bin centers
+            centers = [0.5 * (lo + hi) for lo, hi in zip(edges[:-1], edges[1:])]
+            self._writer.add_histogram_raw(
+                f"hist/{name}",
+                min=edges[0],
+                max=edges[-1],
+                num=sum(counts),
+                sum=sum(c * x for c, x in zip(counts, centers)),
+                sum_squares=sum(c * x * x for c, x in zip(counts, centers)),
+                bucket_limits=edges[1:],
+                bucket_counts=counts,
+                global_step=summary.step
+            )
+
+    def close(self):
+        self._writer.close()
@@ -1,8 +1,10 @@
+from typing import Optional
 from collections import deque
 import numpy as np
 import gymnasium as gym
 from gymnasium import spaces
 from craps.gym.reward import cpt_utility_from_returns
+from craps.gym.metrics import EpisodeRecordQueue, record_to_info
 
 class FlattenActionWrapper(gym.ActionWrapper):
     """Flatten a Dict action space of Discrete spaces into a MultiDiscrete space."""
@@ -49,17 +51,34 @@ class CPTBuffer:
         return len(self.buffer) >= self._minsize
 
 class CPTRewardWrapper(gym.Wrapper):
-    def __init__(self, env, buffer, init_bankroll: float, entertainment_cost: float = 0.0):
+    """Adds the CPT utility delta to the terminal reward of each episode.
+
+    Episode stats are pushed to ``record_queue`` once per finished episode
+    and drained in batches via ``drain_episode_records``. The legacy
+    per-episode info keys are only added when ``episode_info`` is True.
+    """
+
+    def __init__(
+        self,
+        env,
+        buffer,
+        init_bankroll: float,
+        entertainment_cost: float = 0.0,
+        record_queue: Optional[EpisodeRecordQueue] = None,
+        episode_info: bool = False
+    ):
         super().__init__(env)
         self.buffer = buffer
         self.prev_cpt = 0.0
         self._init_bankroll = init_bankroll
         self._entertainment_cost = entertainment_cost
+        self._craps_env = env.unwrapped
+        self.record_queue = record_queue if record_queue is not None else EpisodeRecordQueue()
+        self._episode_info = episode_info
         self._reset_episode_stats()
 
     def _reset_episode_stats(self):
         self._ep_reward_total = 0.0
-        self._ep_illegal_actions = 0
 
     def reset(self, **kwargs):
         self.prev_cpt = self.buffer.utility()
@@ -69,34 +88,48 @@ class CPTRewardWrapper(gym.Wrapper):
     def step(self, action):
         obs, reward, done, trunc, info = self.env.step(action)
 
-        self._ep_illegal_actions += int(info["illegal_action"])
         self._ep_reward_total += reward
 
         cpt_delta = 0.0
         if done or trunc:
-            n_points = info["n_points"]
+            n_points = self._craps_env.get_n_points()
             adjusted_ref = max(
                 1e-6,
                 self._init_bankroll - n_points * self._entertainment_cost
             )
 
-            terminal_bankroll = info["terminal_bankroll"]
+            terminal_bankroll = self._craps_env.get_bankroll_size()
             fractional_return = (terminal_bankroll - adjusted_ref) / adjusted_ref
 
             self.buffer.add(fractional_return)
 
+            cpt_utility = self.buffer.utility()
             if self.buffer.is_full():
-                new_cpt = self.buffer.utility()
-                cpt_delta = new_cpt - self.prev_cpt
+                cpt_delta = cpt_utility - self.prev_cpt
                 reward += cpt_delta
 
             self._ep_reward_total += cpt_delta
 
-            info["ep_reward_total"] = self._ep_reward_total
-            info["ep_cpt_delta"] = cpt_delta
-            info["ep_cpt_utility"] = self.buffer.utility()
-            info["ep_illegal_actions"] = self._ep_illegal_actions
-            info["adjusted_ref"] = adjusted_ref
-            info["fractional_return"] = fractional_return
+            seed_path = self._craps_env.get_seed_path()
+            extra = {'seed_path': seed_path} if seed_path is not None else {}
+            self.record_queue.push(
+                reward_total=self._ep_reward_total,
+                cpt_delta=cpt_delta,
+                cpt_utility=cpt_utility,
+                terminal_bankroll=terminal_bankroll,
+                total_steps=self._craps_env.get_n_steps(),
+                n_points=n_points,
+                illegal_actions=self._craps_env.get_n_illegal_actions(),
+                adjusted_ref=adjusted_ref,
+                fractional_return=fractional_return,
+                **extra
+            )
+            if self._episode_info:
+                info = dict(info)
+                info.update(record_to_info(self.record_queue.peek_last()))
 
         return obs, reward, done, trunc, info
+
+    def drain_episode_records(self) -> np.ndarray:
+        """Return the episode records finished since the last drain."""
+        return self.record_queue.drain()
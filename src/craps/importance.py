@@ -0,0 +1,299 @@
+"""
+Importance sampling for rare session outcomes.
+
+Ruin for a cautious strategy, or reaching a far bankroll target such as
+CrapsEnvConfig.max_bankroll, can take millions of plain Monte Carlo sessions
+to observe often enough to estimate. TiltedDice instead rolls from a
+distribution that makes the event common and keeps the likelihood ratio
+
+    w = prod over rolls of (1/36) / q(roll)
+
+of the rolls it produced. The average of w * 1{event} over tilted sessions
+is an unbiased estimate of the event's probability under fair dice.
+
+The tilt may change before every roll based on the table (the ratio of each
+roll only depends on the distribution it was drawn from). ExponentialTilt
+uses that to tilt the play of the current layout exponentially in its net
+result: each roll is reweighted by exp(theta * net of the roll) times the
+exponential moment of the layout it leaves (analysis.tilted_roll_probs).
+Rolls that settle nothing are only tilted towards layouts that pay more.
+
+When theta is the layout's Cramer root, where E[exp(theta * net)] = 1
+(cramer_theta), every resolved layout multiplies the weight by exactly
+exp(-theta * net). A session that reaches target from init_bankroll by flat
+bets then always has the weight exp(-theta * (target - init_bankroll)), so
+the estimate of the hit probability has almost no variance.
+"""
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from dataclasses import dataclass
+from itertools import accumulate
+from math import exp, inf, log
+from statistics import NormalDist
+import random
+from craps.bets.model import Bet
+from craps.dice import DiceSource, Roll, ROLLS, OUTCOME_TOTALS, TOTALS
+from craps.state import TableConfig, TableState
+from craps.stats import Moments
+from craps.strategies import Strategy
+
+FAIR_PROBS = (1 / 36,) * 36
+
+EVENTS = ('ruin', 'target')
+
+Tilt = Callable[[TableState], Sequence[float]]
+
+
+class TiltedDice(DiceSource):
+    """
+    Rolls each of the 36 outcomes with the given probabilities and tracks
+    the likelihood ratio of the episode's rolls against fair dice.
+
+    Args:
+        probs: Probability of each outcome in ROLLS order. Every outcome must
+            keep a positive probability, or the estimate is biased.
+        seed: Seed for Python's random module.
+    """
+    def __init__(self, probs: Sequence[float] = FAIR_PROBS, seed: Optional[int] = None):
+        self.rng = random.Random(seed)
+        self.log_weight = 0.0
+        self._cache = {}
+        self.set_probs(probs)
+
+    def set_probs(self, probs: Sequence[float]):
+        """Changes the distribution used for the following rolls."""
+        key = tuple(probs)
+        cached = self._cache.get(key)
+        if cached is None:
+            cached = self._cache[key] = self._prepare(key)
+        self._log_ratios, self._cum_weights = cached
+
+    @staticmethod
+    def _prepare(probs: Sequence[float]):
+        if len(probs) != len(ROLLS):
+            raise ValueError(f"Expected {len(ROLLS)} outcome probabilities. Got: {len(probs)}")
+        if any(p <= 0 for p in probs):
+            raise ValueError("Every outcome needs a positive probability.")
+        total = sum(probs)
+        return [log(1 / 36) - log(p / total) for p in probs], list(accumulate(probs))
+
+    def new_episode(self):
+        self.log_weight = 0.0
+
+    @property
+    def weight(self) -> float:
+        """Likelihood ratio of this episode's rolls, fair over tilted."""
+        return exp(self.log_weight)
+
+    def next_roll(self) -> Roll:
+        i = self.rng.choices(range(36), cum_weights=self._cum_weights)[0]
+        self.log_weight += self._log_ratios[i]
+        return ROLLS[i]
+
+
+def probs_from_totals(total_probs: Sequence[float]) -> List[float]:
+    """
+    Spreads probabilities of the totals 2-12 evenly over the outcomes that
+    produce each total.
+    """
+    if len(total_probs) != len(TOTALS):
+        raise ValueError(f"Expected {len(TOTALS)} total probabilities. Got: {len(total_probs)}")
+    ways = [6 - abs(t - 7) for t in TOTALS]
+    return [total_probs[t - 2] / ways[t - 2] for t in OUTCOME_TOTALS]
+
+
+class ExponentialTilt:
+    """
+    Tilts the rolls of whatever layout is on the table by exp(theta * net),
+    net being the change in bankroll plus wagers until the layout resolves.
+    Positive theta favors winning, negative theta favors losing. The dice
+    stay fair while nothing is wagered.
+
+    Tilted distributions are cached per layout, so a strategy that repeats a
+    handful of layouts only solves each once.
+    """
+    def __init__(self, theta: float):
+        self.theta = theta
+        self._cache: Dict[Tuple, Tuple[float, ...]] = {}
+
+    def __call__(self, state: TableState) -> Tuple[float, ...]:
+        from craps.analysis import tilted_roll_probs
+
+        if state.get_total_wager() == 0:
+            return FAIR_PROBS
+        key = tuple(bet.snapshot() for bet in state.bets.values())
+        probs = self._cache.get(key)
+        if probs is None:
+            probs = self._cache[key] = tilted_roll_probs(state.bets, self.theta)
+        return probs
+
+
+def cramer_theta(bets: Dict[str, Bet], tol: float = 1e-12) -> float:
+    """
+    Returns the non-zero theta where E[exp(theta * net)] = 1 for the wagers
+    on the given bets, the tilt under which a losing layout wins on average
+    exactly as much as it loses untilted. Positive for layouts with a house
+    edge.
+
+    Raises:
+        ValueError: If the layout has no edge or no such root exists.
+    """
+    from craps.analysis import analyze_bets, exponential_moment
+
+    ev = analyze_bets(bets).expected_value
+    if abs(ev) < tol:
+        raise ValueError("A layout without an edge has no non-zero Cramer root.")
+    direction = 1.0 if ev < 0 else -1.0
+    wager = sum(bet.get_total_wager() for bet in bets.values())
+    # Bracket the root: the moment dips below 1 near zero and grows past it
+    low, high = 0.0, direction / wager
+    for _ in range(64):
+        if exponential_moment(bets, high) > 1:
+            break
+        low, high = high, 2 * high
+    else:
+        raise ValueError("The exponential moment never returns to 1.")
+    while abs(high - low) > tol * abs(high):
+        mid = (low + high) / 2
+        if exponential_moment(bets, mid) > 1:
+            high = mid
+        else:
+            low = mid
+    return (low + high) / 2
+
+
+@dataclass
+class WeightedSessionResult:
+    """
+    Attributes:
+        weight: Likelihood ratio of the session's rolls, fair over tilted.
+        ruined: The bankroll and the table were both empty.
+        hit_target: Bankroll plus wagers reached the target.
+    """
+    net: float
+    rolls: int
+    weight: float
+    ruined: bool
+    hit_target: bool
+
+
+@dataclass
+class WeightedEstimate:
+    """
+    Attributes:
+        std_error: Standard error of the estimate.
+        ess: Effective sample size, (sum w)^2 / sum w^2. Far fewer effective
+            than actual sessions means the tilt is too strong.
+    """
+    estimate: float
+    ci_low: float
+    ci_high: float
+    std_error: float
+    ess: float
+    n_sessions: int
+
+    @property
+    def relative_error(self) -> float:
+        return self.std_error / self.estimate if self.estimate > 0 else inf
+
+
+def play_weighted_session(
+        strategy: Strategy,
+        dice: TiltedDice,
+        config: TableConfig,
+        init_bankroll: float,
+        max_rolls: int,
+        tilt: Optional[Tilt] = None,
+        target: Optional[float] = None
+    ) -> WeightedSessionResult:
+    """
+    Plays one session like tournament.play_session, with the likelihood
+    ratio of its rolls. Before every roll the dice are set to tilt(state).
+    The session also ends once bankroll plus wagers reach target.
+    """
+    strategy.reset()
+    dice.new_episode()
+    state = TableState(config, strategy.make_bets(), init_bankroll)
+    rolls = 0
+    ruined = hit_target = False
+    while rolls < max_rolls:
+        if target is not None and state.get_bankroll_size() + state.get_total_wager() >= target:
+            hit_target = True
+            break
+        strategy.act(state)
+        if state.get_bankroll_size() + state.get_total_wager() <= 0:
+            ruined = True
+            break
+        if tilt is not None:
+            dice.set_probs(tilt(state))
+        state.step(dice.next_roll())
+        rolls += 1
+    equity = state.get_bankroll_size() + state.get_total_wager()
+    return WeightedSessionResult(
+        net=equity - init_bankroll,
+        rolls=rolls,
+        weight=dice.weight,
+        ruined=ruined,
+        hit_target=hit_target
+    )
+
+
+def weighted_mean(values: Sequence[float], weights: Sequence[float], confidence: float = 0.95) -> WeightedEstimate:
+    """
+    Importance-sampling estimate of E[value] under fair dice: the mean of
+    w * value over sessions drawn from the tilted dice.
+    """
+    terms = Moments()
+    sum_w = sum_w2 = 0.0
+    for value, w in zip(values, weights):
+        terms.add(w * value)
+        sum_w += w
+        sum_w2 += w * w
+    if terms.count == 0:
+        raise ValueError("No sessions to estimate from.")
+    std_error = terms.sem() if terms.count > 1 else inf
+    half = NormalDist().inv_cdf(0.5 + confidence / 2) * std_error
+    return WeightedEstimate(
+        estimate=terms.mean,
+        ci_low=terms.mean - half,
+        ci_high=terms.mean + half,
+        std_error=std_error,
+        ess=sum_w * sum_w / sum_w2 if sum_w2 > 0 else 0.0,
+        n_sessions=terms.count
+    )
+
+
+def estimate_probability(
+        strategy: Strategy,
+        config: TableConfig,
+        init_bankroll: float,
+        max_rolls: int,
+        event: str,
+        n_sessions: int,
+        tilt: Optional[Tilt] = None,
+        target: Optional[float] = None,
+        seed: Optional[int] = None,
+        confidence: float = 0.95
+    ) -> WeightedEstimate:
+    """
+    Estimates the probability under fair dice that a session ends in ruin or
+    reaches target, from n_sessions sessions on tilted dice.
+
+    Args:
+        event: 'ruin' or 'target'.
+        tilt: Chooses the dice distribution before each roll. Fair dice
+            (plain Monte Carlo) if None.
+        target: Bankroll plus wagers that ends a session, e.g. the env's
+            max_bankroll. Required for the 'target' event.
+    """
+    if event not in EVENTS:
+        raise ValueError(f"'event' must be one of: {', '.join(EVENTS)}. Got: {event}")
+    if event == 'target' and target is None:
+        raise ValueError("The 'target' event needs a target bankroll.")
+
+    dice = TiltedDice(seed=seed)
+    hits, weights = [], []
+    for _ in range(n_sessions):
+        result = play_weighted_session(strategy, dice, config, init_bankroll, max_rolls, tilt, target)
+        hits.append(float(result.ruined if event == 'ruin' else result.hit_target))
+        weights.append(result.weight)
+    return weighted_mean(hits, weights, confidence)
@@ -0,0 +1,200 @@
+"""
+Runs independent sessions in parallel.
+
+On a free-threaded CPython build (3.13t or later with the GIL disabled)
+sessions run on a thread pool inside one process. With the GIL enabled,
+threads would take turns, so the runner falls back to a process pool.
+
+Thread-safety of the scalar engine: every piece of mutable state (table,
+bets, bankroll, phase, dice, strategy bookkeeping) lives in objects that
+belong to one session. Module-level tables such as ROLLS, TRUE_ODDS or the
+compiled bet specs are built at import time and only read afterwards. The
+one shared object a caller hands in, the strategy, is copied for every
+chunk of sessions, so its per-session bookkeeping is never shared between
+threads. Dice factories must return a fresh source per call (RandomDice,
+SequenceDice and RollTraceReader.session_dice all do).
+
+summarize_sessions folds each chunk into craps.stats accumulators inside
+the worker and merges them, so memory stays constant however many sessions
+are played.
+"""
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+from copy import deepcopy
+import os
+import sys
+from craps.dice import DiceSource, RandomDice
+from craps.seeding import SeedTree
+from craps.state import TableConfig
+from craps.stats import Moments, Summary
+from craps.strategies import Strategy
+from craps.tournament import SessionResult, play_session
+
+EXECUTORS = ('thread', 'process')
+
+
+def gil_enabled() -> bool:
+    """True unless running on a free-threaded build with the GIL disabled."""
+    is_enabled = getattr(sys, '_is_gil_enabled', None)
+    return True if is_enabled is None else is_enabled()
+
+
+def default_executor() -> str:
+    """'thread' on free-threaded builds, otherwise 'process'."""
+    return 'process' if gil_enabled() else 'thread'
+
+
+class SeededSessionDice:
+    """
+    Dice factory giving session i its own RandomDice stream, seeded with 128
+    bits from the SeedTree sequence at (0, 0, 0, i). Sessions play the same
+    rolls however they are split between workers, and metadata() records the
+    run like any other SeedTree. Picklable, so it can be sent to worker
+    processes.
+
+    Args:
+        seed: Root of the SeedTree. If None, fresh OS entropy is drawn.
+    """
+    def __init__(self, seed: Optional[int] = 0):
+        self.tree = SeedTree(seed)
+
+    def get_seed_path(self, session: int) -> Tuple[int, int, int, int]:
+        return (0, 0, 0, session)
+
+    def metadata(self) -> Dict[str, Any]:
+        return self.tree.metadata()
+
+    def __call__(self, session: int) -> DiceSource:
+        state = self.tree.sequence(*self.get_seed_path(session)).generate_state(4)
+        return RandomDice(int.from_bytes(state.tobytes(), 'little'))
+
+
+def _run_chunk(
+        strategy: Strategy,
+        sessions: Sequence[int],
+        session_dice: Callable[[int], DiceSource],
+        config: TableConfig,
+        init_bankroll: float,
+        max_rolls: int
+    ) -> List[SessionResult]:
+    # A private copy, so threads never share per-session bookkeeping
+    strategy = deepcopy(strategy)
+    return [play_session(strategy, session_dice(i), config, init_bankroll, max_rolls) for i in sessions]
+
+
+def _summarize_chunk(
+        strategy: Strategy,
+        sessions: Sequence[int],
+        session_dice: Callable[[int], DiceSource],
+        config: TableConfig,
+        init_bankroll: float,
+        max_rolls: int,
+        edges: Optional[Sequence[float]]
+    ) -> Tuple[Summary, Moments]:
+    strategy = deepcopy(strategy)
+    nets, rolls = Summary(edges), Moments()
+    for i in sessions:
+        result = play_session(strategy, session_dice(i), config, init_bankroll, max_rolls)
+        nets.add(result.net)
+        rolls.add(result.rolls)
+    return nets, rolls
+
+
+def map_session_chunks(
+        fn: Callable[..., Any],
+        strategy: Strategy,
+        sessions: range,
+        args: Tuple,
+        max_workers: Optional[int],
+        executor: Optional[str],
+        chunk_size: Optional[int]
+    ) -> List[Any]:
+    """
+    Splits sessions into chunks and returns fn(strategy, chunk, *args) for
+    each chunk, in order, running the chunks on a worker pool. fn must be a
+    module-level function for the process pool.
+    """
+    executor = executor or default_executor()
+    if executor not in EXECUTORS:
+        raise ValueError(f"'executor' must be one of: {', '.join(EXECUTORS)}. Got: {executor}")
+    max_workers = max_workers or os.cpu_count() or 1
+    chunk_size = chunk_size or max(1, -(-len(sessions) // (max_workers * 4)))
+    chunks = [sessions[start:start + chunk_size] for start in range(0, len(sessions), chunk_size)]
+
+    if max_workers == 1 or len(chunks) <= 1:
+        return [fn(strategy, chunk, *args) for chunk in chunks]
+
+    pool: Executor
+    if executor == 'thread':
+        pool = ThreadPoolExecutor(max_workers=max_workers)
+    else:
+        pool = ProcessPoolExecutor(max_workers=max_workers)
+    with pool:
+        futures = [pool.submit(fn, strategy, chunk, *args) for chunk in chunks]
+        return [future.result() for future in futures]
+
+
+def run_sessions(
+        strategy: Strategy,
+        n_sessions: int,
+        config: TableConfig,
+        init_bankroll: float,
+        max_rolls: int,
+        session_dice: Optional[Callable[[int], DiceSource]] = None,
+        seed: int = 0,
+        max_workers: Optional[int] = None,
+        executor: Optional[str] = None,
+        chunk_size: Optional[int] = None
+    ) -> List[SessionResult]:
+    """
+    Plays n_sessions independent sessions of a strategy, in parallel.
+
+    Results do not depend on the executor or the number of workers: session
+    i always plays the dice from session_dice(i).
+
+    Args:
+        session_dice: Returns the dice for session i. Must be picklable for
+            the process pool. Defaults to SeededSessionDice(seed).
+        max_workers: Defaults to the number of CPUs.
+        executor: 'thread', 'process', or None for default_executor().
+        chunk_size: Sessions per task. Defaults to about four tasks per worker.
+
+    Returns:
+        One SessionResult per session, in session order.
+    """
+    session_dice = session_dice or SeededSessionDice(seed)
+    args = (session_dice, config, init_bankroll, max_rolls)
+    chunks = map_session_chunks(_run_chunk, strategy, range(n_sessions), args, max_workers, executor, chunk_size)
+    return [r for chunk in chunks for r in chunk]
+
+
+def summarize_sessions(
+        strategy: Strategy,
+        n_sessions: int,
+        config: TableConfig,
+        init_bankroll: float,
+        max_rolls: int,
+        session_dice: Optional[Callable[[int], DiceSource]] = None,
+        seed: int = 0,
+        edges: Optional[Sequence[float]] = None,
+        max_workers: Optional[int] = None,
+        executor: Optional[str] = None,
+        chunk_size: Optional[int] = None
+    ) -> Tuple[Summary, Moments]:
+    """
+    Like run_sessions, but returns streaming summaries instead of one result
+    per session, so memory does not grow with n_sessions.
+
+    Args:
+        edges: Histogram edges for the session nets. No histogram if None.
+
+    Returns:
+        A Summary of session nets and the Moments of rolls per session.
+    """
+    session_dice = session_dice or SeededSessionDice(seed)
+    args = (session_dice, config, init_bankroll, max_rolls, edges)
+    nets, rolls = Summary(edges), Moments()
+    for chunk_nets, chunk_rolls in map_session_chunks(_summarize_chunk, strategy, range(n_sessions), args, max_workers, executor, chunk_size):
+        nets.merge(chunk_nets)
+        rolls.merge(chunk_rolls)
+    return nets, rolls
@@ -0,0 +1,233 @@
+"""
+Depth-limited expectimax planning and exact policy evaluation over TableState.
+
+The planner walks the game tree in place: it applies a candidate batch of
+wagers, steps the table once per roll total, and rewinds with
+TableState.snapshot()/restore() instead of copying the table. Chance nodes
+enumerate the 11 dice totals with their exact probabilities, or all 36
+dice pairs when a bet depends on more than the total.
+
+expected_step() and PolicyEvaluator use the same branching to evaluate a
+fixed policy exactly over a short horizon, without dice noise.
+"""
+from typing import Callable, Sequence, List, Tuple, Optional
+from dataclasses import dataclass
+from craps.dice import Roll, ROLLS, TOTALS, TOTAL_WAYS
+from craps.state import TableState, TableSnapshot, BetOp, ActionStatus
+
+# One roll per total with its probability, and every dice pair
+TOTAL_BRANCHES: Tuple[Tuple[Roll, float], ...] = tuple(
+    (next(roll for roll in ROLLS if roll.total() == total), ways / 36)
+    for total, ways in zip(TOTALS, TOTAL_WAYS)
+)
+OUTCOME_BRANCHES: Tuple[Tuple[Roll, float], ...] = tuple((roll, 1 / 36) for roll in ROLLS)
+
+# Candidate wager batches to consider in a state. Doing nothing is always
+# considered, so it does not need to be listed.
+ActionGenerator = Callable[[TableState], Sequence[List[BetOp]]]
+ValueFunction = Callable[[TableState], float]
+
+
+def equity(state: TableState) -> float:
+    """Bankroll plus wagers on the table."""
+    return state.get_bankroll_size() + state.get_total_wager()
+
+
+def roll_branches(state: TableState) -> Tuple[Tuple[Roll, float], ...]:
+    """
+    Returns the (roll, probability) pairs a chance node must expand: one per
+    total if every active bet settles by total alone, otherwise all 36.
+    """
+    if all(state.bets[key].settles_by_total for key in state.get_active_bets()):
+        return TOTAL_BRANCHES
+    return OUTCOME_BRANCHES
+
+
+@dataclass
+class Plan:
+    """
+    Attributes:
+        ops: The best wager batch to apply now ([] for doing nothing).
+        value: Its expected value under the planner's value function.
+        nodes: Number of states expanded to find it.
+    """
+    ops: List[BetOp]
+    value: float
+    nodes: int
+
+
+class ExpectimaxPlanner:
+    """
+    Chooses wagers by maximizing the expected value of `value` after
+    `depth` rolls, assuming the best action is taken before each roll.
+
+    Args:
+        actions: Returns the candidate wager batches in a state.
+        depth: Number of rolls to look ahead.
+        value: Scores leaf states. Defaults to equity().
+    """
+    def __init__(self, actions: ActionGenerator, depth: int = 2, value: Optional[ValueFunction] = None):
+        if depth < 1:
+            raise ValueError("depth must be at least 1.")
+        self.actions = actions
+        self.depth = depth
+        self.value = value or equity
+        self._nodes = 0
+
+    def plan(self, state: TableState) -> Plan:
+        """Returns the best wager batch for state. The state is left unchanged."""
+        self._nodes = 0
+        ops, value = self._decide(state, self.depth)
+        return Plan(ops=ops, value=value, nodes=self._nodes)
+
+    def evaluate(self, state: TableState, depth: Optional[int] = None) -> float:
+        """Returns the expectimax value of state. The state is left unchanged."""
+        self._nodes = 0
+        return self._decide(state, self.depth if depth is None else depth)[1]
+
+    def _decide(self, state: TableState, depth: int) -> Tuple[List[BetOp], float]:
+        self._nodes += 1
+        if depth == 0:
+            return [], self.value(state)
+        snapshot = state.snapshot()
+        best_ops, best_value = [], self._expect(state, depth)
+        for ops in self.actions(state):
+            if not ops or state.apply_bets(ops) != ActionStatus.OK:
+                continue
+            value = self._expect(state, depth)
+            state.restore(snapshot)
+            if value > best_value:
+                best_ops, best_value = ops, value
+        return best_ops, best_value
+
+    def _expect(self, state: TableState, depth: int) -> float:
+        snapshot = state.snapshot()
+        expected = 0.0
+        for roll, p in roll_branches(state):
+            state.step(roll)
+            expected += p * self._decide(state, depth - 1)[1]
+            state.restore(snapshot)
+        return expected
+
+
+@dataclass
+class Branch:
+    """
+    One successor of expected_step().
+
+    Attributes:
+        roll: A roll leading to this successor.
+        probability: Probability of the roll (of its total when branching
+            over totals).
+        snapshot: The table after the roll, for TableState.restore().
+        payout: What the roll paid into the bankroll.
+    """
+    roll: Roll
+    probability: float
+    snapshot: TableSnapshot
+    payout: float
+
+
+def expected_step(state: TableState, ops: Optional[List[BetOp]] = None) -> Tuple[ActionStatus, List[Branch]]:
+    """
+    Applies ops, then branches over every roll total (or every dice pair,
+    see roll_branches()) instead of sampling one. The state is left as it
+    was before the call.
+
+    Returns:
+        The status of ops and the weighted successor states. Rejected ops
+        are not applied, as in TableState.apply_bets().
+    """
+    before = state.snapshot()
+    status = state.apply_bets(ops) if ops else ActionStatus.OK
+    after_ops = state.snapshot()
+    branches = []
+    for roll, p in roll_branches(state):
+        bankroll = state.get_bankroll_size()
+        state.step(roll)
+        branches.append(Branch(roll, p, state.snapshot(), state.get_bankroll_size() - bankroll))
+        state.restore(after_ops)
+    state.restore(before)
+    return status, branches
+
+
+# Called before every roll. Returns wagers to apply or applies them itself
+# (e.g. Strategy.act), and must only depend on the table state.
+Policy = Callable[[TableState], Optional[List[BetOp]]]
+
+
+class PolicyEvaluator:
+    """
+    Exact expected equity of following a policy for a fixed number of rolls,
+    computed by branching over all outcomes instead of sampling episodes.
+
+    States that repeat across branches are solved once. They are matched on
+    (point, wagers, bankroll, last roll, rolls left), so policies may react
+    to the last roll as SixEightExplosion does. With bankroll_bucket set,
+    the bankroll is rounded to that bucket and the cached gain in equity is
+    reused, which is exact as long as the policy makes the same decisions
+    throughout a bucket.
+
+    Args:
+        policy: Chooses wagers before each roll.
+        horizon: Number of rolls to look ahead.
+        bankroll_bucket: Bucket width for matching bankrolls, or None to
+            require an exact match.
+    """
+    def __init__(self, policy: Policy, horizon: int, bankroll_bucket: Optional[float] = None):
+        if horizon < 0:
+            raise ValueError("horizon cannot be negative.")
+        self.policy = policy
+        self.horizon = horizon
+        self.bankroll_bucket = bankroll_bucket
+        self.clear()
+
+    def clear(self):
+        """Forgets all cached states."""
+        self._memo = {}
+        self.n_evaluated = 0
+        self.n_cache_hits = 0
+
+    def evaluate(self, state: TableState) -> float:
+        """
+        Returns the expected equity (bankroll plus wagers on the table)
+        after horizon rolls. The state is left unchanged.
+        """
+        return self._value(state, self.horizon)
+
+    def _key(self, state: TableState, depth: int) -> tuple:
+        bankroll = state.get_bankroll_size()
+        if self.bankroll_bucket:
+            bankroll = round(bankroll / self.bankroll_bucket)
+        return (
+            state.get_phase().point,
+            bankroll,
+            depth,
+            state.get_last_roll(),
+            tuple(bet.snapshot() for bet in state.bets.values())
+        )
+
+    def _value(self, state: TableState, depth: int) -> float:
+        base = equity(state)
+        if depth == 0:
+            return base
+        key = self._key(state, depth)
+        gain = self._memo.get(key)
+        if gain is not None:
+            self.n_cache_hits += 1
+            return base + gain
+
+        self.n_evaluated += 1
+        snapshot = state.snapshot()
+        ops = self.policy(state)
+        if ops:
+            state.apply_bets(ops)
+        after_ops = state.snapshot()
+        expected = 0.0
+        for roll, p in roll_branches(state):
+            state.step(roll)
+            expected += p * self._value(state, depth - 1)
+            state.restore(after_ops)
+        state.restore(snapshot)
+        self._memo[key] = expected - base
+        return expected
@@ -0,0 +1,98 @@
+"""
+Reproducible seeding for large parallel runs.
+
+Every random stream in a run is derived from one root seed through a fixed
+tree of numpy SeedSequence spawn keys:
+
+    root -> node -> worker -> env -> episode
+
+SeedSequence(root, spawn_key=(node, worker, env, episode)) is exactly the
+sequence reached by spawning children level by level, so any stream can be
+rebuilt directly from its path without creating its siblings. Streams with
+different paths are statistically independent, and two runs only share
+streams if they share the root.
+"""
+from typing import Any, Dict, Optional, Tuple
+import numpy as np
+from craps.dice import DiceSource, GeneratorDice, Roll
+
+LEVELS = ('node', 'worker', 'env', 'episode')
+
+
+class SeedTree:
+    """
+    Derives independent seed sequences, generators and dice streams from a
+    root seed.
+
+    Args:
+        root: Root entropy. If None, fresh OS entropy is drawn; it is kept in
+            `root` and in metadata() so the run can be reproduced.
+    """
+    def __init__(self, root: Optional[int] = None):
+        self.root: int = np.random.SeedSequence(root).entropy
+
+    def sequence(self, *path: int) -> np.random.SeedSequence:
+        """Returns the SeedSequence at path, e.g. (node, worker, env, episode).
+        Shorter paths give the parent of a whole subtree."""
+        if len(path) > len(LEVELS):
+            raise ValueError(f"Seed paths have at most {len(LEVELS)} levels: {', '.join(LEVELS)}.")
+        if any(i < 0 for i in path):
+            raise ValueError("Seed path indices cannot be negative.")
+        return np.random.SeedSequence(self.root, spawn_key=tuple(path))
+
+    def generator(self, *path: int) -> np.random.Generator:
+        """Returns a PCG64 generator seeded from the sequence at path."""
+        return np.random.Generator(np.random.PCG64(self.sequence(*path)))
+
+    def int_seed(self, *path: int) -> int:
+        """Returns a 32-bit integer seed for APIs that only take ints, such as
+        gymnasium's reset(seed=...) or stable-baselines3 models."""
+        return int(self.sequence(*path).generate_state(1)[0])
+
+    def dice(self, node: int = 0, worker: int = 0, env: int = 0) -> "EpisodeDice":
+        """Returns a dice source that reseeds itself for every episode of one env."""
+        return EpisodeDice(self, node, worker, env)
+
+    def metadata(self) -> Dict[str, Any]:
+        """What to record with a run to regenerate any of its streams."""
+        return {
+            'root': str(self.root),
+            'levels': list(LEVELS),
+            'bit_generator': 'PCG64',
+            'numpy': np.__version__,
+        }
+
+    @staticmethod
+    def from_metadata(metadata: Dict[str, Any]) -> "SeedTree":
+        if list(metadata.get('levels', LEVELS)) != list(LEVELS):
+            raise ValueError(f"Seed metadata uses levels {metadata['levels']}, expected {list(LEVELS)}.")
+        return SeedTree(int(metadata['root']))
+
+
+class EpisodeDice(DiceSource):
+    """
+    Dice for one env whose rolls in episode k come from the seed path
+    (node, worker, env, k). Episode k can be replayed on its own with
+    SeedTree.dice(...).start_episode(k), whatever ran before it.
+    """
+    def __init__(self, tree: SeedTree, node: int, worker: int, env: int):
+        self.tree = tree
+        self.path: Tuple[int, int, int] = (node, worker, env)
+        self.episode = -1
+        self._dice: Optional[GeneratorDice] = None
+
+    def new_episode(self):
+        self.start_episode(self.episode + 1)
+
+    def start_episode(self, episode: int):
+        """Jumps to the start of episode's stream."""
+        self.episode = episode
+        self._dice = GeneratorDice(self.tree.generator(*self.path, episode))
+
+    def get_seed_path(self) -> Tuple[int, int, int, int]:
+        return self.path + (self.episode,)
+
+    def next_roll(self) -> Roll:
+        if self._dice is None:
+            self.new_episode()
+        return self._dice.next_roll()
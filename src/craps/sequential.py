@@ -0,0 +1,226 @@
+"""
+Sequential strategy evaluation with automatic stopping.
+
+Sessions are simulated in growing batches until the confidence interval of
+the chosen metric is no wider than the requested width:
+
+    'loss_per_roll'  Expected loss per roll, total loss over total rolls.
+                     Delta-method interval for the ratio.
+    'ruin'           Probability that a session ends with an empty bankroll
+                     and table. Wilson score interval, which stays honest
+                     when no ruins have been seen yet.
+    'cpt'            CPT utility of session returns (net / init_bankroll),
+                     as in the gym reward. Bootstrap percentile interval.
+
+After each batch the size of the next one is projected from how far the
+interval is from the target (width shrinks as 1 / sqrt(n)), capped by a
+growth factor so one noisy early estimate cannot overshoot by much.
+
+The 'loss_per_roll' and 'ruin' metrics use constant memory. 'cpt' keeps one
+float per session, because the utility is computed from the whole sample.
+"""
+from typing import Callable, List, Optional, Tuple
+from dataclasses import dataclass, field
+from copy import deepcopy
+from math import ceil, inf, sqrt
+from statistics import NormalDist
+from craps.dice import DiceSource
+from craps.parallel import SeededSessionDice, map_session_chunks
+from craps.state import TableConfig
+from craps.stats import Covariance
+from craps.strategies import Strategy
+from craps.tournament import play_session
+
+METRICS = ('loss_per_roll', 'ruin', 'cpt')
+
+
+@dataclass
+class SequentialResult:
+    """
+    Attributes:
+        converged: Whether the interval reached the requested width before
+            max_sessions ran out.
+        n_rolls: Total rolls simulated across all sessions.
+        history: (sessions so far, interval width) after each batch.
+    """
+    metric: str
+    estimate: float
+    ci_low: float
+    ci_high: float
+    converged: bool
+    n_sessions: int
+    n_rolls: int
+    n_batches: int
+    history: List[Tuple[int, float]] = field(default_factory=list)
+
+    @property
+    def width(self) -> float:
+        return self.ci_high - self.ci_low
+
+
+class _Tally:
+    # Per-session sufficient statistics for every metric, mergeable across chunks
+    def __init__(self, keep_returns: bool):
+        self.net_rolls = Covariance()
+        self.rolls = 0
+        self.ruined = 0
+        self.returns: Optional[List[float]] = [] if keep_returns else None
+
+    @property
+    def count(self) -> int:
+        return self.net_rolls.count
+
+    def merge(self, other: "_Tally") -> "_Tally":
+        self.net_rolls.merge(other.net_rolls)
+        self.rolls += other.rolls
+        self.ruined += other.ruined
+        if self.returns is not None:
+            self.returns.extend(other.returns)
+        return self
+
+
+def _tally_chunk(
+        strategy: Strategy,
+        sessions: range,
+        session_dice: Callable[[int], DiceSource],
+        config: TableConfig,
+        init_bankroll: float,
+        max_rolls: int,
+        keep_returns: bool
+    ) -> _Tally:
+    strategy = deepcopy(strategy)
+    tally = _Tally(keep_returns)
+    for i in sessions:
+        result = play_session(strategy, session_dice(i), config, init_bankroll, max_rolls)
+        tally.net_rolls.add(result.net, result.rolls)
+        tally.rolls += result.rolls
+        tally.ruined += result.net <= -init_bankroll
+        if keep_returns:
+            tally.returns.append(result.net / init_bankroll)
+    return tally
+
+
+def loss_per_roll_ci(net_rolls: Covariance, confidence: float) -> Tuple[float, float, float]:
+    """Estimate and delta-method interval of -sum(net) / sum(rolls)."""
+    n, mean_rolls = net_rolls.count, net_rolls.y.mean
+    if n < 2 or mean_rolls <= 0:
+        return 0.0, -inf, inf
+    ratio = net_rolls.x.mean / mean_rolls
+    var = net_rolls.x.variance() - 2 * ratio * net_rolls.covariance() + ratio ** 2 * net_rolls.y.variance()
+    half = NormalDist().inv_cdf(0.5 + confidence / 2) * sqrt(max(var, 0.0) / n) / mean_rolls
+    return -ratio, -ratio - half, -ratio + half
+
+
+def wilson_ci(successes: int, n: int, confidence: float) -> Tuple[float, float, float]:
+    """Estimate and Wilson score interval of a binomial proportion."""
+    if n == 0:
+        return 0.0, 0.0, 1.0
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    p = successes / n
+    denom = 1 + z * z / n
+    centre = (p + z * z / (2 * n)) / denom
+    half = z / denom * sqrt(p * (1 - p) / n + z * z / (4 * n * n))
+    return p, max(0.0, centre - half), min(1.0, centre + half)
+
+
+def cpt_ci(returns: List[float], confidence: float, n_bootstrap: int, seed: int) -> Tuple[float, float, float]:
+    """CPT utility of the returns and a bootstrap percentile interval."""
+    import numpy as np
+    from craps.gym.reward import cpt_utility_from_returns
+
+    if len(returns) < 2:
+        return 0.0, -inf, inf
+    sample = np.asarray(returns)
+    rng = np.random.default_rng(seed)
+    boot = [float(cpt_utility_from_returns(sample[rng.integers(0, len(sample), len(sample))]))
+            for _ in range(n_bootstrap)]
+    alpha = (1 - confidence) / 2
+    low, high = np.quantile(boot, [alpha, 1 - alpha])
+    return float(cpt_utility_from_returns(sample)), float(low), float(high)
+
+
+def evaluate_until(
+        strategy: Strategy,
+        config: TableConfig,
+        init_bankroll: float,
+        max_rolls: int,
+        ci_width: float,
+        metric: str = 'loss_per_roll',
+        confidence: float = 0.95,
+        initial_sessions: int = 1000,
+        max_sessions: int = 1_000_000,
+        growth: float = 4.0,
+        session_dice: Optional[Callable[[int], DiceSource]] = None,
+        seed: int = 0,
+        n_bootstrap: int = 200,
+        max_workers: Optional[int] = None,
+        executor: Optional[str] = None
+    ) -> SequentialResult:
+    """
+    Simulates sessions of up to max_rolls rolls in growing batches until the
+    confidence interval of metric is at most ci_width wide.
+
+    Session i always plays session_dice(i), so a run with a larger
+    max_sessions or a smaller ci_width extends a shorter one rather than
+    replacing it.
+
+    Args:
+        ci_width: Target full width (high - low) of the interval, in the
+            metric's units.
+        initial_sessions: Size of the first batch.
+        max_sessions: Stop here even if the target was not reached.
+        growth: Each batch is at most (growth - 1) times the sessions so far.
+        session_dice: Dice for session i. Defaults to SeededSessionDice(seed).
+        n_bootstrap: Resamples per interval for the 'cpt' metric.
+        max_workers, executor: Passed to the parallel session runner.
+    """
+    if metric not in METRICS:
+        raise ValueError(f"'metric' must be one of: {', '.join(METRICS)}. Got: {metric}")
+    if ci_width <= 0:
+        raise ValueError("'ci_width' must be positive.")
+    if growth <= 1:
+        raise ValueError("'growth' must be greater than 1.")
+    if initial_sessions < 1:
+        raise ValueError("'initial_sessions' must be at least 1.")
+    if max_sessions < 1:
+        raise ValueError("'max_sessions' must be at least 1.")
+
+    session_dice = session_dice or SeededSessionDice(seed)
+    keep_returns = metric == 'cpt'
+    args = (session_dice, config, init_bankroll, max_rolls, keep_returns)
+    tally = _Tally(keep_returns)
+    history: List[Tuple[int, float]] = []
+    batch = min(initial_sessions, max_sessions)
+    while True:
+        sessions = range(tally.count, tally.count + batch)
+        for chunk in map_session_chunks(_tally_chunk, strategy, sessions, args, max_workers, executor, None):
+            tally.merge(chunk)
+
+        if metric == 'loss_per_roll':
+            estimate, low, high = loss_per_roll_ci(tally.net_rolls, confidence)
+        elif metric == 'ruin':
+            estimate, low, high = wilson_ci(tally.ruined, tally.count, confidence)
+        else:
+            estimate, low, high = cpt_ci(tally.returns, confidence, n_bootstrap, seed + len(history))
+        width = high - low
+        history.append((tally.count, width))
+
+        converged = width <= ci_width
+        if converged or tally.count >= max_sessions:
+            break
+        # Width ~ 1 / sqrt(n): aim slightly past the projected sessions needed
+        needed = ceil(tally.count * (width / ci_width) ** 2 * 1.1) if width < inf else inf
+        # At least one session, or a small growth would truncate to none
+        batch = max(1, int(min(needed - tally.count, tally.count * (growth - 1), max_sessions - tally.count)))
+
+    return SequentialResult(
+        metric=metric,
+        estimate=estimate,
+        ci_low=low,
+        ci_high=high,
+        converged=converged,
+        n_sessions=tally.count,
+        n_rolls=tally.rolls,
+        n_batches=len(history),
+        history=history
+    )
@@ -1,10 +1,11 @@
 from dataclasses import dataclass
-from typing import Optional, Dict
+from enum import IntEnum
+from typing import Optional, Dict, Iterable, Tuple
 from craps.bankroll import Bankroll
 from craps.phase import TablePhase, transition_phase
-from craps.dice import Roll
+from craps.dice import Roll, ROLLS, TOTALS, TOTAL_WAYS
 from craps.bets.model import Bet
-from craps.exceptions import IllegalAction
+from craps.exceptions import IllegalAction, InsufficientFunds
 
 @dataclass
 class TableConfig:
@@ -16,6 +17,31 @@ class TableConfig:
     odds_max: float
     prop_min: float
 
+@dataclass
+class RollRisk:
+    """
+    Exact one-roll statistics of the change in table equity (bankroll plus
+    wagers on the table) for the current layout.
+    """
+    expected_value: float
+    variance: float
+    worst_case: float
+    best_case: float
+
+class ActionStatus(IntEnum):
+    """
+    Result of validating a batch of bet operations with TableState.check_bets().
+    """
+    OK = 0
+    ILLEGAL = 1
+    INSUFFICIENT_FUNDS = 2
+
+# (bet_name, bet_type, amount, target) where bet_type is 'stake' or 'odds'
+BetOp = Tuple[str, str, float, Optional[int]]
+
+# (point, bankroll, roll_count, last_roll, active_bets, bet_snapshots)
+TableSnapshot = Tuple[Optional[int], float, int, Optional[Roll], frozenset, Tuple[Tuple, ...]]
+
 class TableState:
     """
     Represents the current state of the table including bets and phase state.
@@ -40,13 +66,27 @@ class TableState:
         # Bets
         self.bets = bets
 
+        # Keys of bets with money on them. Kept up to date by the set_bet_*
+        # methods and by step(); call refresh_active_bets() after changing a
+        # bet directly.
+        self._active = set()
+        self.refresh_active_bets()
+
     def step(self, roll: Roll):
         """
-        Progresses the simulator by one roll.
+        Progresses the simulator by one roll. Bets with nothing wagered only
+        have their phase advanced.
         """
-        for _, bet in self.bets.items():
+        active = self._active
+        for key, bet in self.bets.items():
+            if key not in active:
+                bet.advance_phase(roll)
+                continue
             winnings = bet.settle(roll)
-            self._bankroll.deposit(winnings)
+            if winnings:
+                self._bankroll.deposit(winnings)
+            if not bet.has_wagers():
+                active.discard(key)
         
         self._phase = transition_phase(self._phase, roll)
         self._roll_count += 1
@@ -62,6 +102,7 @@ class TableState:
         delta = curr - amount
         self._bankroll.update(delta)
         self.bets[key].set_stake(amount, target=target)
+        self._update_active(key, amount)
 
     def get_bet_stake(self, key: str, target: Optional[int]=None) -> float:
         return self.bets[key].get_stake(target=target)
@@ -82,12 +123,196 @@ class TableState:
         delta = curr_odds - amount
         self._bankroll.update(delta)
         self.bets[key].set_odds(amount, target=target)
+        self._update_active(key, amount)
 
     def get_bet_odds(self, key: str, target: Optional[int]=None) -> float:
         return self.bets[key].get_odds(target=target)
 
+    def check_bets(self, ops: Iterable[BetOp]) -> ActionStatus:
+        """
+        Validates a batch of stake/odds changes without applying them.
+
+        Ops are checked in order against the same table limits, odds caps and
+        bankroll rules that set_bet_stake() and set_bet_odds() enforce, so a
+        batch that returns OK can be applied with those methods without raising.
+        Whether a bet accepts a wager (can_set_stake/can_set_odds) is checked
+        against the current bet state.
+        """
+        config = self.config
+        bankroll = self._bankroll.get_size()
+        pending = {}
+        for key, bet_type, amount, target in ops:
+            bet = self.bets[key]
+            min_bet = config.prop_min if bet.is_prop else config.table_min
+            if amount > config.table_max or (amount != 0 and amount < min_bet):
+                return ActionStatus.ILLEGAL
+
+            if bet_type == 'stake':
+                if amount > 0 and not bet.can_set_stake(target=target):
+                    return ActionStatus.ILLEGAL
+                curr = pending.get((key, 'stake', target))
+                if curr is None:
+                    curr = bet.get_stake(target=target)
+            else:
+                stake_target = target if target in bet.get_stake_targets() else None
+                stake = pending.get((key, 'stake', stake_target))
+                if stake is None:
+                    stake = bet.get_stake(target=stake_target)
+                if amount > stake * config.odds_max:
+                    return ActionStatus.ILLEGAL
+                if amount > 0 and not bet.can_set_odds(target=target):
+                    return ActionStatus.ILLEGAL
+                curr = pending.get((key, 'odds', target))
+                if curr is None:
+                    curr = bet.get_odds(target=target)
+
+            cost = amount - curr
+            if cost > bankroll:
+                return ActionStatus.INSUFFICIENT_FUNDS
+            bankroll -= cost
+            pending[(key, bet_type, target)] = amount
+        return ActionStatus.OK
+
+    def apply_bets(self, ops: Iterable[BetOp]) -> ActionStatus:
+        """
+        Applies a batch of stake/odds changes transactionally.
+
+        The batch is validated with check_bets() and then committed. If any
+        operation still fails while committing, the bets and bankroll are
+        rolled back from a compact snapshot, so either every change is applied
+        or none are.
+
+        Returns:
+            ActionStatus.OK if the batch was applied, otherwise the reason it
+            was rejected.
+        """
+        ops = list(ops)
+        status = self.check_bets(ops)
+        if status != ActionStatus.OK:
+            return status
+
+        snapshot = self._snapshot_wagers()
+        try:
+            for key, bet_type, amount, target in ops:
+                if bet_type == 'stake':
+                    self.set_bet_stake(key, amount, target=target)
+                else:
+                    self.set_bet_odds(key, amount, target=target)
+        except IllegalAction:
+            self._restore_wagers(snapshot)
+            return ActionStatus.ILLEGAL
+        except InsufficientFunds:
+            self._restore_wagers(snapshot)
+            return ActionStatus.INSUFFICIENT_FUNDS
+        return ActionStatus.OK
+
+    def snapshot(self) -> TableSnapshot:
+        """
+        Returns a compact, immutable record of the whole table: phase,
+        bankroll, roll tracking and every bet. Much cheaper than deepcopy,
+        for planners that explore many branches from one state.
+        """
+        return (
+            self._phase.point,
+            self._bankroll.get_size(),
+            self._roll_count,
+            self._last_roll,
+            frozenset(self._active),
+            tuple(bet.snapshot() for bet in self.bets.values())
+        )
+
+    def restore(self, snapshot: TableSnapshot):
+        """
+        Returns the table to a state recorded by snapshot(). The bets must
+        be the same ones the snapshot was taken from.
+        """
+        point, size, roll_count, last_roll, active, bet_snapshots = snapshot
+        self._phase = TablePhase(point=point)
+        self._bankroll.restore(size)
+        self._roll_count = roll_count
+        self._last_roll = last_roll
+        self._active = set(active)
+        for bet, bet_snapshot in zip(self.bets.values(), bet_snapshots):
+            bet.restore(bet_snapshot)
+
+    def _snapshot_wagers(self) -> Tuple:
+        return (self._bankroll.get_size(), tuple(bet.snapshot() for bet in self.bets.values()))
+
+    def _restore_wagers(self, snapshot: Tuple):
+        size, bet_snapshots = snapshot
+        self._bankroll.restore(size)
+        for bet, bet_snapshot in zip(self.bets.values(), bet_snapshots):
+            bet.restore(bet_snapshot)
+        self.refresh_active_bets()
+
+    def _update_active(self, key: str, amount: float):
+        if amount > 0:
+            self._active.add(key)
+        elif not self.bets[key].has_wagers():
+            self._active.discard(key)
+
+    def refresh_active_bets(self):
+        """
+        Rebuilds the set of bets that step() settles. Only needed when bets
+        are changed directly instead of through this TableState.
+        """
+        self._active = {key for key, bet in self.bets.items() if bet.has_wagers()}
+
+    def get_active_bets(self) -> Tuple[str, ...]:
+        """Returns the keys of bets with a non-zero stake or odds."""
+        return tuple(key for key in self.bets if key in self._active)
+
+    def get_payouts_by_total(self) -> Tuple[float, ...]:
+        """
+        Returns the bankroll deposit the next roll would make for each total
+        2-12, without changing the table.
+        """
+        return self._sum_vectors(lambda bet: bet.get_payouts_by_total(), len(TOTALS))
+
+    def get_payouts_by_outcome(self) -> Tuple[float, ...]:
+        """
+        Like get_payouts_by_total(), for each of the 36 outcomes in ROLLS.
+        """
+        return self._sum_vectors(lambda bet: bet.get_payouts_by_outcome(), len(ROLLS))
+
+    def get_net_by_total(self) -> Tuple[float, ...]:
+        """
+        Returns the change in bankroll plus wagers on the table that the next
+        roll would cause for each total 2-12.
+        """
+        return self._sum_vectors(lambda bet: bet.get_net_by_total(), len(TOTALS))
+
+    def get_net_by_outcome(self) -> Tuple[float, ...]:
+        """
+        Like get_net_by_total(), for each of the 36 outcomes in ROLLS.
+        """
+        return self._sum_vectors(lambda bet: bet.get_net_by_outcome(), len(ROLLS))
+
+    def get_roll_risk(self) -> RollRisk:
+        """
+        Returns the exact expected value, variance, worst and best case of
+        the change in equity over the next roll.
+        """
+        if all(self.bets[key].settles_by_total for key in self._active):
+            net, weights = self.get_net_by_total(), TOTAL_WAYS
+        else:
+            net, weights = self.get_net_by_outcome(), (1,) * len(ROLLS)
+        mean = sum(w * x for w, x in zip(weights, net)) / 36
+        variance = sum(w * (x - mean) ** 2 for w, x in zip(weights, net)) / 36
+        return RollRisk(expected_value=mean, variance=variance, worst_case=min(net), best_case=max(net))
+
+    def _sum_vectors(self, vector, size: int) -> Tuple[float, ...]:
+        totals = [0.0] * size
+        for key in self.get_active_bets():
+            for i, value in enumerate(vector(self.bets[key])):
+                totals[i] += value
+        return tuple(totals)
+
     def get_bankroll_size(self) -> float:
         return self._bankroll.get_size()
+
+    def get_total_wager(self) -> float:
+        return sum(bet.get_total_wager() for bet in self.bets.values())
     
     def get_phase(self) -> TablePhase:
         return self._phase
@@ -0,0 +1,335 @@
+"""
+Streaming, mergeable statistics accumulators.
+
+Each accumulator keeps a fixed-size summary of the values added to it, so
+a study over any number of sessions uses constant memory. Two accumulators
+of the same kind can be merged, which gives the same result (exactly for
+Moments, Covariance and Histogram, approximately for TDigest) as adding
+every value to one of them. Workers can summarize their own sessions and
+send the small summaries back instead of lists of results.
+
+Pure Python with no numpy, so accumulators are cheap to pickle between
+processes and importing this module stays light.
+"""
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from bisect import bisect_right
+from math import asin, inf, pi, sin, sqrt
+from statistics import NormalDist
+
+
+class Moments:
+    """
+    Count, mean, variance, min and max, updated with Welford's algorithm
+    and merged with Chan's parallel formula.
+    """
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = inf
+        self.max = -inf
+
+    def add(self, x: float):
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+        if x < self.min:
+            self.min = x
+        if x > self.max:
+            self.max = x
+
+    def extend(self, xs: Iterable[float]):
+        for x in xs:
+            self.add(x)
+
+    def merge(self, other: "Moments") -> "Moments":
+        """Adds other's values to this accumulator and returns it."""
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            self.min, self.max = other.min, other.max
+            return self
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    def variance(self) -> float:
+        """Sample variance (n - 1 denominator), 0 for fewer than two values."""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    def std(self) -> float:
+        return sqrt(self.variance())
+
+    def sem(self) -> float:
+        """Standard error of the mean."""
+        return sqrt(self.variance() / self.count) if self.count else inf
+
+    def ci(self, confidence: float = 0.95) -> Tuple[float, float]:
+        """Normal-approximation confidence interval for the mean."""
+        half = NormalDist().inv_cdf(0.5 + confidence / 2) * self.sem()
+        return self.mean - half, self.mean + half
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            'count': self.count,
+            'mean': self.mean,
+            'std': self.std(),
+            'min': self.min,
+            'max': self.max,
+        }
+
+
+class Covariance:
+    """
+    Moments of two paired streams plus their co-moment, for covariances and
+    ratio estimators such as total net over total rolls.
+    """
+    def __init__(self):
+        self.x = Moments()
+        self.y = Moments()
+        self.c = 0.0
+
+    @property
+    def count(self) -> int:
+        return self.x.count
+
+    def add(self, x: float, y: float):
+        dx = x - self.x.mean
+        self.x.add(x)
+        self.y.add(y)
+        self.c += dx * (y - self.y.mean)
+
+    def merge(self, other: "Covariance") -> "Covariance":
+        n, m = self.count, other.count
+        if m:
+            dx, dy = other.x.mean - self.x.mean, other.y.mean - self.y.mean
+            self.c += other.c + dx * dy * n * m / (n + m)
+            self.x.merge(other.x)
+            self.y.merge(other.y)
+        return self
+
+    def covariance(self) -> float:
+        """Sample covariance (n - 1 denominator)."""
+        return self.c / (self.count - 1) if self.count > 1 else 0.0
+
+    def correlation(self) -> float:
+        denom = self.x.std() * self.y.std()
+        return self.covariance() / denom if denom > 0 else 0.0
+
+
+class TDigest:
+    """
+    Approximate quantiles from a merging t-digest.
+
+    Values are kept as weighted centroids, small near the tails and larger
+    in the middle, so extreme quantiles (such as the 1% worst bankroll) stay
+    accurate. About `compression` centroids are kept however many values are
+    added. The exact min and max are tracked as well.
+
+    Args:
+        compression: Controls size against accuracy. 100 gives quantile
+            errors well under 1% of rank.
+    """
+    def __init__(self, compression: float = 100.0):
+        if compression <= 0:
+            raise ValueError("Compression must be positive.")
+        self.compression = compression
+        self.centroids: List[Tuple[float, float]] = []
+        self.count = 0.0
+        self.min = inf
+        self.max = -inf
+        self._buffer: List[Tuple[float, float]] = []
+        self._buffer_size = int(5 * compression)
+
+    def add(self, x: float, weight: float = 1.0):
+        self._buffer.append((x, weight))
+        self.count += weight
+        if x < self.min:
+            self.min = x
+        if x > self.max:
+            self.max = x
+        if len(self._buffer) >= self._buffer_size:
+            self._compress()
+
+    def extend(self, xs: Iterable[float]):
+        for x in xs:
+            self.add(x)
+
+    def merge(self, other: "TDigest") -> "TDigest":
+        """Adds other's centroids to this digest and returns it."""
+        other._compress()
+        self._buffer.extend(other.centroids)
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress()
+        return self
+
+    def _q_limit(self, q: float) -> float:
+        # Largest quantile a centroid starting at q may reach: one unit of the
+        # k1 scale function k(q) = compression / (2 pi) * asin(2q - 1)
+        k = self.compression / (2 * pi) * asin(2 * q - 1) + 1
+        return (sin(min(k, self.compression / 4) * 2 * pi / self.compression) + 1) / 2
+
+    def _compress(self):
+        if not self._buffer:
+            return
+        items = sorted(self.centroids + self._buffer)
+        self._buffer = []
+        total = sum(w for _, w in items)
+        merged = []
+        before = 0.0
+        mean, weight = items[0]
+        limit = total * self._q_limit(0.0)
+        for m, w in items[1:]:
+            if before + weight + w <= limit:
+                weight += w
+                mean += (m - mean) * w / weight
+            else:
+                merged.append((mean, weight))
+                before += weight
+                limit = total * self._q_limit(before / total)
+                mean, weight = m, w
+        merged.append((mean, weight))
+        self.centroids = merged
+
+    def quantile(self, q: float) -> float:
+        """Estimated q-quantile, interpolating between centroid centres."""
+        if not 0 <= q <= 1:
+            raise ValueError(f"Quantile must be between 0 and 1. Got: {q}")
+        self._compress()
+        if not self.centroids:
+            raise ValueError("No values have been added.")
+        target = q * self.count
+        # (position, value) knots: the min, each centroid's centre, the max
+        knots = [(0.0, self.min)]
+        before = 0.0
+        for mean, weight in self.centroids:
+            knots.append((before + weight / 2, mean))
+            before += weight
+        knots.append((self.count, self.max))
+        for (p0, v0), (p1, v1) in zip(knots, knots[1:]):
+            if target <= p1:
+                if p1 == p0:
+                    return v1
+                return v0 + (v1 - v0) * (target - p0) / (p1 - p0)
+        return self.max
+
+    def quantiles(self, qs: Sequence[float]) -> List[float]:
+        return [self.quantile(q) for q in qs]
+
+    def __getstate__(self) -> Dict[str, Any]:
+        self._compress()
+        return self.__dict__
+
+
+class Histogram:
+    """
+    Counts over fixed bin edges. Bin i holds edges[i] <= x < edges[i + 1],
+    except the last bin, which also holds x == edges[-1]. Values outside
+    the edges are counted in `underflow` and `overflow`.
+
+    Histograms only merge with others built on the same edges.
+    """
+    def __init__(self, edges: Sequence[float]):
+        edges = [float(e) for e in edges]
+        if len(edges) < 2 or any(b <= a for a, b in zip(edges, edges[1:])):
+            raise ValueError("Histogram edges must be at least two strictly increasing values.")
+        self.edges = edges
+        self.counts = [0] * (len(edges) - 1)
+        self.underflow = 0
+        self.overflow = 0
+
+    @staticmethod
+    def linear(low: float, high: float, n_bins: int) -> "Histogram":
+        """A histogram with n_bins equal-width bins from low to high."""
+        return Histogram([low + (high - low) * i / n_bins for i in range(n_bins + 1)])
+
+    def add(self, x: float, count: int = 1):
+        if x < self.edges[0]:
+            self.underflow += count
+        elif x > self.edges[-1]:
+            self.overflow += count
+        else:
+            self.counts[min(bisect_right(self.edges, x) - 1, len(self.counts) - 1)] += count
+
+    def extend(self, xs: Iterable[float]):
+        for x in xs:
+            self.add(x)
+
+    def merge(self, other: "Histogram") -> "Histogram":
+        if other.edges != self.edges:
+            raise ValueError("Cannot merge histograms with different edges.")
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.underflow += other.underflow
+        self.overflow += other.overflow
+        return self
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts) + self.underflow + self.overflow
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'edges': self.edges,
+            'counts': self.counts,
+            'underflow': self.underflow,
+            'overflow': self.overflow,
+        }
+
+
+class Summary:
+    """
+    Moments, quantiles and optionally a histogram of one stream of values.
+
+    Args:
+        edges: Histogram bin edges. No histogram is kept if None.
+        compression: TDigest compression.
+    """
+    def __init__(self, edges: Optional[Sequence[float]] = None, compression: float = 100.0):
+        self.moments = Moments()
+        self.digest = TDigest(compression)
+        self.histogram = Histogram(edges) if edges is not None else None
+
+    def add(self, x: float):
+        self.moments.add(x)
+        self.digest.add(x)
+        if self.histogram is not None:
+            self.histogram.add(x)
+
+    def extend(self, xs: Iterable[float]):
+        for x in xs:
+            self.add(x)
+
+    def merge(self, other: "Summary") -> "Summary":
+        self.moments.merge(other.moments)
+        self.digest.merge(other.digest)
+        if self.histogram is not None and other.histogram is not None:
+            self.histogram.merge(other.histogram)
+        elif self.histogram is not None or other.histogram is not None:
+            raise ValueError("Cannot merge a summary with a histogram into one without.")
+        return self
+
+    def to_dict(self, qs: Sequence[float] = (0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99)) -> Dict[str, Any]:
+        stats: Dict[str, Any] = self.moments.to_dict()
+        if self.moments.count:
+            stats['quantiles'] = dict(zip((str(q) for q in qs), self.digest.quantiles(qs)))
+        if self.histogram is not None:
+            stats['histogram'] = self.histogram.to_dict()
+        return stats
+
+
+def merge_all(accumulators: Iterable[Any]) -> Any:
+    """Merges accumulators of one kind into the first and returns it."""
+    accumulators = iter(accumulators)
+    first = next(accumulators)
+    for acc in accumulators:
+        first.merge(acc)
+    return first
@@ -0,0 +1,157 @@
+"""
+Reference betting strategies that can be played against any dice source.
+
+A strategy creates its own bets for each session and places wagers before
+every roll through TableState.apply_bets(), so rejected wagers (e.g. when the
+bankroll runs low) are simply skipped.
+"""
+from abc import ABC, abstractmethod
+from math import ceil
+from typing import Dict, List
+from craps.bets.model import Bet
+from craps.bets import PassLine, ComeBets, PlaceBets, Field
+from craps.constants import POINTS
+from craps.phase import TablePhase
+from craps.state import TableState, BetOp
+
+
+class Strategy(ABC):
+    """A betting strategy that acts on a TableState before every roll."""
+
+    name: str = "strategy"
+
+    @abstractmethod
+    def make_bets(self) -> Dict[str, Bet]:
+        """Return fresh bet instances for a new session."""
+        raise NotImplementedError
+
+    def reset(self):
+        """Reset any per-session bookkeeping. Called before each session."""
+        pass
+
+    @abstractmethod
+    def act(self, state: TableState):
+        """Place, press or take down wagers before the next roll."""
+        raise NotImplementedError
+
+
+def _round_up(amount: float, increment: int) -> float:
+    return float(ceil(amount / increment) * increment)
+
+
+class PassLineOdds(Strategy):
+    """A pass line bet with odds behind it on every point."""
+
+    name = "pass_line_odds"
+
+    def __init__(self, unit: float = 15.0, odds_multiple: float = 2.0):
+        self.unit = unit
+        self.odds_multiple = odds_multiple
+
+    def make_bets(self) -> Dict[str, Bet]:
+        return {'pass_line': PassLine(TablePhase())}
+
+    def act(self, state: TableState):
+        point = state.get_phase().point
+        if point is None:
+            if state.get_bet_stake('pass_line') == 0:
+                state.apply_bets([('pass_line', 'stake', self.unit, None)])
+        elif state.get_bet_odds('pass_line', target=point) == 0 and state.get_bet_stake('pass_line') > 0:
+            state.apply_bets([('pass_line', 'odds', self.unit * self.odds_multiple, point)])
+
+
+class IronCross(Strategy):
+    """Field plus place bets on the 5, 6 and 8 whenever a point is on."""
+
+    name = "iron_cross"
+
+    def __init__(self, unit: float = 15.0):
+        self.unit = unit
+
+    def make_bets(self) -> Dict[str, Bet]:
+        init_phase = TablePhase()
+        return {'place_bets': PlaceBets(init_phase), 'field': Field(init_phase)}
+
+    def act(self, state: TableState):
+        if state.get_phase().point is None:
+            return
+        ops: List[BetOp] = [('field', 'stake', self.unit, None)]
+        for target, increment in ((5, 5), (6, 6), (8, 6)):
+            if state.get_bet_stake('place_bets', target=target) == 0:
+                ops.append(('place_bets', 'stake', _round_up(self.unit, increment), target))
+        state.apply_bets(ops)
+
+
+class SixEightExplosion(Strategy):
+    """Place the 6 and 8, and press both after the first hit."""
+
+    name = "six_eight_explosion"
+
+    def __init__(self, unit: float = 18.0, press_to: float = 30.0):
+        self.unit = unit
+        self.press_to = press_to
+        self.reset()
+
+    def make_bets(self) -> Dict[str, Bet]:
+        return {'place_bets': PlaceBets(TablePhase())}
+
+    def reset(self):
+        self._hits = 0
+        self._was_on = False
+
+    def act(self, state: TableState):
+        point = state.get_phase().point
+        stakes = {t: state.get_bet_stake('place_bets', target=t) for t in (6, 8)}
+        last_roll = state.get_last_roll()
+        if self._was_on and last_roll is not None and stakes.get(last_roll.total(), 0) > 0:
+            self._hits += 1
+        self._was_on = point is not None
+        if point is None:
+            return
+        if stakes[6] == 0 and stakes[8] == 0:
+            # Fresh start after a seven-out
+            self._hits = 0
+        amount = self.press_to if self._hits > 0 else self.unit
+        ops = [('place_bets', 'stake', amount, t) for t in (6, 8) if stakes[t] != amount]
+        if ops:
+            state.apply_bets(ops)
+
+
+class ThreePointMolly(Strategy):
+    """Pass line plus up to two come bets, with odds on every number."""
+
+    name = "three_point_molly"
+
+    def __init__(self, unit: float = 15.0, odds_multiple: float = 2.0, max_numbers: int = 3):
+        self.unit = unit
+        self.odds_multiple = odds_multiple
+        self.max_numbers = max_numbers
+
+    def make_bets(self) -> Dict[str, Bet]:
+        init_phase = TablePhase()
+        return {'pass_line': PassLine(init_phase), 'come_bets': ComeBets(init_phase)}
+
+    def act(self, state: TableState):
+        point = state.get_phase().point
+        if point is None:
+            if state.get_bet_stake('pass_line') == 0:
+                state.apply_bets([('pass_line', 'stake', self.unit, None)])
+            return
+
+        odds = self.unit * self.odds_multiple
+        ops: List[BetOp] = []
+        covered = 0
+        if state.get_bet_stake('pass_line') > 0:
+            covered += 1
+            if state.get_bet_odds('pass_line', target=point) == 0:
+                ops.append(('pass_line', 'odds', odds, point))
+        for target in POINTS:
+            if state.get_bet_stake('come_bets', target=target) > 0:
+                covered += 1
+                if state.get_bet_odds('come_bets', target=target) == 0:
+                    ops.append(('come_bets', 'odds', odds, target))
+        pending = state.get_bet_stake('come_bets')
+        if pending == 0 and covered < self.max_numbers:
+            ops.append(('come_bets', 'stake', self.unit, None))
+        if ops:
+            state.apply_bets(ops)
@@ -0,0 +1,152 @@
+"""
+Common-random-numbers tournaments.
+
+Every strategy plays each session against the same dice stream, so their
+results are positively correlated and the paired differences between them
+have far less variance than comparisons on independent dice.
+"""
+from typing import Callable, Optional, Sequence, List, Dict, Tuple
+from dataclasses import dataclass
+from statistics import NormalDist, fmean, variance
+from math import sqrt
+from craps.dice import Roll, DiceSource, RandomDice, SequenceDice
+from craps.state import TableConfig, TableState
+from craps.strategies import Strategy
+
+
+@dataclass
+class SessionResult:
+    """
+    Attributes:
+        net: Final bankroll plus wagers still on the table, minus the
+            initial bankroll.
+        rolls: Number of rolls played.
+    """
+    net: float
+    rolls: int
+
+
+@dataclass
+class StrategySummary:
+    name: str
+    mean: float
+    std: float
+    ci_low: float
+    ci_high: float
+
+
+@dataclass
+class PairedDifference:
+    """
+    Mean of (a - b) across sessions, with its confidence interval.
+    variance_ratio is var(a - b) / (var(a) + var(b)): how much variance the
+    shared dice removed compared with independent dice (lower is better).
+    """
+    a: str
+    b: str
+    mean: float
+    ci_low: float
+    ci_high: float
+    variance_ratio: float
+
+
+@dataclass
+class TournamentResult:
+    n_sessions: int
+    n_rolls: int
+    summaries: List[StrategySummary]
+    differences: List[PairedDifference]
+    nets: Dict[str, List[float]]
+
+
+def play_session(
+    strategy: Strategy,
+    dice: DiceSource,
+    config: TableConfig,
+    init_bankroll: float,
+    max_rolls: int
+) -> SessionResult:
+    """
+    Plays one session of up to max_rolls rolls. The session ends early once
+    the bankroll and the table are both empty.
+    """
+    strategy.reset()
+    state = TableState(config, strategy.make_bets(), init_bankroll)
+    rolls = 0
+    while rolls < max_rolls:
+        strategy.act(state)
+        if state.get_bankroll_size() + state.get_total_wager() <= 0:
+            break
+        state.step(dice.next_roll())
+        rolls += 1
+    net = state.get_bankroll_size() + state.get_total_wager() - init_bankroll
+    return SessionResult(net=net, rolls=rolls)
+
+
+def run_tournament(
+    strategies: Sequence[Strategy],
+    config: TableConfig,
+    n_sessions: int,
+    rolls_per_session: int,
+    init_bankroll: float,
+    seed: int = 0,
+    confidence: float = 0.95,
+    session_dice: Optional[Callable[[int], DiceSource]] = None
+) -> TournamentResult:
+    """
+    Plays n_sessions sessions, each strategy against the same rolls, and
+    reports per-strategy means and all pairwise differences.
+
+    Args:
+        session_dice: Returns a fresh dice source for session i, called once
+            per strategy (e.g. RollTraceReader(path).session_dice for a
+            shared dice file). Defaults to rolls drawn from RandomDice(seed).
+    """
+    names = [s.name for s in strategies]
+    if len(set(names)) != len(names):
+        raise ValueError("Strategy names must be unique.")
+
+    source = RandomDice(seed) if session_dice is None else None
+    nets: Dict[str, List[float]] = {name: [] for name in names}
+    n_rolls = 0
+    for i in range(n_sessions):
+        if source is not None:
+            rolls: List[Roll] = [source.next_roll() for _ in range(rolls_per_session)]
+        for strategy in strategies:
+            dice = SequenceDice(rolls) if source is not None else session_dice(i)
+            result = play_session(strategy, dice, config, init_bankroll, rolls_per_session)
+            nets[strategy.name].append(result.net)
+            n_rolls += result.rolls
+
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    summaries = []
+    for name in names:
+        mean, half_width, var = _mean_ci(nets[name], z)
+        summaries.append(StrategySummary(name, mean, sqrt(var), mean - half_width, mean + half_width))
+
+    differences = []
+    for i, a in enumerate(names):
+        for b in names[i + 1:]:
+            diffs = [x - y for x, y in zip(nets[a], nets[b])]
+            mean, half_width, var = _mean_ci(diffs, z)
+            independent = _variance(nets[a]) + _variance(nets[b])
+            ratio = var / independent if independent > 0 else 0.0
+            differences.append(PairedDifference(a, b, mean, mean - half_width, mean + half_width, ratio))
+
+    return TournamentResult(
+        n_sessions=n_sessions,
+        n_rolls=n_rolls,
+        summaries=summaries,
+        differences=differences,
+        nets=nets
+    )
+
+
+def _variance(xs: Sequence[float]) -> float:
+    return variance(xs) if len(xs) > 1 else 0.0
+
+
+def _mean_ci(xs: Sequence[float], z: float) -> Tuple[float, float, float]:
+    mean = fmean(xs)
+    var = _variance(xs)
+    return mean, z * sqrt(var / len(xs)), var
@@ -0,0 +1,348 @@
+"""
+Compact binary roll traces.
+
+A trace file is a fixed 40 byte header followed by one uint8 per roll holding
+the dice outcome index (0-35, see Roll.outcome_index()). Episode boundaries
+are appended to a sidecar file (<path>.episodes) as little-endian uint64 roll
+offsets, so both files are append-only. Readers memory-map the rolls, so
+replaying a trace costs no parsing.
+
+Fixed-stride files (see write_session_dice()) hold the same number of rolls
+for every session and need no sidecar: roll k of session i is at offset
+i * stride + k. They serve as a shared, read-only dice stream that many
+worker processes can map and index by (session, roll offset), so every
+strategy and process sees identical dice without generating any.
+
+Header layout (little-endian):
+    magic:     8 bytes, b"CRAPSTRC"
+    version:   uint16
+    reserved:  uint16
+    stride:    uint32, rolls per episode for fixed-stride files, else 0
+    seed:      int64, the seed that generated the rolls, or -1 if unknown
+    config:    16 bytes, hash of the configs that produced the rolls
+"""
+from typing import Optional, List, Any, Union
+from dataclasses import dataclass, asdict
+import hashlib
+import os
+import struct
+import numpy as np
+from craps.dice import Roll, ROLLS, DiceSource
+
+MAGIC = b"CRAPSTRC"
+VERSION = 1
+HEADER_FORMAT = "<8sHHIq16s"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+NO_SEED = -1
+NO_CONFIG = bytes(16)
+
+
+@dataclass
+class TraceHeader:
+    seed: Optional[int]
+    config_hash: bytes
+    stride: int = 0
+    version: int = VERSION
+
+    def pack(self) -> bytes:
+        seed = NO_SEED if self.seed is None else self.seed
+        return struct.pack(HEADER_FORMAT, MAGIC, self.version, 0, self.stride, seed, self.config_hash)
+
+    @staticmethod
+    def unpack(data: bytes) -> "TraceHeader":
+        if len(data) < HEADER_SIZE:
+            raise ValueError("File is too short to be a roll trace.")
+        magic, version, _, stride, seed, config = struct.unpack(HEADER_FORMAT, data[:HEADER_SIZE])
+        if magic != MAGIC:
+            raise ValueError("Not a roll trace file.")
+        if version != VERSION:
+            raise ValueError(f"Unsupported roll trace version {version}.")
+        return TraceHeader(
+            seed=None if seed == NO_SEED else seed,
+            config_hash=config,
+            stride=stride,
+            version=version
+        )
+
+
+def config_hash(*configs: Any) -> bytes:
+    """
+    Returns a 16 byte hash of one or more config dataclasses.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    for config in configs:
+        h.update(repr(asdict(config)).encode())
+    return h.digest()
+
+
+def episodes_path(path: str) -> str:
+    return path + ".episodes"
+
+
+def write_session_dice(
+    path: str,
+    n_sessions: int,
+    rolls_per_session: int,
+    seed: int,
+    config_hash: bytes = NO_CONFIG,
+    chunk_rolls: int = 1 << 24
+) -> TraceHeader:
+    """
+    Pre-generates a fixed-stride dice file: rolls_per_session rolls for each
+    of n_sessions sessions, drawn from a PCG64 generator seeded with seed.
+    Rolls are generated and written in chunks, so files larger than memory
+    are fine.
+
+    Returns:
+        The header written to the file.
+    """
+    if n_sessions < 1 or rolls_per_session < 1:
+        raise ValueError("n_sessions and rolls_per_session must be positive.")
+    header = TraceHeader(seed=seed, config_hash=config_hash, stride=rolls_per_session)
+    rng = np.random.default_rng(seed)
+    remaining = n_sessions * rolls_per_session
+    with open(path, "wb") as f:
+        f.write(header.pack())
+        while remaining > 0:
+            n = min(chunk_rolls, remaining)
+            f.write(rng.integers(0, 36, size=n, dtype=np.uint8).tobytes())
+            remaining -= n
+    return header
+
+
+class RollTraceWriter:
+    """
+    Appends rolls to a trace file. Reopening an existing trace appends to it,
+    as long as the header matches.
+
+    Args:
+        path: Trace file path.
+        seed: Seed that generated the rolls, recorded in the header.
+        config_hash: Hash of the configs that produced the rolls.
+        buffer_size: Number of rolls buffered before writing to disk.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        seed: Optional[int] = None,
+        config_hash: bytes = NO_CONFIG,
+        buffer_size: int = 1 << 16
+    ):
+        header = TraceHeader(seed=seed, config_hash=config_hash)
+        if os.path.exists(path) and os.path.getsize(path) > 0:
+            with open(path, "rb") as f:
+                existing = TraceHeader.unpack(f.read(HEADER_SIZE))
+            if existing != header:
+                raise ValueError("Existing trace was written with a different seed or config.")
+            self._n_rolls = os.path.getsize(path) - HEADER_SIZE
+            self._file = open(path, "ab")
+        else:
+            self._n_rolls = 0
+            self._file = open(path, "wb")
+            self._file.write(header.pack())
+        self._episodes = open(episodes_path(path), "ab")
+        self._buffer = bytearray()
+        self._buffer_size = buffer_size
+        self._pending_episode = True
+
+    def write(self, roll: Roll):
+        """Appends one roll."""
+        if self._pending_episode:
+            self._episodes.write(struct.pack("<Q", self._n_rolls))
+            self._pending_episode = False
+        self._buffer.append(roll.outcome_index())
+        self._n_rolls += 1
+        if len(self._buffer) >= self._buffer_size:
+            self.flush()
+
+    def new_episode(self):
+        """Marks the next roll as the start of an episode. Empty episodes are skipped."""
+        self._pending_episode = True
+
+    def flush(self):
+        self._file.write(self._buffer)
+        self._buffer.clear()
+        self._file.flush()
+        self._episodes.flush()
+
+    def close(self):
+        self.flush()
+        self._file.close()
+        self._episodes.close()
+
+    def __enter__(self) -> "RollTraceWriter":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class RecordingDice(DiceSource):
+    """
+    Passes rolls through from another dice source, recording each one.
+    """
+
+    def __init__(self, source: DiceSource, writer: RollTraceWriter):
+        self._source = source
+        self._writer = writer
+
+    def next_roll(self) -> Roll:
+        roll = self._source.next_roll()
+        self._writer.write(roll)
+        return roll
+
+    def new_episode(self):
+        self._writer.new_episode()
+        self._source.new_episode()
+
+
+class RollTraceReader:
+    """
+    Memory-maps a trace file for replay.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self.header = TraceHeader.unpack(f.read(HEADER_SIZE))
+        n_rolls = os.path.getsize(path) - HEADER_SIZE
+        if n_rolls > 0:
+            self.rolls = np.memmap(path, dtype=np.uint8, mode="r", offset=HEADER_SIZE, shape=(n_rolls,))
+        else:
+            self.rolls = np.zeros(0, dtype=np.uint8)
+
+        # Fixed-stride episodes are located arithmetically, so readers of
+        # large shared files hold no per-episode state
+        self.stride = self.header.stride
+        self._episode_starts: Optional[np.ndarray] = None
+        if self.stride > 0:
+            self._n_episodes = -(-n_rolls // self.stride)
+        else:
+            if os.path.exists(episodes_path(path)):
+                self._episode_starts = np.fromfile(episodes_path(path), dtype="<u8")
+            else:
+                self._episode_starts = np.zeros(1 if n_rolls else 0, dtype=np.uint64)
+            self._n_episodes = len(self._episode_starts)
+
+    def __len__(self) -> int:
+        return len(self.rolls)
+
+    def __getstate__(self):
+        # Worker processes map the file themselves instead of receiving a copy
+        return {'path': self.path}
+
+    def __setstate__(self, state):
+        self.__init__(state['path'])
+
+    @property
+    def n_episodes(self) -> int:
+        return self._n_episodes
+
+    @property
+    def episode_starts(self) -> np.ndarray:
+        if self._episode_starts is None:
+            return np.arange(0, len(self.rolls), self.stride, dtype=np.uint64)
+        return self._episode_starts
+
+    def episode(self, i: int) -> np.ndarray:
+        """Returns the outcome indices of episode i (a view into the file)."""
+        start, end = self._episode_bounds(i)
+        return self.rolls[start:end]
+
+    def dice(self, episode: Optional[int] = 0) -> "TraceDice":
+        """
+        Returns a dice source replaying the trace.
+
+        Args:
+            episode: Episode to start from. Each new_episode() call moves to
+                the following episode. If None, the whole trace is replayed as
+                one stream and episode boundaries are ignored.
+        """
+        if episode is None:
+            return TraceDice(self.rolls, None)
+        if self.stride > 0:
+            return TraceDice(self.rolls, self.stride, first_episode=episode)
+        return TraceDice(self.rolls, self._episode_starts, first_episode=episode)
+
+    def session_dice(self, session: int, offset: int = 0) -> "TraceDice":
+        """
+        Returns a dice source replaying one session from a roll offset. It
+        stays on that session: new_episode() does not advance it, so several
+        strategies can replay the same session through the env or simulator.
+        """
+        start, end = self._episode_bounds(session)
+        if offset < 0 or start + offset > end:
+            raise IndexError(f"Offset {offset} out of range for session {session} with {end - start} rolls.")
+        return TraceDice(self.rolls[start + offset:end], None)
+
+    def roll(self, session: int, offset: int) -> Roll:
+        """Returns roll `offset` of a session."""
+        start, end = self._episode_bounds(session)
+        if offset < 0 or start + offset >= end:
+            raise IndexError(f"Offset {offset} out of range for session {session} with {end - start} rolls.")
+        return ROLLS[self.rolls[start + offset]]
+
+    def _episode_bounds(self, i: int):
+        if i < 0 or i >= self.n_episodes:
+            raise IndexError(f"Episode {i} out of range [0, {self.n_episodes - 1}]")
+        if self.stride > 0:
+            start = i * self.stride
+            return start, min(start + self.stride, len(self.rolls))
+        start = int(self._episode_starts[i])
+        end = int(self._episode_starts[i + 1]) if i + 1 < self.n_episodes else len(self.rolls)
+        return start, end
+
+
+class TraceDice(DiceSource):
+    """
+    Replays outcome indices as rolls.
+
+    Args:
+        outcomes: Outcome indices (0-35), e.g. a memory-mapped trace.
+        episode_starts: Offsets of each episode, a fixed number of rolls per
+            episode, or None to ignore episodes.
+        first_episode: Episode the first new_episode() call (or the first
+            roll, whichever comes first) starts from.
+
+    Raises:
+        EOFError: From next_roll() when the episode (or trace) is exhausted.
+    """
+
+    def __init__(self, outcomes: np.ndarray, episode_starts: Union[np.ndarray, int, None], first_episode: int = 0):
+        self._outcomes = outcomes
+        self._stride = 0
+        self._starts: Optional[List[int]] = None
+        if isinstance(episode_starts, (int, np.integer)):
+            self._stride = int(episode_starts)
+        elif episode_starts is not None:
+            self._starts = [int(s) for s in episode_starts]
+        self._n_episodes = -(-len(outcomes) // self._stride) if self._stride else len(self._starts or ())
+        self._episode = first_episode - 1
+        self._pos = 0
+        self._end = len(outcomes)
+        self._used = True
+        self.new_episode()
+
+    def next_roll(self) -> Roll:
+        if self._pos >= self._end:
+            raise EOFError("Roll trace exhausted.")
+        roll = ROLLS[self._outcomes[self._pos]]
+        self._pos += 1
+        self._used = True
+        return roll
+
+    def new_episode(self):
+        # Consecutive calls without rolls in between mark the same episode
+        if (self._starts is None and not self._stride) or not self._used:
+            return
+        self._episode += 1
+        if self._episode >= self._n_episodes:
+            self._pos = self._end = len(self._outcomes)
+        elif self._stride:
+            self._pos = self._episode * self._stride
+            self._end = min(self._pos + self._stride, len(self._outcomes))
+        else:
+            self._pos = self._starts[self._episode]
+            self._end = self._starts[self._episode + 1] if self._episode + 1 < len(self._starts) else len(self._outcomes)
+        self._used = False
@@ -201,3 +201,20 @@ class TestReset:
             assert come.get_stake(target=tgt) == 0.0
             assert come.get_odds(target=tgt) == 0.0
         assert come._phase.point is None
+
+
+def test_snapshot_and_restore_round_trip():
+    come = ComeBets(TablePhase(point=6))
+    come.set_stake(15.0)
+    come.settle(Roll((4, 5)))  # Come bet moves to 9
+    come.set_odds(30.0, target=9)
+    snapshot = come.snapshot()
+
+    come.settle(Roll((3, 4)))  # Seven-out clears everything
+    assert come.get_stake(target=9) == 0.0
+
+    come.restore(snapshot)
+    assert come.snapshot() == snapshot
+    assert come.get_stake(target=9) == 15.0
+    assert come.get_odds(target=9) == 30.0
+    assert come._phase.point == 6
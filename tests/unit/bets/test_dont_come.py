@@ -0,0 +1,62 @@
+import pytest
+from craps.phase import TablePhase
+from craps.dice import Roll
+from craps.bets.dont_come import DontComeBets
+from craps.exceptions import IllegalAction
+
+@pytest.fixture
+def dont_come():
+    return DontComeBets(TablePhase(point=6))
+
+@pytest.fixture
+def dont_come_on_4(dont_come: DontComeBets):
+    dont_come.set_stake(20.0)
+    dont_come.settle(Roll((1, 3)))
+    return dont_come
+
+
+class TestPending:
+    def test_set_stake_errors_during_comeout(self):
+        with pytest.raises(IllegalAction):
+            DontComeBets(TablePhase()).set_stake(20.0)
+
+    @pytest.mark.parametrize("roll", [Roll((3, 4)), Roll((5, 6))])
+    def test_natural_loses(self, roll: Roll, dont_come: DontComeBets):
+        dont_come.set_stake(20.0)
+        assert dont_come.settle(roll) == 0.0
+        assert dont_come.get_total_wager() == 0.0
+
+    @pytest.mark.parametrize("roll", [Roll((1, 1)), Roll((1, 2))])
+    def test_craps_wins(self, roll: Roll, dont_come: DontComeBets):
+        dont_come.set_stake(20.0)
+        assert dont_come.settle(roll) == 40.0
+        assert dont_come.get_total_wager() == 0.0
+
+    def test_twelve_is_barred(self, dont_come: DontComeBets):
+        dont_come.set_stake(20.0)
+        assert dont_come.settle(Roll((6, 6))) == 0.0
+        assert dont_come.get_stake() == 20.0
+
+    def test_moves_behind_number(self, dont_come_on_4: DontComeBets):
+        assert dont_come_on_4.get_stake() == 0.0
+        assert dont_come_on_4.get_stake(target=4) == 20.0
+
+
+class TestEstablished:
+    def test_seven_wins_with_lay_odds(self, dont_come_on_4: DontComeBets):
+        dont_come_on_4.set_odds(40.0, target=4)
+        assert dont_come_on_4.settle(Roll((3, 4))) == 40.0 + 60.0
+        assert dont_come_on_4.get_total_wager() == 0.0
+
+    def test_seven_wins_on_comeout(self, dont_come_on_4: DontComeBets):
+        dont_come_on_4.settle(Roll((3, 3)))  # Point made
+        assert dont_come_on_4.settle(Roll((3, 4))) == 40.0
+
+    def test_number_loses(self, dont_come_on_4: DontComeBets):
+        dont_come_on_4.set_odds(40.0, target=4)
+        assert dont_come_on_4.settle(Roll((2, 2))) == 0.0
+        assert dont_come_on_4.get_total_wager() == 0.0
+
+    def test_set_odds_without_stake_errors(self, dont_come_on_4: DontComeBets):
+        with pytest.raises(IllegalAction):
+            dont_come_on_4.set_odds(30.0, target=5)
@@ -0,0 +1,101 @@
+import pytest
+from craps.phase import TablePhase
+from craps.dice import Roll
+from craps.bets.dont_pass import DontPass
+from craps.exceptions import IllegalAction
+
+NATURALS = [Roll((3, 4)), Roll((5, 6))]
+WINNING_CRAPS = [Roll((1, 1)), Roll((1, 2))]
+POINT_ROLLS = [Roll((2, 2)), Roll((2, 3)), Roll((1, 5)), Roll((2, 6)), Roll((5, 4)), Roll((5, 5))]
+
+@pytest.fixture
+def comeout():
+    return TablePhase(point=None)
+
+@pytest.fixture
+def dont_pass_on_6(comeout):
+    dp = DontPass(comeout)
+    dp.set_stake(30.0)
+    dp.settle(Roll((3, 3)))
+    return dp
+
+
+class TestSettleComeout:
+    @pytest.mark.parametrize("roll", NATURALS)
+    def test_natural_loses(self, roll: Roll, comeout: TablePhase):
+        dp = DontPass(comeout)
+        dp.set_stake(25.0)
+        assert dp.settle(roll) == 0.0
+        assert dp.get_stake() == 0.0
+
+    @pytest.mark.parametrize("roll", WINNING_CRAPS)
+    def test_craps_wins(self, roll: Roll, comeout: TablePhase):
+        dp = DontPass(comeout)
+        dp.set_stake(25.0)
+        assert dp.settle(roll) == 50.0
+        assert dp.get_stake() == 0.0
+
+    def test_twelve_is_barred(self, comeout: TablePhase):
+        dp = DontPass(comeout)
+        dp.set_stake(25.0)
+        assert dp.settle(Roll((6, 6))) == 0.0
+        assert dp.get_stake() == 25.0
+
+    @pytest.mark.parametrize("roll", POINT_ROLLS)
+    def test_establishing_point(self, roll: Roll, comeout: TablePhase):
+        dp = DontPass(comeout)
+        dp.set_stake(25.0)
+        assert dp.settle(roll) == 0.0
+        assert dp.get_stake() == 25.0
+
+    def test_set_odds_errors_during_comeout(self, comeout: TablePhase):
+        dp = DontPass(comeout)
+        dp.set_stake(30.0)
+        with pytest.raises(IllegalAction):
+            dp.set_odds(60.0, target=6)
+
+
+class TestSettlePointOn:
+    @pytest.mark.parametrize(
+        "point, lay, winnings",
+        [
+            (Roll((2, 2)), 60.0, 150.0),
+            (Roll((2, 3)), 45.0, 135.0),
+            (Roll((1, 5)), 36.0, 126.0),
+            (Roll((2, 6)), 36.0, 126.0),
+            (Roll((5, 4)), 45.0, 135.0),
+            (Roll((5, 5)), 60.0, 150.0),
+        ],
+    )
+    def test_seven_out(self, point: Roll, lay: float, winnings: float, comeout: TablePhase):
+        dp = DontPass(comeout)
+        dp.set_stake(30.0)
+        dp.settle(point)
+        point_value = point.total()
+        dp.set_odds(lay, target=point_value)
+        assert dp.settle(Roll((3, 4))) == pytest.approx(winnings)
+        assert dp.get_stake() == 0.0
+        assert dp.get_odds(target=point_value) == 0.0
+
+    def test_hitting_point(self, dont_pass_on_6: DontPass):
+        dont_pass_on_6.set_odds(36.0, target=6)
+        assert dont_pass_on_6.settle(Roll((2, 4))) == 0.0
+        assert dont_pass_on_6.get_stake() == 0.0
+        assert dont_pass_on_6.get_odds(target=6) == 0.0
+
+    def test_other_roll(self, dont_pass_on_6: DontPass):
+        dont_pass_on_6.set_odds(36.0, target=6)
+        assert dont_pass_on_6.settle(Roll((6, 6))) == 0.0
+        assert dont_pass_on_6.get_stake() == 30.0
+        assert dont_pass_on_6.get_odds(target=6) == 36.0
+
+    def test_set_stake_errors_during_point(self, dont_pass_on_6: DontPass):
+        with pytest.raises(IllegalAction):
+            dont_pass_on_6.set_stake(30.0)
+
+    def test_set_odds_with_wrong_target_errors(self, dont_pass_on_6: DontPass):
+        with pytest.raises(IllegalAction):
+            dont_pass_on_6.set_odds(30.0, target=4)
+
+    def test_lay_odds_increments(self, dont_pass_on_6: DontPass):
+        assert [dont_pass_on_6.get_odds_increment(target=n) for n in (4, 5, 6, 8, 9, 10)] == [2, 3, 6, 6, 3, 2]
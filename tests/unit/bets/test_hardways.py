@@ -0,0 +1,47 @@
+import pytest
+from craps.phase import TablePhase
+from craps.dice import Roll
+from craps.bets.hardways import HardwayBets
+
+@pytest.fixture
+def hardways():
+    return HardwayBets(TablePhase(point=5))
+
+
+class TestHardwayBets:
+    @pytest.mark.parametrize("roll, winnings", [(Roll((2, 2)), 70.0), (Roll((3, 3)), 90.0), (Roll((4, 4)), 90.0), (Roll((5, 5)), 70.0)])
+    def test_hard_way_wins_and_stays_up(self, roll: Roll, winnings: float, hardways: HardwayBets):
+        hardways.set_stake(10.0, target=roll.total())
+        assert hardways.settle(roll) == winnings
+        assert hardways.get_stake(target=roll.total()) == 10.0
+
+    @pytest.mark.parametrize("roll", [Roll((1, 3)), Roll((3, 1))])
+    def test_easy_way_loses(self, roll: Roll, hardways: HardwayBets):
+        hardways.set_stake(10.0, target=4)
+        assert hardways.settle(roll) == 0.0
+        assert hardways.get_stake(target=4) == 0.0
+
+    def test_seven_loses_all(self, hardways: HardwayBets):
+        for target in (4, 6, 8, 10):
+            hardways.set_stake(10.0, target=target)
+        assert hardways.settle(Roll((1, 6))) == 0.0
+        assert hardways.get_total_wager() == 0.0
+
+    def test_other_roll(self, hardways: HardwayBets):
+        hardways.set_stake(10.0, target=6)
+        assert hardways.settle(Roll((2, 2))) == 0.0
+        assert hardways.get_stake(target=6) == 10.0
+
+    def test_off_on_comeout(self):
+        hardways = HardwayBets(TablePhase())
+        hardways.set_stake(10.0, target=6)
+        assert hardways.settle(Roll((3, 3))) == 0.0
+        assert hardways.get_stake(target=6) == 10.0
+
+    def test_is_prop(self, hardways: HardwayBets):
+        assert hardways.is_prop
+        assert not hardways.settles_by_total
+
+    def test_invalid_target(self, hardways: HardwayBets):
+        with pytest.raises(ValueError):
+            hardways.set_stake(10.0, target=5)
@@ -0,0 +1,42 @@
+import pytest
+from craps.phase import TablePhase
+from craps.dice import Roll
+from craps.bets.lay_bets import LayBets
+
+@pytest.fixture
+def lay():
+    return LayBets(TablePhase())
+
+
+class TestLayBets:
+    @pytest.mark.parametrize(
+        "target, amount, winnings",
+        [(4, 40.0, 19.0), (5, 30.0, 19.0), (6, 24.0, 19.0), (8, 48.0, 38.0), (9, 60.0, 38.0), (10, 80.0, 38.0)],
+    )
+    def test_seven_pays_less_vig(self, target: int, amount: float, winnings: float, lay: LayBets):
+        lay.set_stake(amount, target=target)
+        assert lay.settle(Roll((3, 4))) == pytest.approx(winnings)
+        assert lay.get_stake(target=target) == amount
+
+    def test_number_loses(self, lay: LayBets):
+        lay.set_stake(40.0, target=4)
+        lay.set_stake(30.0, target=5)
+        assert lay.settle(Roll((1, 3))) == 0.0
+        assert lay.get_stake(target=4) == 0.0
+        assert lay.get_stake(target=5) == 30.0
+
+    def test_other_roll(self, lay: LayBets):
+        lay.set_stake(40.0, target=4)
+        assert lay.settle(Roll((6, 6))) == 0.0
+        assert lay.get_stake(target=4) == 40.0
+
+    def test_increments(self, lay: LayBets):
+        assert [lay.get_stake_increment(target=n) for n in (4, 5, 6, 8, 9, 10)] == [40, 30, 24, 24, 30, 40]
+
+    def test_no_odds(self, lay: LayBets):
+        assert not lay.can_set_odds()
+        assert lay.get_odds_increment() is None
+
+    def test_target_required(self, lay: LayBets):
+        with pytest.raises(ValueError):
+            lay.set_stake(40.0)
@@ -0,0 +1,142 @@
+import pytest
+from craps.phase import TablePhase
+from craps.dice import Roll, ROLLS, TOTALS
+from craps.bets import PassLine, ComeBets, PlaceBets, Field
+from craps.bets.model import Bet
+from craps.constants import POINTS
+
+
+def roll_total(total: int) -> Roll:
+    return next(roll for roll in ROLLS if roll.total() == total)
+
+
+def with_point(bet: Bet, point) -> Bet:
+    bet.restore((point,) + bet.snapshot()[1:])
+    return bet
+
+
+def make_layouts():
+    """A few wager layouts per bet, on the come-out and with a point on."""
+    layouts = []
+    for point in (None, 4, 6, 9):
+        pass_line = PassLine(TablePhase())
+        pass_line.set_stake(10.0)
+        if point:
+            pass_line.settle(roll_total(point))
+            pass_line.set_odds(20.0, target=point)
+        layouts.append(pass_line)
+
+        come = ComeBets(TablePhase(point=6))
+        come.set_stake(10.0)
+        come.settle(roll_total(5))
+        come.set_odds(30.0, target=5)
+        come.set_stake(25.0)
+        come.settle(roll_total(10))
+        come.set_stake(15.0)
+        layouts.append(with_point(come, point))
+
+        place = PlaceBets(TablePhase(point=6))
+        for target, amount in ((6, 12.0), (8, 18.0), (4, 10.0)):
+            place.set_stake(amount, target=target)
+        layouts.append(with_point(place, point))
+
+        field = Field(TablePhase(point=point))
+        field.set_stake(10.0)
+        layouts.append(field)
+    return layouts
+
+
+def settle_each(bet: Bet):
+    """Reference vectors from settling a copy of the bet against every outcome."""
+    snapshot = bet.snapshot()
+    wager = bet.get_total_wager()
+    payouts, nets = [], []
+    for roll in ROLLS:
+        payout = bet.settle(roll)
+        payouts.append(payout)
+        nets.append(payout + bet.get_total_wager() - wager)
+        bet.restore(snapshot)
+    return payouts, nets
+
+
+@pytest.mark.parametrize("bet", make_layouts(), ids=lambda b: f"{type(b).__name__}-{b._phase.point}")
+def test_vectors_match_settle(bet: Bet):
+    payouts, nets = settle_each(bet)
+    assert bet.get_payouts_by_outcome() == pytest.approx(payouts)
+    assert bet.get_net_by_outcome() == pytest.approx(nets)
+    for total in TOTALS:
+        i = next(i for i, roll in enumerate(ROLLS) if roll.total() == total)
+        assert bet.get_payouts_by_total()[total - 2] == pytest.approx(payouts[i])
+        assert bet.get_net_by_total()[total - 2] == pytest.approx(nets[i])
+
+
+def test_vectors_do_not_change_bet():
+    bet = make_layouts()[1]
+    before = bet.snapshot()
+    bet.get_payouts_by_outcome()
+    bet.get_net_by_total()
+    assert bet.snapshot() == before
+
+
+class HardSix(Bet):
+    """Pays 10x on a hard six only, to exercise the dice-level fallback."""
+    def __init__(self, init_phase: TablePhase):
+        super().__init__(init_phase)
+        self.stake = 0.0
+
+    is_prop = True
+
+    def _settle(self, roll):
+        winnings = self.stake * 10.0 if roll == (3, 3) else 0.0
+        self._clear()
+        return winnings
+
+    def _clear(self):
+        self.stake = 0.0
+
+    def _set_stake(self, amount, target=None):
+        self.stake = amount
+
+    def _get_stake(self, target=None):
+        return self.stake
+
+    def _set_odds(self, amount, target=None):
+        raise RuntimeError
+
+    def _get_odds(self, target=None):
+        raise RuntimeError
+
+    def set_stake_targets(self):
+        return (None,)
+
+    def get_stake_targets(self):
+        return (None,)
+
+    def set_odds_targets(self):
+        return ()
+
+    def get_odds_targets(self):
+        return ()
+
+    def get_stake_increment(self, target=None):
+        return 1
+
+    def get_odds_increment(self, target=None):
+        return None
+
+    def can_set_stake(self, target=None):
+        return True
+
+    def can_set_odds(self, target=None):
+        return False
+
+
+def test_generic_fallback_averages_by_total():
+    bet = HardSix(TablePhase())
+    bet.set_stake(5.0)
+    by_outcome = bet.get_payouts_by_outcome()
+    assert sum(1 for p in by_outcome if p) == 1
+    # One of the five ways to roll a six pays 50
+    assert bet.get_payouts_by_total()[6 - 2] == pytest.approx(10.0)
+    assert min(bet.get_net_by_outcome()) == -5.0
+    assert bet.get_stake() == 5.0
@@ -0,0 +1,55 @@
+import pytest
+from craps.phase import TablePhase
+from craps.dice import Roll, ROLLS
+from craps.bets.props import AnySeven, AnyCraps, Yo, Aces, Boxcars, Horn, HiLo, HopBets, HOP_TARGETS
+
+
+@pytest.mark.parametrize(
+    "bet_cls, stake, winners",
+    [
+        (AnySeven, 10.0, {7: 50.0}),
+        (AnyCraps, 10.0, {2: 80.0, 3: 80.0, 12: 80.0}),
+        (Yo, 10.0, {11: 160.0}),
+        (Aces, 10.0, {2: 310.0}),
+        (Boxcars, 10.0, {12: 310.0}),
+        (Horn, 4.0, {2: 31.0, 3: 16.0, 11: 16.0, 12: 31.0}),
+        (HiLo, 2.0, {2: 31.0, 12: 31.0}),
+    ],
+)
+def test_one_roll_bets(bet_cls, stake: float, winners: dict):
+    for roll in ROLLS:
+        bet = bet_cls(TablePhase(point=6))
+        bet.set_stake(stake)
+        assert bet.settle(roll) == pytest.approx(winners.get(roll.total(), 0.0))
+        assert bet.get_stake() == 0.0
+    assert bet.is_prop
+    assert bet.settles_by_total
+
+
+def test_increments():
+    assert Horn(TablePhase()).get_stake_increment() == 4
+    assert HiLo(TablePhase()).get_stake_increment() == 2
+    assert AnySeven(TablePhase()).get_stake_increment() == 1
+
+
+class TestHopBets:
+    def test_targets(self):
+        assert len(HOP_TARGETS) == 21
+        assert 25 in HOP_TARGETS and 52 not in HOP_TARGETS
+
+    @pytest.mark.parametrize("roll, target, winnings", [(Roll((2, 5)), 25, 80.0), (Roll((5, 2)), 25, 80.0), (Roll((3, 3)), 33, 155.0)])
+    def test_hop_wins(self, roll: Roll, target: int, winnings: float):
+        hop = HopBets(TablePhase())
+        hop.set_stake(5.0, target=target)
+        assert hop.settle(roll) == winnings
+        assert hop.get_total_wager() == 0.0
+
+    def test_hop_loses(self):
+        hop = HopBets(TablePhase())
+        hop.set_stake(5.0, target=25)
+        hop.set_stake(5.0, target=34)
+        assert hop.settle(Roll((1, 6))) == 0.0
+        assert hop.get_total_wager() == 0.0
+
+    def test_settles_by_dice(self):
+        assert not HopBets.settles_by_total
@@ -0,0 +1,63 @@
+import pytest
+import numpy as np
+from craps.phase import TablePhase
+from craps.dice import Roll, ROLLS
+from craps.bets import PassLine, ComeBets, PlaceBets, Field
+from craps.bets.spec import BetSpec, Slot, STAY, LOSE, win, compile_spec
+from craps.bets.table_bet import TableBet
+from craps.batch.kernels import kernel_for
+
+
+def settle_hard_four(slot, point, roll):
+    if roll[0] == roll[1] == 2:
+        return win(8.0)
+    if roll.total() in (4, 7):
+        return LOSE
+    return STAY
+
+
+class HardFour(TableBet):
+    spec = BetSpec(slots=(Slot('stake'),), rule=settle_hard_four, is_prop=True)
+
+
+class TestCompileSpec:
+    def test_settles_by_total(self):
+        for bet_cls in (PassLine, ComeBets, PlaceBets, Field):
+            assert bet_cls.settles_by_total
+        assert not HardFour.settles_by_total
+
+    def test_duplicate_slots(self):
+        spec = BetSpec(slots=(Slot('stake'), Slot('stake')), rule=lambda *args: STAY)
+        with pytest.raises(ValueError):
+            compile_spec(spec)
+
+
+class TestSpecBet:
+    def test_settle(self):
+        bet = HardFour(TablePhase())
+        bet.set_stake(5.0)
+        assert bet.is_prop
+        assert bet.settle(Roll((1, 3))) == 0.0
+        assert bet.get_stake() == 0.0
+
+        bet.set_stake(5.0)
+        assert bet.settle(Roll((2, 2))) == 40.0
+        assert bet.get_stake() == 0.0
+
+        bet.set_stake(5.0)
+        assert bet.settle(Roll((3, 3))) == 0.0
+        assert bet.get_stake() == 5.0
+
+    def test_batch_kernel_matches_scalar(self):
+        kernel = kernel_for(HardFour)(36)
+        kernel.set_stake(np.full(36, 5.0), np.ones(36, dtype=bool))
+        payout = kernel.settle(np.zeros(36, dtype=np.int64), np.arange(36))
+        for k in range(36):
+            bet = HardFour(TablePhase())
+            bet.set_stake(5.0)
+            assert payout[k] == bet.settle(ROLLS[k])
+            assert kernel.wagers[k, 0] == bet.get_stake()
+
+    def test_no_kernel_without_spec(self):
+        with pytest.raises(ValueError):
+            kernel_for(object)
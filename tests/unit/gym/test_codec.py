@@ -5,6 +5,7 @@ from craps.phase import TablePhase
 from craps.dice import Roll
 from craps.state import TableConfig
 from craps.gym.codec import BetCodec
+from craps.bets import DontPass
 
 ALL_NUMBERS = list(range(2, 13))
 
@@ -263,4 +264,22 @@ class TestBetCodec:
         with pytest.raises(ValueError):
             assert codec.odds_discrete_to_amount(x, target=4)
 
+
+class TestLayOddsCodec:
+    @pytest.fixture
+    def codec(self) -> BetCodec:
+        config = TableConfig(table_min=15.0, table_max=60.0, odds_max=3.0, prop_min=5.0)
+        dont_pass = DontPass(TablePhase(None))
+        dont_pass.set_stake(15.0)
+        dont_pass.settle(Roll((3, 3)))
+        return BetCodec(config, dont_pass)
+
+    @pytest.mark.parametrize("target,minimum", [(4, 16.0), (5, 15.0), (6, 18.0), (8, 18.0), (9, 15.0), (10, 16.0)])
+    def test_odds_aligned_to_lay_payout(self, codec: BetCodec, target: int, minimum: float):
+        increment = {4: 2, 5: 3, 6: 6, 8: 6, 9: 3, 10: 2}[target]
+        assert codec.odds_discrete_to_amount(1, target=target) == minimum
+        assert codec.odds_discrete_to_amount(2, target=target) == minimum + increment
+        with pytest.raises(ValueError):
+            codec.odds_amount_to_discrete(minimum + 1, target=target)
+
 # TODO: Add SpaceCodec tests
@@ -0,0 +1,159 @@
+import pytest
+from craps.phase import TablePhase
+from craps.state import TableConfig
+from craps.bets import PassLine, PlaceBets, Field
+from craps.gym.config import CrapsEnvConfig
+from craps.gym.env import CrapsEnv
+
+
+@pytest.fixture
+def env() -> CrapsEnv:
+    env_config = CrapsEnvConfig(
+        init_bankroll=100.0,
+        max_bankroll=1000.0,
+        max_points=10,
+        min_bet_inc=5,
+    )
+    table_config = TableConfig(table_min=10, table_max=100, odds_max=3, prop_min=5)
+    init_phase = TablePhase()
+    bets = {
+        'pass_line': PassLine(init_phase),
+        'place': PlaceBets(init_phase),
+        'field': Field(init_phase),
+    }
+    env = CrapsEnv(env_config, table_config, bets)
+    env.reset(seed=0)
+    return env
+
+
+def empty_action(env: CrapsEnv):
+    return {key: 0 for key in env.action_space.spaces}
+
+
+class TestIllegalActions:
+    def test_legal_action_is_applied(self, env: CrapsEnv):
+        action = empty_action(env)
+        action['stake-field-None'] = 1  # $10
+        _, reward, _, _, _ = env.step(action)
+        assert reward == 0.0
+        assert env.get_n_illegal_actions() == 0
+        assert env.get_n_steps() == 1
+
+    def test_illegal_action_is_rejected_atomically(self, env: CrapsEnv):
+        action = empty_action(env)
+        action['stake-field-None'] = 1  # $10, legal on its own
+        action['stake-place-6'] = 1  # place bets are not accepted on the come-out
+        env.step(action)
+        assert env.get_last_action_illegal()
+        assert env.get_n_illegal_actions() == 1
+        # The field bet was not taken, so the bankroll did not move
+        assert env.get_bankroll_size() == 100.0
+
+    def test_unaffordable_action_is_rejected(self, env: CrapsEnv):
+        action = empty_action(env)
+        action['stake-field-None'] = env.action_space.spaces['stake-field-None'].n - 1  # $100
+        action['stake-pass_line-None'] = 1  # +$10 > bankroll
+        _, reward, _, _, _ = env.step(action)
+        assert reward == -env._env_config.illegal_action_penalty
+        assert env.get_bankroll_size() == 100.0
+
+
+def make_auto_env(**kwargs) -> CrapsEnv:
+    env_config = CrapsEnvConfig(
+        init_bankroll=100.0,
+        max_bankroll=1000.0,
+        max_points=10,
+        min_bet_inc=5,
+        auto_advance=True,
+        step_info=True,
+        **kwargs
+    )
+    table_config = TableConfig(table_min=10, table_max=100, odds_max=3, prop_min=5)
+    init_phase = TablePhase()
+    bets = {'pass_line': PassLine(init_phase), 'place': PlaceBets(init_phase)}
+    env = CrapsEnv(env_config, table_config, bets)
+    env.reset(seed=0)
+    return env
+
+
+class TestAutoAdvance:
+    def test_rolls_until_point_is_established(self):
+        env = make_auto_env()
+        for _ in range(20):
+            env.reset()
+            _, _, _, _, info = env.step(empty_action(env))
+            # Nothing is wagered, so only the point coming on is a decision
+            assert env._state.get_phase().point is not None
+            assert env._state.get_roll_count() == info["n_rolls"]
+
+    def test_stops_when_a_bet_pays(self):
+        env = make_auto_env()
+        env.step(empty_action(env))  # point on
+        point = env._state.get_phase().point
+        action = empty_action(env)
+        target = 6 if point != 6 else 8
+        action[f'stake-place-{target}'] = 1
+        before = env._state.get_roll_count()
+        _, _, done, trunc, info = env.step(action)
+        last = env._state.get_last_roll().total()
+        assert info["n_rolls"] == env._state.get_roll_count() - before
+        assert done or trunc or last in (target, 7, point)
+
+    def test_max_auto_rolls_caps_rolls(self):
+        env = make_auto_env(max_auto_rolls=1)
+        _, _, _, _, info = env.step(empty_action(env))
+        assert info["n_rolls"] == 1
+
+    def test_disabled_by_default(self, env: CrapsEnv):
+        env.step(empty_action(env))
+        assert env._state.get_roll_count() == 1
+
+
+def test_terminal_info_reports_seed_path():
+    from craps.seeding import SeedTree
+    env_config = CrapsEnvConfig(init_bankroll=100.0, max_bankroll=1000.0, max_points=1, min_bet_inc=5, step_info=True)
+    table_config = TableConfig(table_min=10, table_max=100, odds_max=3, prop_min=5)
+    env = CrapsEnv(env_config, table_config, {'field': Field(TablePhase())}, dice=SeedTree(7).dice(env=2))
+    env.reset()
+    info = {}
+    while "seed_path" not in info:
+        action = empty_action(env)
+        action['stake-field-None'] = 1
+        _, _, done, trunc, info = env.step(action)
+        assert "seed_path" in info or not (done or trunc)
+    assert info["seed_path"] == (0, 0, 2, 1)
+
+
+def test_training_env_records_replayable_seed_paths():
+    # The env stack train_agent.py builds, with its setup resets
+    import importlib.util
+    import os
+    from craps.seeding import SeedTree
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+    spec = importlib.util.spec_from_file_location("train_agent", os.path.join(root, "scripts", "train_agent.py"))
+    train_agent = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(train_agent)
+
+    env_config = CrapsEnvConfig(init_bankroll=100.0, max_bankroll=200.0, max_points=2, min_bet_inc=5)
+    table_config = TableConfig(table_min=15, table_max=75, odds_max=3, prop_min=5)
+    env = train_agent.make_env(env_config, table_config, SeedTree(11), node=1, env_index=3)()
+    env.action_space.seed(0)
+
+    episodes = []
+    for _ in range(3):
+        env.reset()
+        rolls, done = [], False
+        while not done:
+            _, _, terminated, truncated, _ = env.step(env.action_space.sample())
+            rolls.append(env.unwrapped._state.get_last_roll())
+            done = terminated or truncated
+        episodes.append(rolls)
+
+    records = env.drain_episode_records()
+    assert len(records) == 3
+    for record, rolls in zip(records, episodes):
+        node, worker, env_index, episode = (int(i) for i in record["seed_path"])
+        assert (node, worker, env_index) == (1, 0, 3)
+        replay = SeedTree(11).dice(node, worker, env_index)
+        replay.start_episode(episode)
+        assert [replay.next_roll() for _ in rolls] == rolls
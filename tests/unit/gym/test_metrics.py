@@ -0,0 +1,148 @@
+import json
+import pytest
+from craps.phase import TablePhase
+from craps.state import TableConfig
+from craps.bets import PassLine, Field
+from craps.gym.config import CrapsEnvConfig
+from craps.gym.env import CrapsEnv
+from craps.gym.wrappers import FlattenActionWrapper, CPTBuffer, CPTRewardWrapper
+from craps.gym.metrics import EpisodeRecordQueue, MetricsAggregator
+from craps.gym.sinks import JsonlSink, JsonlEpisodeLog
+
+
+def make_env(step_info: bool = False, episode_info: bool = False) -> CPTRewardWrapper:
+    env_config = CrapsEnvConfig(
+        init_bankroll=100.0,
+        max_bankroll=200.0,
+        max_points=3,
+        min_bet_inc=5,
+        step_info=step_info,
+    )
+    table_config = TableConfig(table_min=10, table_max=50, odds_max=3, prop_min=5)
+    init_phase = TablePhase()
+    bets = {'pass_line': PassLine(init_phase), 'field': Field(init_phase)}
+    env = FlattenActionWrapper(CrapsEnv(env_config, table_config, bets))
+    return CPTRewardWrapper(
+        env, CPTBuffer(minsize=1),
+        init_bankroll=env_config.init_bankroll,
+        episode_info=episode_info
+    )
+
+
+def run_episode(env: CPTRewardWrapper):
+    env.reset(seed=0)
+    while True:
+        _, _, done, trunc, info = env.step(env.action_space.sample() * 0)
+        if done or trunc:
+            return info
+
+
+class TestEpisodeRecordQueue:
+    def test_push_and_drain(self):
+        queue = EpisodeRecordQueue(capacity=4)
+        queue.push(n_points=1)
+        queue.push(n_points=2)
+        records = queue.drain()
+        assert list(records["n_points"]) == [1, 2]
+        assert len(queue) == 0
+
+    def test_overflow_keeps_newest(self):
+        queue = EpisodeRecordQueue(capacity=2)
+        for i in range(5):
+            queue.push(total_steps=i)
+        assert queue.dropped == 3
+        assert list(queue.drain()["total_steps"]) == [3, 4]
+
+    def test_drain_returns_copy(self):
+        queue = EpisodeRecordQueue(capacity=2)
+        queue.push(total_steps=1)
+        records = queue.drain()
+        queue.push(total_steps=2)
+        assert records["total_steps"][0] == 1
+
+    def test_invalid_capacity_errors(self):
+        with pytest.raises(ValueError):
+            EpisodeRecordQueue(capacity=0)
+
+
+class TestEpisodeInfo:
+    def test_step_info_empty_by_default(self):
+        env = make_env()
+        info = run_episode(env)
+        assert info == {}
+
+    def test_episode_record_is_queued(self):
+        env = make_env()
+        run_episode(env)
+        records = env.drain_episode_records()
+        assert len(records) == 1
+        assert records[0]["terminal_bankroll"] == 100.0
+        assert records[0]["n_points"] == 3
+
+    def test_legacy_keys_when_requested(self):
+        env = make_env(step_info=True, episode_info=True)
+        info = run_episode(env)
+        assert info["n_points"] == 3
+        assert info["terminal_bankroll"] == 100.0
+        assert "ep_reward_total" in info
+        assert "illegal_action" in info
+
+
+class TestMetricsAggregator:
+    def make_records(self, n: int, start: int = 0):
+        queue = EpisodeRecordQueue(capacity=max(n, 1))
+        for i in range(start, start + n):
+            queue.push(terminal_bankroll=float(i), n_points=i, illegal_actions=1, cpt_delta=0.5)
+        return queue.drain()
+
+    def test_flush_writes_one_summary(self, tmp_path):
+        path = tmp_path / "metrics.jsonl"
+        aggregator = MetricsAggregator([JsonlSink(str(path))], window=10)
+        aggregator.add(self.make_records(4))
+        aggregator.add(self.make_records(4, start=4))
+        aggregator.flush(step=100)
+        aggregator.close()
+
+        lines = path.read_text().splitlines()
+        assert len(lines) == 1
+        summary = json.loads(lines[0])
+        assert summary["step"] == 100
+        assert summary["n_episodes"] == 8
+        assert summary["scalars"]["mean/terminal_bankroll"] == pytest.approx(3.5)
+        assert summary["scalars"]["mean/illegal_actions"] == 1.0
+        counts, edges = summary["histograms"]["n_points"]
+        assert sum(counts) == 8
+        assert edges[0] == 0.0 and edges[-1] == 7.0
+
+    def test_window_keeps_newest(self, tmp_path):
+        aggregator = MetricsAggregator([], window=3)
+        aggregator.add(self.make_records(5))
+        summary = aggregator.flush(step=1)
+        assert summary.n_episodes == 3
+        assert summary.scalars["mean/n_points"] == pytest.approx(3.0)
+        assert aggregator.n_total == 5
+
+    def test_flush_skips_when_no_new_episodes(self, tmp_path):
+        path = tmp_path / "metrics.jsonl"
+        aggregator = MetricsAggregator([JsonlSink(str(path))])
+        aggregator.add(self.make_records(2))
+        assert aggregator.flush(step=1) is not None
+        assert aggregator.flush(step=2) is None
+        aggregator.close()
+        assert len(path.read_text().splitlines()) == 1
+
+
+def test_episode_log_keeps_seed_paths(tmp_path):
+    queue = EpisodeRecordQueue()
+    queue.push(terminal_bankroll=1.0, seed_path=(0, 1, 2, 3))
+    queue.push(terminal_bankroll=2.0)
+    path = tmp_path / "episodes.jsonl"
+    aggregator = MetricsAggregator([], episode_log=JsonlEpisodeLog(str(path)))
+    aggregator.add(queue.drain())
+    summary = aggregator.summary(step=1)
+    aggregator.close()
+
+    assert "mean/seed_path" not in summary.scalars
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert lines[0]["seed_path"] == [0, 1, 2, 3]
+    assert "seed_path" not in lines[1]
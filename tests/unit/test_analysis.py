@@ -0,0 +1,142 @@
+from math import exp
+import pytest
+from craps.phase import TablePhase
+from craps.dice import Roll
+from craps.bets import PassLine, ComeBets, PlaceBets, Field, DontPass, LayBets, HardwayBets, Horn
+from craps.analysis import analyze_bets, exponential_moment, tilted_roll_probs, phase_transition_matrix, TOTAL_PROBS
+
+
+def test_total_probs_sum_to_one():
+    assert sum(TOTAL_PROBS.values()) == pytest.approx(1.0)
+
+
+def test_phase_transition_matrix():
+    matrix = phase_transition_matrix()
+    assert matrix.shape == (7, 7)
+    assert matrix.sum(axis=1) == pytest.approx([1.0] * 7)
+    assert matrix[0, 0] == pytest.approx(12 / 36)  # 2, 3, 7, 11, 12 stay on come-out
+    assert matrix[3, 0] == pytest.approx(11 / 36)  # point 6: 6 or 7 ends the round
+
+
+def test_pass_line():
+    pass_line = PassLine(TablePhase())
+    pass_line.set_stake(10.0)
+    result = analyze_bets({'pass_line': pass_line})
+    assert result.expected_value == pytest.approx(-10.0 * 7 / 495)
+    assert result.house_edge == pytest.approx(7 / 495)
+    # Net result is always +/- the stake
+    assert result.variance == pytest.approx(100.0 - result.expected_value ** 2)
+    assert result.expected_rolls == pytest.approx(557 / 165)
+
+
+def test_analysis_leaves_bets_untouched():
+    pass_line = PassLine(TablePhase())
+    pass_line.set_stake(10.0)
+    snapshot = pass_line.snapshot()
+    analyze_bets({'pass_line': pass_line})
+    assert pass_line.snapshot() == snapshot
+
+
+def test_pass_line_odds_have_no_edge():
+    pass_line = PassLine(TablePhase())
+    pass_line.set_stake(10.0)
+    pass_line.settle(Roll((2, 2)))  # Point on 4
+    pass_line.set_odds(20.0, target=4)
+    result = analyze_bets({'pass_line': pass_line})
+    # Flat bet on the 4 wins 1 in 3, odds pay 2:1
+    assert result.expected_value == pytest.approx(10.0 * (1 / 3 - 2 / 3))
+    assert result.expected_rolls == pytest.approx(4.0)
+
+
+def test_come_bet_matches_pass_line():
+    come = ComeBets(TablePhase(point=6))
+    come.set_stake(10.0)
+    result = analyze_bets({'come': come})
+    assert result.house_edge == pytest.approx(7 / 495)
+
+
+def test_place_6():
+    place = PlaceBets(TablePhase(point=8))
+    place.set_stake(6.0, target=6)
+    result = analyze_bets({'place': place})
+    # 5/6 expected wins at 7:6 before the seven-out
+    assert result.expected_value == pytest.approx(6.0 * (5 / 6 * 7 / 6 - 1))
+
+
+def test_field():
+    field = Field(TablePhase())
+    field.set_stake(10.0)
+    result = analyze_bets({'field': field})
+    assert result.expected_value == pytest.approx(-10.0 / 36)
+    assert result.variance == pytest.approx(100.0 * (47 / 36 - 1 / 36 ** 2))
+    assert result.expected_rolls == pytest.approx(1.0)
+    assert result.edge_per_roll == pytest.approx(1 / 36)
+
+
+def test_empty_layout_errors():
+    with pytest.raises(ValueError):
+        analyze_bets({'field': Field(TablePhase())})
+
+
+def test_dont_pass():
+    dont_pass = DontPass(TablePhase())
+    dont_pass.set_stake(10.0)
+    result = analyze_bets({'dont_pass': dont_pass})
+    # 3/220 per come-out decision; a barred 12 stays up for another come-out
+    assert result.house_edge == pytest.approx(3 / 220 * 36 / 35)
+
+
+def test_dont_pass_lay_odds_have_no_edge():
+    dont_pass = DontPass(TablePhase())
+    dont_pass.set_stake(10.0)
+    dont_pass.settle(Roll((2, 2)))  # Point on 4
+    dont_pass.set_odds(20.0, target=4)
+    result = analyze_bets({'dont_pass': dont_pass})
+    # Flat bet on the 4 wins 2 in 3, lay odds pay 1:2
+    assert result.expected_value == pytest.approx(10.0 * (2 / 3 - 1 / 3))
+
+
+def test_lay_4():
+    lay = LayBets(TablePhase())
+    lay.set_stake(40.0, target=4)
+    result = analyze_bets({'lay': lay})
+    # Stays up until the 4 rolls, winning 19 on each of the 2 expected sevens first
+    assert result.expected_value == pytest.approx(2 * 19.0 - 40.0)
+
+
+def test_hard_6_branches_over_dice():
+    hardways = HardwayBets(TablePhase(point=6))
+    hardways.set_stake(10.0, target=6)
+    result = analyze_bets({'hardways': hardways})
+    # Stays up until a 7 or easy 6, winning 9:1 on 1 in 11 decisions
+    assert result.expected_value == pytest.approx(10.0 * (9.0 * (1 / 10) - 1.0))
+
+
+def test_horn():
+    horn = Horn(TablePhase())
+    horn.set_stake(4.0)
+    result = analyze_bets({'horn': horn})
+    assert result.house_edge == pytest.approx(0.125)
+    assert result.expected_rolls == pytest.approx(1.0)
+
+
+def test_exponential_moment_of_pass_line():
+    pass_line = PassLine(TablePhase())
+    pass_line.set_stake(10.0)
+    p = 244 / 495
+    for theta in (-0.05, 0.0, 0.02):
+        moment = exponential_moment({'pass_line': pass_line}, theta)
+        assert moment == pytest.approx(p * exp(10 * theta) + (1 - p) * exp(-10 * theta))
+
+
+def test_tilted_roll_probs():
+    hard_six = HardwayBets(TablePhase(point=4))
+    hard_six.set_stake(10.0, target=6)
+    probs = tilted_roll_probs({'hardways': hard_six}, 0.01)
+    assert sum(probs) == pytest.approx(1.0)
+    # The winning 3-3 is favored over the other ways to make a six
+    assert probs[Roll((3, 3)).outcome_index()] > 1 / 36 > probs[Roll((2, 4)).outcome_index()]
+    assert tilted_roll_probs({'hardways': hard_six}, 0.0) == pytest.approx((1 / 36,) * 36)
+    # A hardway stays up after winning, so a strong tilt never lets it resolve
+    with pytest.raises(ValueError):
+        exponential_moment({'hardways': hard_six}, 0.1)
@@ -0,0 +1,131 @@
+import random
+import numpy as np
+import pytest
+from craps.batch import BatchTableConfig, BatchTableState
+from craps.bets import PassLine, ComeBets, PlaceBets, Field, DontPass, DontComeBets, LayBets, HardwayBets, Horn
+from craps.constants import POINTS, HARDWAYS
+from craps.dice import roll_from_index
+from craps.phase import TablePhase
+from craps.state import TableState, ActionStatus
+
+BETS = {
+    'pass_line': PassLine, 'come_bets': ComeBets, 'place_bets': PlaceBets, 'field': Field,
+    'dont_pass': DontPass, 'dont_come': DontComeBets, 'lay_bets': LayBets,
+    'hardways': HardwayBets, 'horn': Horn,
+}
+
+
+@pytest.fixture
+def config():
+    return BatchTableConfig.grid(
+        table_min=[5, 15], table_max=[500, 5000], odds_max=[2, 5], prop_min=[1], repeat=3
+    )
+
+
+def make_scalar(config, i, init_bankroll):
+    phase = TablePhase()
+    bets = {key: cls(phase) for key, cls in BETS.items()}
+    return TableState(config.get_config(i), bets, init_bankroll)
+
+
+def random_ops(rng):
+    ops = []
+    for _ in range(rng.randint(1, 3)):
+        key = rng.choice(list(BETS))
+        amount = rng.choice([0, 1, 5, 10, 15, 30, 60, 600])
+        if key in ('place_bets', 'lay_bets'):
+            ops.append((key, 'stake', amount, rng.choice(POINTS)))
+        elif key == 'hardways':
+            ops.append((key, 'stake', amount, rng.choice(HARDWAYS)))
+        elif key in ('pass_line', 'come_bets', 'dont_pass', 'dont_come') and rng.random() < 0.5:
+            ops.append((key, 'odds', amount, rng.choice(POINTS)))
+        else:
+            ops.append((key, 'stake', amount, None))
+    return ops
+
+
+def assert_matches(batch, scalars):
+    point = batch.get_point()
+    bankroll = batch.get_bankroll()
+    for i, scalar in enumerate(scalars):
+        assert point[i] == (scalar.get_phase().point or 0)
+        assert bankroll[i] == pytest.approx(scalar.get_bankroll_size())
+        for key in BETS:
+            for target in scalar.bets[key].get_stake_targets():
+                assert batch.get_bet_stake(key, target)[i] == pytest.approx(scalar.get_bet_stake(key, target))
+            for target in scalar.bets[key].get_odds_targets():
+                assert batch.get_bet_odds(key, target)[i] == pytest.approx(scalar.get_bet_odds(key, target))
+
+
+def test_config_broadcasts():
+    config = BatchTableConfig(table_min=[5, 10, 15], table_max=1000, odds_max=3, prop_min=1)
+    assert len(config) == 3
+    assert config.get_config(2).table_min == 15
+    assert config.get_config(2).table_max == 1000
+
+
+def test_grid_repeats(config):
+    assert len(config) == 2 * 2 * 2 * 3
+    assert config.get_config(0) == config.get_config(2)
+
+
+def test_matches_scalar_engine(config):
+    rng = random.Random(7)
+    init_bankroll = 300.0
+    batch = BatchTableState(config, BETS, init_bankroll)
+    scalars = [make_scalar(config, i, init_bankroll) for i in range(len(config))]
+
+    for _ in range(300):
+        ops = random_ops(rng)
+        status = batch.apply_bets(ops)
+        for i, scalar in enumerate(scalars):
+            assert status[i] == scalar.apply_bets(ops)
+        assert_matches(batch, scalars)
+
+        outcomes = np.array([rng.randrange(36) for _ in scalars])
+        batch.step(outcomes)
+        for scalar, outcome in zip(scalars, outcomes):
+            scalar.step(roll_from_index(int(outcome)))
+        assert_matches(batch, scalars)
+
+
+def test_limits_are_per_table():
+    config = BatchTableConfig(table_min=[5, 25], table_max=[100, 1000], odds_max=[1, 10], prop_min=1)
+    batch = BatchTableState(config, BETS, 1000.0)
+
+    status = batch.apply_bets([('pass_line', 'stake', 10, None)])
+    np.testing.assert_array_equal(status, [ActionStatus.OK, ActionStatus.ILLEGAL])
+
+    status = batch.apply_bets([('pass_line', 'stake', 200, None)])
+    np.testing.assert_array_equal(status, [ActionStatus.ILLEGAL, ActionStatus.OK])
+    np.testing.assert_array_equal(batch.get_bet_stake('pass_line'), [10, 200])
+    np.testing.assert_array_equal(batch.get_bankroll(), [990, 800])
+
+    batch.step(np.array([9, 9]))  # (2, 4): point on 6
+    np.testing.assert_array_equal(batch.get_point(), [6, 6])
+    status = batch.apply_bets([('pass_line', 'odds', np.array([20, 700]), 6)])
+    np.testing.assert_array_equal(status, [ActionStatus.ILLEGAL, ActionStatus.OK])
+
+
+def test_rejected_batch_is_all_or_nothing():
+    config = BatchTableConfig(table_min=[5, 5], table_max=1000, odds_max=3, prop_min=1)
+    batch = BatchTableState(config, BETS, [100.0, 20.0])
+    status = batch.apply_bets([('field', 'stake', 15, None), ('pass_line', 'stake', 15, None)])
+    np.testing.assert_array_equal(status, [ActionStatus.OK, ActionStatus.INSUFFICIENT_FUNDS])
+    np.testing.assert_array_equal(batch.get_bet_stake('field'), [15, 0])
+    np.testing.assert_array_equal(batch.get_bankroll(), [70, 20])
+
+
+def test_where_masks_tables():
+    config = BatchTableConfig(table_min=[5, 5], table_max=1000, odds_max=3, prop_min=1)
+    batch = BatchTableState(config, BETS, [100.0, 100.0])
+    batch.apply_bets([('field', 'stake', 10, None)], where=np.array([False, True]))
+    np.testing.assert_array_equal(batch.get_bet_stake('field'), [0, 10])
+
+
+def test_unknown_bet_class_errors():
+    class Other:
+        pass
+    config = BatchTableConfig(table_min=[5, 5], table_max=1000, odds_max=3, prop_min=1)
+    with pytest.raises(ValueError):
+        BatchTableState(config, {'other': Other}, 100.0)
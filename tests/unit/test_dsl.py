@@ -0,0 +1,143 @@
+import random
+import numpy as np
+import pytest
+from craps.batch import BatchTableConfig
+from craps.bets import PassLine, PlaceBets, Field
+from craps.dice import RandomDice, roll_from_index
+from craps.dsl import (
+    Expr, RuleStrategy, rule, point_on, comeout, point_established, stake, hits, rolled,
+    set_stake, set_odds, press, take_down, POINT,
+)
+from craps.state import TableConfig, TableState
+from craps.strategies import IronCross, PassLineOdds, SixEightExplosion
+from craps.tournament import play_session
+
+CONFIG = TableConfig(table_min=15, table_max=5000, odds_max=3, prop_min=5)
+
+
+def iron_cross():
+    return RuleStrategy(
+        {'place_bets': PlaceBets, 'field': Field},
+        [rule(point_on(), set_stake('field', 15), set_stake('place_bets', 15, 5),
+              set_stake('place_bets', 18, 6), set_stake('place_bets', 18, 8))],
+        name="iron_cross",
+    )
+
+
+def pass_line_odds():
+    return RuleStrategy(
+        {'pass_line': PassLine},
+        [
+            rule(comeout(), set_stake('pass_line', 15)),
+            rule(point_on() & (stake('pass_line') > 0), set_odds('pass_line', 30, POINT)),
+        ],
+    )
+
+
+def six_eight_explosion():
+    return RuleStrategy(
+        {'place_bets': PlaceBets},
+        [
+            rule(point_on() & (hits(6, 8) == 0), set_stake('place_bets', 18, 6), set_stake('place_bets', 18, 8)),
+            rule(point_on() & (hits(6, 8) > 0), set_stake('place_bets', 30, 6), set_stake('place_bets', 30, 8)),
+        ],
+    )
+
+
+@pytest.mark.parametrize("make_rules, legacy", [
+    (iron_cross, IronCross(unit=15.0)),
+    (pass_line_odds, PassLineOdds(unit=15.0, odds_multiple=2.0)),
+    (six_eight_explosion, SixEightExplosion(unit=18.0, press_to=30.0)),
+])
+def test_matches_handwritten_strategy(make_rules, legacy):
+    for seed in range(5):
+        expected = play_session(legacy, RandomDice(seed), CONFIG, 500.0, 300)
+        result = play_session(make_rules(), RandomDice(seed), CONFIG, 500.0, 300)
+        assert result == expected
+
+
+@pytest.mark.parametrize("make_rules", [iron_cross, pass_line_odds, six_eight_explosion])
+def test_batch_matches_scalar(make_rules):
+    config = BatchTableConfig.grid(table_min=[5, 15], table_max=[100, 5000], odds_max=[1, 3], prop_min=[1], repeat=2)
+    strategy = make_rules()
+    batch = strategy.make_batch(config, 300.0)
+    scalars = []
+    for i in range(len(config)):
+        s = make_rules()
+        scalars.append((s, TableState(config.get_config(i), s.make_bets(), 300.0)))
+
+    rng = random.Random(3)
+    for _ in range(200):
+        strategy.act_batch(batch)
+        for s, state in scalars:
+            s.act(state)
+        outcomes = np.array([rng.randrange(36) for _ in scalars])
+        batch.step(outcomes)
+        for (s, state), outcome in zip(scalars, outcomes):
+            state.step(roll_from_index(int(outcome)))
+
+        bankroll = batch.get_bankroll()
+        total_wager = batch.get_total_wager()
+        for i, (s, state) in enumerate(scalars):
+            assert bankroll[i] == pytest.approx(state.get_bankroll_size())
+            assert total_wager[i] == pytest.approx(state.get_total_wager())
+
+
+def test_press_after_two_hits():
+    strategy = RuleStrategy(
+        {'place_bets': PlaceBets},
+        [
+            rule(point_established(), set_stake('place_bets', 12, 6)),
+            rule(point_on() & rolled(6) & (hits(6) == 2), press('place_bets', 6)),
+        ],
+    )
+    config = BatchTableConfig(table_min=[5, 5], table_max=1000, odds_max=3, prop_min=1)
+    batch = strategy.make_batch(config, 1000.0)
+
+    def roll(total):
+        # Table 0 rolls total, table 1 rolls a 3
+        batch.step(np.array([{3: 1, 4: 2, 6: 14}[total], 1]))
+        strategy.act_batch(batch)
+
+    strategy.act_batch(batch)
+    roll(4)  # Point on 4 for table 0
+    assert batch.get_bet_stake('place_bets', 6).tolist() == [12.0, 0.0]
+    roll(6)
+    assert batch.get_bet_stake('place_bets', 6)[0] == 12.0
+    roll(6)
+    assert batch.get_bet_stake('place_bets', 6)[0] == 24.0
+    roll(6)
+    assert batch.get_bet_stake('place_bets', 6)[0] == 24.0
+
+
+def test_rule_with_many_actions():
+    # More actions than fit in one 64-bit word of change flags
+    unchanged = [set_stake('field', 0)] * 70
+    strategy = RuleStrategy(
+        {'place_bets': PlaceBets, 'field': Field},
+        [rule(point_on(), *unchanged, set_stake('place_bets', 18, 6), *unchanged, set_stake('place_bets', 18, 8))],
+    )
+    config = BatchTableConfig(table_min=[5, 5, 5], table_max=1000, odds_max=3, prop_min=1)
+    batch = strategy.make_batch(config, 1000.0)
+    batch.step(np.array([2, 1, 14]))  # Points on 4 and 6 for tables 0 and 2
+    batch.apply_bets([('place_bets', 'stake', 18.0, 6)], where=np.array([False, False, True]))
+    strategy.act_batch(batch)
+    assert batch.get_bet_stake('place_bets', 6).tolist() == [18.0, 0.0, 18.0]
+    assert batch.get_bet_stake('place_bets', 8).tolist() == [18.0, 0.0, 18.0]
+    assert batch.get_bet_stake('field').tolist() == [0.0, 0.0, 0.0]
+
+
+def test_take_down():
+    strategy = RuleStrategy({'field': Field}, [rule(True, set_stake('field', 20)), rule(stake('field') > 15, take_down('field'))])
+    state = TableState(CONFIG, strategy.make_bets(), 100.0)
+    strategy.act(state)
+    assert state.get_bet_stake('field') == 0.0
+    assert state.get_bankroll_size() == 100.0
+
+
+def test_incomplete_expression_fails_on_creation():
+    class NoEvaluate(Expr):
+        pass
+
+    with pytest.raises(TypeError):
+        NoEvaluate()
@@ -0,0 +1,62 @@
+"""
+Import-time budget tests. Each check runs in a fresh interpreter with
+`python -X importtime` and fails if a heavy dependency is imported or the
+module's cumulative import time exceeds its budget.
+"""
+import os
+import subprocess
+import sys
+from typing import Dict, List
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+HEAVY = ("numpy", "gymnasium", "torch", "stable_baselines3", "sb3_contrib", "wandb")
+
+# Generous budgets (microseconds) that still catch an accidental heavy import
+CORE_BUDGET_US = 250_000
+
+
+def import_times(code: str, *args: str) -> Dict[str, int]:
+    """Return cumulative import time (us) per imported module."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(p for p in sys.path if p))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *(["-c", code] if code else []), *args],
+        capture_output=True, text=True, env=env, cwd=ROOT
+    )
+    assert proc.returncode == 0, proc.stderr
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts = line[len("import time:"):].split("|")
+        if not parts[1].strip().isdigit():
+            continue
+        times[parts[2].strip()] = int(parts[1])
+    return times
+
+
+def heavy_modules(times: Dict[str, int]) -> List[str]:
+    return sorted(m for m in times if m.split(".")[0] in HEAVY)
+
+
+@pytest.mark.parametrize("module", [
+    "craps",
+    "craps.state",
+    "craps.bets",
+    "craps.dice",
+    "craps.strategies",
+    "craps.tournament",
+    "craps.stats",
+    "craps.gym",
+    "craps.gym.config",
+])
+def test_core_import_is_lightweight(module: str):
+    times = import_times(f"import {module}")
+    assert heavy_modules(times) == []
+    assert times[module] < CORE_BUDGET_US
+
+
+@pytest.mark.parametrize("script", ["train_agent.py"])
+def test_cli_help_skips_heavy_imports(script: str):
+    times = import_times("", os.path.join(ROOT, "scripts", script), "--help")
+    assert heavy_modules(times) == []
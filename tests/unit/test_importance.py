@@ -0,0 +1,120 @@
+from math import exp, log
+import pytest
+from craps.bets import PassLine
+from craps.importance import (
+    TiltedDice, ExponentialTilt, FAIR_PROBS, cramer_theta, estimate_probability,
+    play_weighted_session, probs_from_totals, weighted_mean
+)
+from craps.phase import TablePhase
+from craps.state import TableConfig, TableState
+from craps.strategies import PassLineOdds
+
+CONFIG = TableConfig(table_min=10, table_max=10000, odds_max=3, prop_min=5)
+P_WIN = 244 / 495
+
+
+def flat_pass_line() -> PassLineOdds:
+    return PassLineOdds(unit=10.0, odds_multiple=0.0)
+
+
+def hit_probability(k: int, n: int) -> float:
+    # Gambler's ruin: reach n units before 0 from k, winning each bet with P_WIN
+    r = (1 - P_WIN) / P_WIN
+    return (1 - r ** k) / (1 - r ** n)
+
+
+@pytest.fixture
+def pass_line_bets():
+    pass_line = PassLine(TablePhase())
+    pass_line.set_stake(10.0)
+    return {'pass_line': pass_line}
+
+
+class TestTiltedDice:
+    def test_fair_dice_have_unit_weight(self):
+        dice = TiltedDice(seed=0)
+        for _ in range(50):
+            dice.next_roll()
+        assert dice.weight == pytest.approx(1.0)
+
+    def test_weight_is_likelihood_ratio(self):
+        probs = probs_from_totals([1, 2, 3, 4, 5, 12, 5, 4, 3, 2, 1])
+        dice = TiltedDice([p * 2 for p in probs], seed=1)
+        expected = 1.0
+        for _ in range(20):
+            roll = dice.next_roll()
+            expected *= (1 / 36) / probs[roll.outcome_index()] * sum(probs)
+        assert dice.weight == pytest.approx(expected)
+        dice.new_episode()
+        assert dice.weight == 1.0
+
+    def test_tilted_rolls(self):
+        dice = TiltedDice(probs_from_totals([0.01] * 5 + [0.9] + [0.01] * 5), seed=2)
+        sevens = sum(dice.next_roll().total() == 7 for _ in range(1000))
+        assert sevens > 850
+
+    @pytest.mark.parametrize("probs", [[1 / 35] * 35, [0.0] + [1 / 35] * 35])
+    def test_invalid_probs(self, probs):
+        with pytest.raises(ValueError):
+            TiltedDice(probs)
+
+
+def test_cramer_theta(pass_line_bets):
+    # For +/-10 decisions, E[exp(theta * net)] = 1 at exp(10 theta) = q / p
+    assert cramer_theta(pass_line_bets) == pytest.approx(log((1 - P_WIN) / P_WIN) / 10)
+
+
+def test_exponential_tilt_is_fair_with_nothing_wagered():
+    state = TableState(CONFIG, flat_pass_line().make_bets(), 100.0)
+    assert ExponentialTilt(0.1)(state) == FAIR_PROBS
+
+
+def test_single_bet_win_probability():
+    # One pass line bet from one unit to two: the estimate is P(win) = 244/495
+    result = estimate_probability(flat_pass_line(), CONFIG, 10.0, 1000, 'target', 4000,
+                                  tilt=ExponentialTilt(-0.05), target=20.0, seed=3)
+    assert result.ci_low < P_WIN < result.ci_high
+    assert result.ess < result.n_sessions
+
+
+def test_cramer_tilt_hit_probability(pass_line_bets):
+    theta = cramer_theta(pass_line_bets)
+    tilt, dice = ExponentialTilt(theta), TiltedDice(seed=4)
+    weights = set()
+    hits = []
+    for _ in range(300):
+        result = play_weighted_session(flat_pass_line(), dice, CONFIG, 50.0, 10 ** 6, tilt, target=300.0)
+        hits.append(float(result.hit_target))
+        if result.hit_target:
+            weights.add(round(result.weight, 9))
+    # Every path to the target carries the same likelihood ratio
+    assert weights == {round(exp(-theta * 250), 9)}
+    estimate = weighted_mean(hits, [exp(-theta * 250)] * len(hits))
+    assert estimate.ci_low < hit_probability(5, 30) < estimate.ci_high
+
+
+def test_rare_target_beats_plain_monte_carlo(pass_line_bets):
+    # Doubling up from 5 units to 60 happens about 3% of the time
+    exact = hit_probability(5, 60)
+    kwargs = dict(event='target', n_sessions=150, target=600.0, seed=5)
+    tilted = estimate_probability(flat_pass_line(), CONFIG, 50.0, 10 ** 6,
+                                  tilt=ExponentialTilt(cramer_theta(pass_line_bets)), **kwargs)
+    assert tilted.ci_low < exact < tilted.ci_high
+    # Plain Monte Carlo's binomial standard error for the same sessions
+    assert tilted.std_error < (exact * (1 - exact) / 150) ** 0.5 / 2
+
+
+def test_ruin_probability():
+    exact = 1 - hit_probability(3, 4)
+    result = estimate_probability(flat_pass_line(), CONFIG, 30.0, 10 ** 6, 'ruin', 3000,
+                                  tilt=ExponentialTilt(-0.03), target=40.0, seed=6)
+    assert result.ci_low < exact < result.ci_high
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        estimate_probability(flat_pass_line(), CONFIG, 10.0, 10, 'bust', 1)
+    with pytest.raises(ValueError):
+        estimate_probability(flat_pass_line(), CONFIG, 10.0, 10, 'target', 1)
+    with pytest.raises(ValueError):
+        weighted_mean([], [])
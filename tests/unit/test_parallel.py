@@ -0,0 +1,51 @@
+import pytest
+from craps.parallel import run_sessions, summarize_sessions, gil_enabled, default_executor, SeededSessionDice
+from craps.seeding import SeedTree
+from craps.state import TableConfig
+from craps.strategies import SixEightExplosion, ThreePointMolly
+from craps.tournament import play_session
+
+CONFIG = TableConfig(table_min=15, table_max=10000, odds_max=3, prop_min=5)
+
+
+def test_default_executor():
+    assert default_executor() == ('process' if gil_enabled() else 'thread')
+
+
+@pytest.mark.parametrize("executor", ['thread', 'process'])
+def test_matches_serial(executor: str):
+    # Stateful strategies must not leak bookkeeping between sessions or threads
+    for strategy in (SixEightExplosion(), ThreePointMolly()):
+        expected = [play_session(strategy, SeededSessionDice(4)(i), CONFIG, 300.0, 50) for i in range(24)]
+        results = run_sessions(strategy, 24, CONFIG, 300.0, 50, seed=4, max_workers=3, executor=executor, chunk_size=5)
+        assert results == expected
+
+
+def test_sessions_get_distinct_dice():
+    dice = SeededSessionDice(0)
+    assert [dice(0).next_roll() for _ in range(20)] != [dice(1).next_roll() for _ in range(20)]
+
+
+def test_session_dice_follow_seed_tree():
+    dice = SeededSessionDice(None)
+    assert dice.get_seed_path(5) == (0, 0, 0, 5)
+    # A run with fresh entropy can be replayed from its metadata
+    replay = SeededSessionDice(SeedTree.from_metadata(dice.metadata()).root)
+    assert [replay(5).next_roll() for _ in range(20)] == [dice(5).next_roll() for _ in range(20)]
+    # Large session indices do not run into another seed's streams
+    assert SeededSessionDice(0)(2 ** 32).rng.getstate() != SeededSessionDice(1)(0).rng.getstate()
+
+
+def test_unknown_executor_errors():
+    with pytest.raises(ValueError):
+        run_sessions(SixEightExplosion(), 2, CONFIG, 100.0, 10, executor='fibers')
+
+
+def test_summarize_matches_results():
+    results = run_sessions(ThreePointMolly(), 30, CONFIG, 300.0, 40, seed=2, max_workers=1)
+    nets, rolls = summarize_sessions(ThreePointMolly(), 30, CONFIG, 300.0, 40, seed=2,
+                                     edges=[-300, 0, 300], max_workers=3, executor='thread', chunk_size=7)
+    assert nets.moments.count == rolls.count == 30
+    assert nets.moments.mean == pytest.approx(sum(r.net for r in results) / 30)
+    assert rolls.mean == pytest.approx(sum(r.rolls for r in results) / 30)
+    assert nets.histogram.total == 30
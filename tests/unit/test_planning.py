@@ -0,0 +1,204 @@
+import pytest
+from craps.bets import PassLine, Field, PlaceBets
+from craps.dice import Roll, ROLLS
+from craps.phase import TablePhase
+from craps.planning import ExpectimaxPlanner, PolicyEvaluator, equity, expected_step, roll_branches, TOTAL_BRANCHES
+from craps.state import TableConfig, TableState, ActionStatus
+
+CONFIG = TableConfig(table_min=5, table_max=1000, odds_max=3, prop_min=1)
+
+
+@pytest.fixture
+def state():
+    init_phase = TablePhase()
+    bets = {'pass_line': PassLine(init_phase), 'place_bets': PlaceBets(init_phase), 'field': Field(init_phase)}
+    return TableState(CONFIG, bets, 500.0)
+
+
+def brute_force(state: TableState, depth: int) -> float:
+    """Expected equity after depth rolls with no further betting, over all 36 pairs."""
+    if depth == 0:
+        return equity(state)
+    snapshot = state.snapshot()
+    total = 0.0
+    for roll in ROLLS:
+        state.step(roll)
+        total += brute_force(state, depth - 1) / 36
+        state.restore(snapshot)
+    return total
+
+
+class TestSnapshot:
+    def test_round_trip(self, state: TableState):
+        state.set_bet_stake('pass_line', 10.0)
+        snapshot = state.snapshot()
+        state.step(Roll((3, 3)))
+        state.set_bet_odds('pass_line', 30.0, target=6)
+        state.set_bet_stake('place_bets', 12.0, target=8)
+        state.restore(snapshot)
+        assert state.get_phase().point is None
+        assert state.get_bankroll_size() == 490.0
+        assert state.get_roll_count() == 0
+        assert state.get_last_roll() is None
+        assert state.get_active_bets() == ('pass_line',)
+        assert state.get_bet_stake('place_bets', target=8) == 0.0
+        assert state.bets['pass_line'].can_set_stake()
+
+    def test_snapshot_is_hashable(self, state: TableState):
+        state.set_bet_stake('field', 10.0)
+        assert hash(state.snapshot()) == hash(state.snapshot())
+
+    def test_restored_state_replays_identically(self, state: TableState):
+        state.set_bet_stake('pass_line', 10.0)
+        snapshot = state.snapshot()
+        rolls = [Roll((2, 2)), Roll((5, 6)), Roll((1, 3))]
+        results = []
+        for _ in range(2):
+            for roll in rolls:
+                state.step(roll)
+            results.append(state.snapshot())
+            state.restore(snapshot)
+        assert results[0] == results[1]
+
+
+class TestExpectimax:
+    def test_no_actions_matches_brute_force(self, state: TableState):
+        state.set_bet_stake('pass_line', 10.0)
+        state.set_bet_stake('field', 10.0)
+        planner = ExpectimaxPlanner(lambda s: [], depth=2)
+        assert planner.evaluate(state) == pytest.approx(brute_force(state, 2))
+
+    def test_depth_one_value_is_roll_risk(self, state: TableState):
+        state.set_bet_stake('pass_line', 10.0)
+        planner = ExpectimaxPlanner(lambda s: [], depth=1)
+        assert planner.evaluate(state) == pytest.approx(equity(state) + state.get_roll_risk().expected_value)
+
+    def test_picks_best_action(self, state: TableState):
+        actions = [[('field', 'stake', 10.0, None)], [('pass_line', 'stake', 10.0, None)]]
+        plan = ExpectimaxPlanner(lambda s: actions, depth=1).plan(state)
+        # One roll ahead the pass line wins 10 on 8/36 and loses 10 on 4/36,
+        # while the field loses 10/36 on average
+        assert plan.ops == actions[1]
+        assert plan.value == pytest.approx(500.0 + 40 / 36)
+
+    def test_does_nothing_when_every_bet_loses(self, state: TableState):
+        state.step(Roll((3, 3)))
+        plan = ExpectimaxPlanner(lambda s: [[('field', 'stake', 10.0, None)]], depth=2).plan(state)
+        assert plan.ops == []
+        assert plan.value == 500.0
+
+    def test_skips_rejected_actions(self, state: TableState):
+        actions = [[('place_bets', 'stake', 12.0, 6)]]  # Not allowed on the come-out
+        assert ExpectimaxPlanner(lambda s: actions, depth=1).plan(state).ops == []
+
+    def test_plan_leaves_state_unchanged(self, state: TableState):
+        state.set_bet_stake('pass_line', 10.0)
+        before = state.snapshot()
+        actions = lambda s: [[('field', 'stake', 10.0, None)], [('pass_line', 'odds', 20.0, s.get_phase().point or 4)]]
+        plan = ExpectimaxPlanner(actions, depth=2).plan(state)
+        assert state.snapshot() == before
+        assert plan.nodes > 1
+
+    def test_uses_totals_for_total_only_bets(self, state: TableState):
+        assert roll_branches(state) is TOTAL_BRANCHES
+        assert sum(p for _, p in TOTAL_BRANCHES) == pytest.approx(1.0)
+
+    def test_depth_must_be_positive(self):
+        with pytest.raises(ValueError):
+            ExpectimaxPlanner(lambda s: [], depth=0)
+
+
+def brute_force_policy(state: TableState, policy, depth: int) -> float:
+    """Expected equity after following policy for depth rolls, over all 36 pairs."""
+    if depth == 0:
+        return equity(state)
+    snapshot = state.snapshot()
+    ops = policy(state)
+    if ops:
+        state.apply_bets(ops)
+    after_ops = state.snapshot()
+    total = 0.0
+    for roll in ROLLS:
+        state.step(roll)
+        total += brute_force_policy(state, policy, depth - 1) / 36
+        state.restore(after_ops)
+    state.restore(snapshot)
+    return total
+
+
+def pass_line_policy(state: TableState):
+    point = state.get_phase().point
+    if point is None and state.get_bet_stake('pass_line') == 0:
+        return [('pass_line', 'stake', 10.0, None)]
+    if point is not None and state.get_bet_odds('pass_line', target=point) == 0:
+        return [('pass_line', 'odds', 20.0, point)]
+    return None
+
+
+def field_after_eleven_policy(state: TableState):
+    # Same table after a 7 or an 11 on the come-out, different decision
+    last_roll = state.get_last_roll()
+    if last_roll is not None and last_roll.total() == 11 and state.get_bet_stake('field') == 0:
+        return [('field', 'stake', 10.0, None)]
+    return None
+
+
+class TestExpectedStep:
+    def test_branches_cover_all_outcomes(self, state: TableState):
+        status, branches = expected_step(state, [('pass_line', 'stake', 10.0, None)])
+        assert status == ActionStatus.OK
+        assert len(branches) == 11
+        assert sum(b.probability for b in branches) == pytest.approx(1.0)
+        # Expected payout matches the one-roll payout vector
+        expected = sum(b.probability * b.payout for b in branches)
+        assert expected == pytest.approx(20.0 * 8 / 36)
+
+    def test_state_is_unchanged(self, state: TableState):
+        before = state.snapshot()
+        expected_step(state, [('field', 'stake', 10.0, None)])
+        assert state.snapshot() == before
+
+    def test_successors_can_be_restored(self, state: TableState):
+        _, branches = expected_step(state, [('pass_line', 'stake', 10.0, None)])
+        six = next(b for b in branches if b.roll.total() == 6)
+        state.restore(six.snapshot)
+        assert state.get_phase().point == 6
+        assert state.get_bet_stake('pass_line') == 10.0
+
+    def test_rejected_ops_still_roll(self, state: TableState):
+        status, branches = expected_step(state, [('place_bets', 'stake', 12.0, 6)])
+        assert status == ActionStatus.ILLEGAL
+        assert all(b.payout == 0.0 for b in branches)
+
+
+class TestPolicyEvaluator:
+    def test_matches_brute_force(self, state: TableState):
+        evaluator = PolicyEvaluator(pass_line_policy, horizon=3)
+        assert evaluator.evaluate(state) == pytest.approx(brute_force_policy(state, pass_line_policy, 3))
+
+    def test_memoizes_repeated_states(self, state: TableState):
+        evaluator = PolicyEvaluator(pass_line_policy, horizon=4)
+        evaluator.evaluate(state)
+        assert evaluator.n_cache_hits > 0
+        assert evaluator.n_evaluated < sum(11 ** d for d in range(4))
+
+    def test_strategy_act_is_a_policy(self):
+        from craps.strategies import PassLineOdds
+        strategy = PassLineOdds(unit=10.0, odds_multiple=2.0)
+        state = TableState(CONFIG, strategy.make_bets(), 500.0)
+        exact = PolicyEvaluator(strategy.act, horizon=3).evaluate(state)
+        assert exact == pytest.approx(brute_force_policy(state, strategy.act, 3))
+
+    def test_last_roll_is_part_of_the_state(self, state: TableState):
+        evaluator = PolicyEvaluator(field_after_eleven_policy, horizon=3)
+        assert evaluator.evaluate(state) == pytest.approx(brute_force_policy(state, field_after_eleven_policy, 3))
+
+    def test_bankroll_buckets_share_results(self, state: TableState):
+        exact = PolicyEvaluator(pass_line_policy, horizon=4)
+        bucketed = PolicyEvaluator(pass_line_policy, horizon=4, bankroll_bucket=1000.0)
+        assert bucketed.evaluate(state) == pytest.approx(exact.evaluate(state))
+        assert bucketed.n_evaluated < exact.n_evaluated
+
+    def test_zero_horizon_is_equity(self, state: TableState):
+        state.set_bet_stake('field', 10.0)
+        assert PolicyEvaluator(pass_line_policy, horizon=0).evaluate(state) == 500.0
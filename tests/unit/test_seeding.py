@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+from craps.seeding import SeedTree, EpisodeDice
+
+
+def rolls(dice, n=50):
+    return [dice.next_roll() for _ in range(n)]
+
+
+def test_path_matches_spawning():
+    tree = SeedTree(1234)
+    spawned = np.random.SeedSequence(1234).spawn(3)[2].spawn(2)[1].spawn(5)[4].spawn(8)[7]
+    direct = tree.sequence(2, 1, 4, 7)
+    assert np.array_equal(spawned.generate_state(4), direct.generate_state(4))
+
+
+def test_paths_are_distinct():
+    tree = SeedTree(0)
+    states = {tuple(tree.sequence(0, 0, env, episode).generate_state(2)) for env in range(8) for episode in range(50)}
+    assert len(states) == 8 * 50
+
+
+def test_root_is_recorded():
+    tree = SeedTree()
+    copy = SeedTree.from_metadata(tree.metadata())
+    assert copy.root == tree.root
+    assert copy.int_seed(0, 1) == tree.int_seed(0, 1)
+
+
+def test_too_many_levels_errors():
+    with pytest.raises(ValueError):
+        SeedTree(0).sequence(0, 0, 0, 0, 0)
+
+
+def test_episode_replays_in_isolation():
+    tree = SeedTree(42)
+    dice = tree.dice(node=1, worker=0, env=3)
+    episodes = []
+    for _ in range(5):
+        dice.new_episode()
+        episodes.append((dice.get_seed_path(), rolls(dice)))
+    assert episodes[3][0] == (1, 0, 3, 3)
+
+    # Rebuild episode 3 alone, from the recorded metadata
+    replay = SeedTree.from_metadata(tree.metadata()).dice(*episodes[3][0][:3])
+    replay.start_episode(episodes[3][0][3])
+    assert rolls(replay) == episodes[3][1]
+    assert episodes[2][1] != episodes[3][1]
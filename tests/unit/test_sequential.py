@@ -0,0 +1,91 @@
+import pytest
+from craps.parallel import run_sessions
+from craps.sequential import evaluate_until, loss_per_roll_ci, wilson_ci
+from craps.state import TableConfig
+from craps.stats import Covariance
+from craps.strategies import PassLineOdds, ThreePointMolly
+
+CONFIG = TableConfig(table_min=15, table_max=10000, odds_max=3, prop_min=5)
+
+
+def test_stops_at_target_width():
+    result = evaluate_until(PassLineOdds(), CONFIG, 300.0, 30, ci_width=0.5, initial_sessions=50, max_workers=1)
+    assert result.converged
+    assert result.width <= 0.5
+    assert result.n_batches == len(result.history) > 1
+    assert result.history[-1][0] == result.n_sessions
+    assert 0 < result.n_rolls <= 30 * result.n_sessions
+    # A $15 pass line loses 15 * 7/495 per decision, one every 557/165 rolls
+    assert result.ci_low < 15 * 7 / 495 / (557 / 165) < result.ci_high
+
+
+def test_tighter_target_uses_more_rolls():
+    kwargs = dict(initial_sessions=50, max_workers=1)
+    loose = evaluate_until(PassLineOdds(), CONFIG, 300.0, 30, ci_width=1.0, **kwargs)
+    tight = evaluate_until(PassLineOdds(), CONFIG, 300.0, 30, ci_width=0.25, **kwargs)
+    assert tight.n_rolls > loose.n_rolls
+
+
+def test_stops_at_max_sessions():
+    result = evaluate_until(ThreePointMolly(), CONFIG, 300.0, 20, ci_width=1e-6,
+                            initial_sessions=20, max_sessions=100, max_workers=1)
+    assert not result.converged
+    assert result.n_sessions == 100
+
+
+def test_ruin():
+    result = evaluate_until(ThreePointMolly(), CONFIG, 100.0, 200, ci_width=0.1, metric='ruin',
+                            initial_sessions=100, max_workers=1)
+    assert result.converged
+    assert 0 <= result.ci_low <= result.estimate <= result.ci_high <= 1
+
+
+def test_cpt():
+    result = evaluate_until(PassLineOdds(), CONFIG, 300.0, 30, ci_width=0.05, metric='cpt',
+                            initial_sessions=200, n_bootstrap=50, max_workers=1)
+    assert result.ci_low <= result.estimate <= result.ci_high
+    assert result.converged
+
+
+def test_wilson_without_successes():
+    p, low, high = wilson_ci(0, 100, 0.95)
+    assert p == low == 0.0
+    assert 0 < high < 0.05
+
+
+def test_loss_per_roll_ci():
+    net_rolls = Covariance()
+    for net, rolls in [(-10, 5), (-20, 10), (-30, 15)]:
+        net_rolls.add(net, rolls)
+    # Every session lost exactly 2 per roll, so the interval collapses
+    assert loss_per_roll_ci(net_rolls, 0.95) == pytest.approx((2.0, 2.0, 2.0))
+
+
+def test_reports_exact_roll_count():
+    result = evaluate_until(ThreePointMolly(), CONFIG, 300.0, 20, ci_width=1e-6,
+                            initial_sessions=10, max_sessions=40, max_workers=3, executor='thread')
+    expected = sum(r.rolls for r in run_sessions(ThreePointMolly(), 40, CONFIG, 300.0, 20, max_workers=1))
+    assert isinstance(result.n_rolls, int)
+    assert result.n_rolls == expected
+
+
+def test_small_growth_still_progresses():
+    # 5 * (1.1 - 1) sessions would truncate to an empty batch
+    result = evaluate_until(PassLineOdds(), CONFIG, 300.0, 30, ci_width=0.01,
+                            initial_sessions=5, growth=1.1, max_sessions=40, max_workers=1)
+    assert not result.converged
+    assert result.n_sessions == 40
+    counts = [n for n, _ in result.history]
+    assert all(a < b for a, b in zip(counts, counts[1:]))
+
+
+@pytest.mark.parametrize("kwargs", [
+    dict(metric='sharpe'),
+    dict(ci_width=0.0),
+    dict(growth=1.0),
+    dict(initial_sessions=0),
+    dict(max_sessions=0),
+])
+def test_invalid_arguments(kwargs):
+    with pytest.raises(ValueError):
+        evaluate_until(PassLineOdds(), CONFIG, 300.0, 30, **{'ci_width': 0.5, **kwargs})
@@ -1,8 +1,8 @@
 from typing import Optional
 import pytest
 from craps.phase import TablePhase
-from craps.state import TableConfig, TableState
-from craps.dice import Roll
+from craps.state import TableConfig, TableState, ActionStatus
+from craps.dice import Roll, ROLLS
 from craps.bets.model import Bet, requires_target
 from craps.exceptions import InsufficientFunds, IllegalAction
 
@@ -291,3 +291,163 @@ class TestBetLimits:
         assert state_with_prop.get_bet_odds('dummy', target=6) == 50.0
         state_with_prop.set_bet_odds('dummy', 0.0, target=6)
         assert state_with_prop.get_bet_odds('dummy', target=6) == 0.0
+
+
+class TestCheckBets:
+    def test_legal_batch_is_ok(self, state: TableState):
+        ops = [('dummy', 'stake', 50.0, 6), ('dummy', 'odds', 100.0, 6)]
+        assert state.check_bets(ops) == ActionStatus.OK
+
+    def test_check_does_not_mutate(self, state: TableState):
+        state.check_bets([('dummy', 'stake', 50.0, 6)])
+        assert state.get_bet_stake('dummy', target=6) == 0.0
+        assert state.get_bankroll_size() == 200.0
+
+    def test_below_min_is_illegal(self, state: TableState):
+        assert state.check_bets([('dummy', 'stake', 10.0, 6)]) == ActionStatus.ILLEGAL
+
+    def test_above_max_is_illegal(self, state: TableState):
+        assert state.check_bets([('dummy', 'stake', 20000.0, 6)]) == ActionStatus.ILLEGAL
+
+    def test_odds_cap_uses_pending_stake(self, state: TableState):
+        ops = [('dummy', 'stake', 30.0, 6), ('dummy', 'odds', 100.0, 6)]
+        assert state.check_bets(ops) == ActionStatus.ILLEGAL
+        ops = [('dummy', 'stake', 30.0, 6), ('dummy', 'odds', 90.0, 6)]
+        assert state.check_bets(ops) == ActionStatus.OK
+
+    def test_batch_exceeding_bankroll_is_insufficient(self, state: TableState):
+        ops = [('dummy', 'stake', 100.0, 6), ('dummy', 'stake', 150.0, 8)]
+        assert state.check_bets(ops) == ActionStatus.INSUFFICIENT_FUNDS
+
+    def test_take_down_frees_funds_for_later_ops(self, state: TableState):
+        state.set_bet_stake('dummy', 150.0, target=6)
+        ops = [('dummy', 'stake', 0.0, 6), ('dummy', 'stake', 180.0, 8)]
+        assert state.check_bets(ops) == ActionStatus.OK
+
+    def test_checked_batch_applies_without_raising(self, state: TableState):
+        ops = [('dummy', 'stake', 50.0, 6), ('dummy', 'odds', 150.0, 6)]
+        assert state.check_bets(ops) == ActionStatus.OK
+        state.set_bet_stake('dummy', 50.0, target=6)
+        state.set_bet_odds('dummy', 150.0, target=6)
+        assert state.get_bankroll_size() == 0.0
+
+
+class TestApplyBets:
+    def test_applies_whole_batch(self, state: TableState):
+        ops = [('dummy', 'stake', 50.0, 6), ('dummy', 'odds', 100.0, 6)]
+        assert state.apply_bets(ops) == ActionStatus.OK
+        assert state.get_bet_stake('dummy', target=6) == 50.0
+        assert state.get_bet_odds('dummy', target=6) == 100.0
+        assert state.get_bankroll_size() == 50.0
+
+    def test_rejected_batch_changes_nothing(self, state: TableState):
+        ops = [('dummy', 'stake', 50.0, 6), ('dummy', 'stake', 500.0, 8)]
+        assert state.apply_bets(ops) == ActionStatus.INSUFFICIENT_FUNDS
+        assert state.get_bet_stake('dummy', target=6) == 0.0
+        assert state.get_bankroll_size() == 200.0
+
+    def test_rolls_back_on_failure_during_commit(self, state: TableState):
+        bet = state.bets['dummy']
+        set_stake = bet._set_stake
+
+        def failing_set_stake(amount, target=None):
+            if target == 8:
+                raise IllegalAction("No stakes on 8")
+            set_stake(amount, target=target)
+
+        bet._set_stake = failing_set_stake
+        ops = [('dummy', 'stake', 50.0, 6), ('dummy', 'stake', 30.0, 5), ('dummy', 'stake', 25.0, 8)]
+        assert state.apply_bets(ops) == ActionStatus.ILLEGAL
+        assert state.get_bet_stake('dummy', target=6) == 0.0
+        assert state.get_bet_stake('dummy', target=5) == 0.0
+        assert state.get_bankroll_size() == 200.0
+
+
+class TestActiveBets:
+    @pytest.fixture
+    def real_state(self):
+        from craps.bets import PassLine, Field
+        config = TableConfig(table_min=5, table_max=1000, odds_max=3, prop_min=1)
+        init_phase = TablePhase()
+        return TableState(config, {'pass_line': PassLine(init_phase), 'field': Field(init_phase)}, 200.0)
+
+    def test_starts_empty(self, real_state: TableState):
+        assert real_state.get_active_bets() == ()
+
+    def test_setting_a_wager_activates(self, real_state: TableState):
+        real_state.set_bet_stake('field', 10.0)
+        assert real_state.get_active_bets() == ('field',)
+
+    def test_taking_down_deactivates(self, real_state: TableState):
+        real_state.set_bet_stake('field', 10.0)
+        real_state.set_bet_stake('field', 0.0)
+        assert real_state.get_active_bets() == ()
+
+    def test_resolved_bets_deactivate(self, real_state: TableState):
+        real_state.set_bet_stake('pass_line', 10.0)
+        real_state.set_bet_stake('field', 10.0)
+        real_state.step(Roll((2, 2)))  # Field wins and resolves, pass line point on 4
+        assert real_state.get_active_bets() == ('pass_line',)
+        real_state.step(Roll((3, 4)))  # Seven-out
+        assert real_state.get_active_bets() == ()
+        assert real_state.get_bankroll_size() == 200.0 - 20.0 + 20.0
+
+    def test_inactive_bets_track_phase(self, real_state: TableState):
+        real_state.step(Roll((3, 3)))
+        assert real_state.bets['pass_line'].can_set_odds(target=6) is False
+        assert real_state.bets['pass_line'].can_set_stake() is False
+        real_state.step(Roll((3, 3)))
+        assert real_state.bets['pass_line'].can_set_stake() is True
+
+    def test_rolled_back_batch_restores_active_set(self, real_state: TableState):
+        real_state.set_bet_stake('field', 10.0)
+        ops = [('field', 'stake', 0.0, None), ('pass_line', 'stake', 500.0, None)]
+        assert real_state.apply_bets(ops) == ActionStatus.INSUFFICIENT_FUNDS
+        assert real_state.get_active_bets() == ('field',)
+
+    def test_refresh_picks_up_direct_changes(self, real_state: TableState):
+        real_state.bets['field'].set_stake(10.0)
+        real_state.refresh_active_bets()
+        assert real_state.get_active_bets() == ('field',)
+
+
+class TestRollVectors:
+    @pytest.fixture
+    def real_state(self):
+        from craps.bets import PassLine, Field
+        config = TableConfig(table_min=5, table_max=1000, odds_max=3, prop_min=1)
+        init_phase = TablePhase()
+        return TableState(config, {'pass_line': PassLine(init_phase), 'field': Field(init_phase)}, 200.0)
+
+    def test_empty_table_has_no_risk(self, real_state: TableState):
+        risk = real_state.get_roll_risk()
+        assert (risk.expected_value, risk.variance, risk.worst_case) == (0.0, 0.0, 0.0)
+
+    def test_vectors_sum_over_bets(self, real_state: TableState):
+        real_state.set_bet_stake('pass_line', 10.0)
+        real_state.set_bet_stake('field', 10.0)
+        payouts = real_state.get_payouts_by_total()
+        assert payouts[2 - 2] == 30.0     # Field 3x, pass line loses
+        assert payouts[7 - 2] == 20.0     # Pass line wins, field loses
+        assert payouts[11 - 2] == 40.0    # Both win
+        assert real_state.get_net_by_total()[6 - 2] == -10.0  # Field loses, pass line moves to the point
+
+    def test_roll_risk_matches_stepping(self, real_state: TableState):
+        real_state.set_bet_stake('pass_line', 10.0)
+        real_state.step(Roll((2, 2)))
+        real_state.set_bet_odds('pass_line', 20.0, target=4)
+        real_state.set_bet_stake('field', 10.0)
+        risk = real_state.get_roll_risk()
+
+        nets = []
+        for roll in ROLLS:
+            snapshot = real_state._snapshot_wagers()
+            equity = real_state.get_bankroll_size() + real_state.get_total_wager()
+            real_state.step(roll)
+            nets.append(real_state.get_bankroll_size() + real_state.get_total_wager() - equity)
+            real_state._restore_wagers(snapshot)
+        mean = sum(nets) / 36
+        assert risk.expected_value == pytest.approx(mean)
+        assert risk.variance == pytest.approx(sum((x - mean) ** 2 for x in nets) / 36)
+        assert risk.worst_case == min(nets) == -40.0
+        assert risk.best_case == max(nets)
@@ -0,0 +1,139 @@
+import pickle
+import random
+from statistics import fmean, variance
+import pytest
+from craps.stats import Moments, Covariance, TDigest, Histogram, Summary, merge_all
+
+
+@pytest.fixture
+def values():
+    rng = random.Random(7)
+    return [rng.gauss(10, 3) for _ in range(20000)]
+
+
+class TestMoments:
+    def test_matches_batch(self, values):
+        m = Moments()
+        m.extend(values)
+        assert m.count == len(values)
+        assert m.mean == pytest.approx(fmean(values))
+        assert m.variance() == pytest.approx(variance(values))
+        assert (m.min, m.max) == (min(values), max(values))
+
+    def test_merge_equals_single_pass(self, values):
+        parts = []
+        for chunk in (values[:5], values[5:12000], [], values[12000:]):
+            part = Moments()
+            part.extend(chunk)
+            parts.append(part)
+        merged = merge_all(parts)
+        assert merged.count == len(values)
+        assert merged.mean == pytest.approx(fmean(values))
+        assert merged.variance() == pytest.approx(variance(values))
+        assert merged.min == min(values)
+
+    def test_ci_covers_mean(self, values):
+        m = Moments()
+        m.extend(values)
+        low, high = m.ci(0.95)
+        assert low < 10 < high
+
+    def test_empty(self):
+        m = Moments()
+        assert m.variance() == 0.0
+        assert m.merge(Moments()).count == 0
+
+
+class TestTDigest:
+    @pytest.mark.parametrize("q", [0.001, 0.01, 0.1, 0.5, 0.9, 0.99, 0.999])
+    def test_quantile_accuracy(self, values, q):
+        digest = TDigest()
+        digest.extend(values)
+        exact = sorted(values)
+        # Error measured in rank, the t-digest's natural scale
+        rank = sum(x <= digest.quantile(q) for x in exact) / len(exact)
+        assert rank == pytest.approx(q, abs=0.005)
+
+    def test_size_is_bounded(self, values):
+        digest = TDigest(compression=50)
+        digest.extend(values)
+        digest.quantile(0.5)
+        assert len(digest.centroids) < 100
+
+    def test_merge(self, values):
+        whole = TDigest()
+        whole.extend(values)
+        parts = []
+        for i in range(8):
+            part = TDigest()
+            part.extend(values[i::8])
+            parts.append(pickle.loads(pickle.dumps(part)))
+        merged = merge_all(parts)
+        assert merged.count == len(values)
+        assert (merged.min, merged.max) == (min(values), max(values))
+        for q in (0.01, 0.5, 0.99):
+            assert merged.quantile(q) == pytest.approx(whole.quantile(q), rel=0.01)
+
+    def test_small_samples_are_exact_at_ends(self):
+        digest = TDigest()
+        digest.extend([3.0, 1.0, 2.0])
+        assert digest.quantile(0) == 1.0
+        assert digest.quantile(1) == 3.0
+        assert digest.quantile(0.5) == 2.0
+
+    def test_errors(self):
+        with pytest.raises(ValueError):
+            TDigest().quantile(0.5)
+        with pytest.raises(ValueError):
+            TDigest().quantile(1.5)
+
+
+class TestHistogram:
+    def test_binning(self):
+        h = Histogram([0, 1, 2, 4])
+        h.extend([-1, 0, 0.5, 1, 3.9, 4, 5])
+        assert h.counts == [2, 1, 2]
+        assert (h.underflow, h.overflow, h.total) == (1, 1, 7)
+
+    def test_linear(self):
+        assert Histogram.linear(0, 10, 5).edges == [0, 2, 4, 6, 8, 10]
+
+    def test_merge(self):
+        a, b = Histogram.linear(0, 1, 4), Histogram.linear(0, 1, 4)
+        a.extend([0.1, 0.6])
+        b.extend([0.1, 2])
+        assert a.merge(b).counts == [2, 0, 1, 0]
+        assert a.overflow == 1
+        with pytest.raises(ValueError):
+            a.merge(Histogram([0, 1]))
+
+    def test_bad_edges(self):
+        with pytest.raises(ValueError):
+            Histogram([1, 1, 2])
+
+
+def test_summary(values):
+    parts = [Summary(edges=[0, 10, 20]) for _ in range(2)]
+    parts[0].extend(values[:100])
+    parts[1].extend(values[100:])
+    summary = merge_all(parts)
+    stats = summary.to_dict(qs=(0.5,))
+    assert stats['count'] == len(values)
+    assert stats['quantiles']['0.5'] == pytest.approx(10, abs=0.1)
+    assert sum(stats['histogram']['counts']) + stats['histogram']['underflow'] + stats['histogram']['overflow'] == len(values)
+    with pytest.raises(ValueError):
+        summary.merge(Summary())
+
+
+def test_covariance_merge():
+    xs = [1.0, 2.0, 4.0, 7.0, 11.0]
+    ys = [2.0, 1.0, 5.0, 8.0, 9.0]
+    whole, a, b = Covariance(), Covariance(), Covariance()
+    for i, (x, y) in enumerate(zip(xs, ys)):
+        whole.add(x, y)
+        (a if i < 2 else b).add(x, y)
+    mx, my = sum(xs) / 5, sum(ys) / 5
+    expected = sum((x - mx) * (y - my) for x, y in zip(xs, ys)) / 4
+    assert whole.covariance() == pytest.approx(expected)
+    assert a.merge(b).covariance() == pytest.approx(expected)
+    assert a.count == 5
@@ -0,0 +1,81 @@
+import pytest
+from craps.dice import Roll, SequenceDice
+from craps.state import TableConfig
+from craps.strategies import PassLineOdds, IronCross, SixEightExplosion, ThreePointMolly
+from craps.tournament import play_session, run_tournament
+
+CONFIG = TableConfig(table_min=15, table_max=10000, odds_max=3, prop_min=5)
+
+
+def test_play_session_pass_line():
+    dice = SequenceDice([Roll((3, 4)), Roll((2, 2)), Roll((1, 3))])  # Win, point 4, hit
+    result = play_session(PassLineOdds(unit=15.0, odds_multiple=2.0), dice, CONFIG, 200.0, 3)
+    # 15 on the natural, then 15 flat + 2:1 on 30 odds
+    assert result.net == 15.0 + 15.0 + 60.0
+    assert result.rolls == 3
+
+
+def test_play_session_counts_wagers_on_table():
+    dice = SequenceDice([Roll((2, 2)), Roll((3, 3))])  # Point on 4, place 6/8 pay
+    result = play_session(SixEightExplosion(unit=18.0, press_to=30.0), dice, CONFIG, 200.0, 2)
+    assert result.net == 21.0
+
+
+def test_iron_cross_matches_integration_layout():
+    dice = SequenceDice([Roll((2, 2)), Roll((3, 3))])  # Point on 4, 6 hits
+    # Field loses 15, place 6 pays 21
+    assert play_session(IronCross(unit=15.0), dice, CONFIG, 200.0, 2).net == 6.0
+
+
+def test_session_stops_when_broke():
+    dice = SequenceDice([Roll((1, 1))] * 10)
+    result = play_session(PassLineOdds(unit=15.0), dice, CONFIG, 30.0, 10)
+    assert result.net == -30.0
+    assert result.rolls == 2
+
+
+def test_tournament_pairs_results():
+    strategies = [PassLineOdds(), IronCross(), ThreePointMolly()]
+    result = run_tournament(strategies, CONFIG, n_sessions=50, rolls_per_session=30, init_bankroll=500.0, seed=1)
+    assert [s.name for s in result.summaries] == ["pass_line_odds", "iron_cross", "three_point_molly"]
+    assert len(result.differences) == 3
+    for diff in result.differences:
+        expected = sum(a - b for a, b in zip(result.nets[diff.a], result.nets[diff.b])) / 50
+        assert diff.mean == pytest.approx(expected)
+        assert diff.ci_low <= diff.mean <= diff.ci_high
+
+
+def test_tournament_is_reproducible():
+    kwargs = dict(n_sessions=10, rolls_per_session=20, init_bankroll=500.0, seed=3)
+    a = run_tournament([PassLineOdds(), IronCross()], CONFIG, **kwargs)
+    b = run_tournament([PassLineOdds(), IronCross()], CONFIG, **kwargs)
+    assert a.nets == b.nets
+
+
+def test_shared_dice_reduce_variance():
+    # Two near-identical strategies are almost perfectly correlated on shared dice
+    strategies = [PassLineOdds(odds_multiple=2.0), PassLineOdds(odds_multiple=1.0)]
+    strategies[1].name = "pass_line_odds_1x"
+    result = run_tournament(strategies, CONFIG, n_sessions=200, rolls_per_session=20, init_bankroll=500.0)
+    assert result.differences[0].variance_ratio < 0.2
+
+
+def test_duplicate_names_error():
+    with pytest.raises(ValueError):
+        run_tournament([IronCross(), IronCross()], CONFIG, 1, 1, 100.0)
+
+
+def test_tournament_from_shared_dice_file(tmp_path):
+    from craps.dice import ROLLS
+    from craps.trace import RollTraceReader, write_session_dice
+    path = str(tmp_path / "dice.bin")
+    write_session_dice(path, n_sessions=20, rolls_per_session=30, seed=11)
+    reader = RollTraceReader(path)
+
+    strategies = [PassLineOdds(), IronCross()]
+    result = run_tournament(strategies, CONFIG, 20, 30, 500.0, session_dice=reader.session_dice)
+    for strategy in strategies:
+        for i in range(20):
+            rolls = [ROLLS[k] for k in reader.episode(i)]
+            expected = play_session(strategy, SequenceDice(rolls), CONFIG, 500.0, 30)
+            assert result.nets[strategy.name][i] == expected.net
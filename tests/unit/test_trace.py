@@ -0,0 +1,152 @@
+import numpy as np
+import pytest
+from craps.dice import Roll, ROLLS, GeneratorDice
+from craps.phase import TablePhase
+from craps.state import TableConfig, TableState
+from craps.bets import PassLine, Field
+from craps.gym.config import CrapsEnvConfig
+from craps.gym.env import CrapsEnv
+from craps.trace import (
+    RollTraceWriter,
+    RollTraceReader,
+    RecordingDice,
+    config_hash,
+    write_session_dice,
+)
+
+TABLE_CONFIG = TableConfig(table_min=10, table_max=50, odds_max=3, prop_min=5)
+ENV_CONFIG = CrapsEnvConfig(init_bankroll=100.0, max_bankroll=200.0, max_points=2, min_bet_inc=5)
+
+
+def make_env(dice) -> CrapsEnv:
+    init_phase = TablePhase()
+    bets = {'pass_line': PassLine(init_phase), 'field': Field(init_phase)}
+    return CrapsEnv(ENV_CONFIG, TABLE_CONFIG, bets, dice=dice)
+
+
+def play_episode(env: CrapsEnv):
+    obs, _ = env.reset()
+    trajectory = []
+    while True:
+        action = {key: 0 for key in env.action_space.spaces}
+        action['stake-field-None'] = 1
+        obs, reward, done, trunc, _ = env.step(action)
+        trajectory.append((env.get_bankroll_size(), int(obs['point'])))
+        if done or trunc:
+            return trajectory
+
+
+def test_roll_outcome_index_round_trip():
+    for i, roll in enumerate(ROLLS):
+        assert roll.outcome_index() == i
+    assert ROLLS[Roll((3, 4)).outcome_index()] == Roll((3, 4))
+
+
+def test_write_and_read(tmp_path):
+    path = str(tmp_path / "rolls.trace")
+    rolls = [Roll((1, 1)), Roll((3, 4)), Roll((6, 6)), Roll((2, 5))]
+    with RollTraceWriter(path, seed=7, config_hash=config_hash(TABLE_CONFIG)) as writer:
+        writer.write(rolls[0])
+        writer.write(rolls[1])
+        writer.new_episode()
+        writer.new_episode()  # empty episodes are skipped
+        writer.write(rolls[2])
+        writer.write(rolls[3])
+
+    reader = RollTraceReader(path)
+    assert reader.header.seed == 7
+    assert reader.header.config_hash == config_hash(TABLE_CONFIG)
+    assert len(reader) == 4
+    assert reader.n_episodes == 2
+    assert [ROLLS[i] for i in reader.episode(1)] == rolls[2:]
+
+    dice = reader.dice(episode=None)
+    assert [dice.next_roll() for _ in range(4)] == rolls
+    with pytest.raises(EOFError):
+        dice.next_roll()
+
+
+def test_reopen_appends(tmp_path):
+    path = str(tmp_path / "rolls.trace")
+    with RollTraceWriter(path, seed=1) as writer:
+        writer.write(Roll((1, 2)))
+    with RollTraceWriter(path, seed=1) as writer:
+        writer.write(Roll((2, 3)))
+    reader = RollTraceReader(path)
+    assert list(reader.rolls) == [Roll((1, 2)).outcome_index(), Roll((2, 3)).outcome_index()]
+    assert reader.n_episodes == 2
+    with pytest.raises(ValueError):
+        RollTraceWriter(path, seed=2)
+
+
+def test_replay_table_state(tmp_path):
+    path = str(tmp_path / "rolls.trace")
+    source = GeneratorDice(np.random.default_rng(0))
+
+    def run(dice):
+        state = TableState(TABLE_CONFIG, {'field': Field(TablePhase())}, 1000.0)
+        for _ in range(200):
+            state.set_bet_stake('field', 10.0)
+            state.step(dice.next_roll())
+        return state.get_bankroll_size()
+
+    with RollTraceWriter(path, seed=0) as writer:
+        expected = run(RecordingDice(source, writer))
+    assert run(RollTraceReader(path).dice(episode=None)) == expected
+
+
+def test_replay_env_episodes(tmp_path):
+    path = str(tmp_path / "rolls.trace")
+    with RollTraceWriter(path, seed=3) as writer:
+        env = make_env(RecordingDice(GeneratorDice(np.random.default_rng(3)), writer))
+        recorded = [play_episode(env) for _ in range(3)]
+
+    reader = RollTraceReader(path)
+    assert reader.n_episodes == 3
+    env = make_env(reader.dice(episode=0))
+    assert [play_episode(env) for _ in range(3)] == recorded
+
+    env = make_env(reader.dice(episode=2))
+    assert play_episode(env) == recorded[2]
+
+
+def test_session_dice_file(tmp_path):
+    path = str(tmp_path / "dice.bin")
+    header = write_session_dice(path, n_sessions=10, rolls_per_session=100, seed=5, chunk_rolls=64)
+    reader = RollTraceReader(path)
+    assert reader.header == header
+    assert reader.stride == 100
+    assert reader.n_episodes == 10
+    assert len(reader) == 1000
+
+    # Indexed by (session, offset), and the same for every reader
+    again = RollTraceReader(path)
+    assert reader.roll(3, 17) == ROLLS[reader.rolls[317]] == again.roll(3, 17)
+    with pytest.raises(IndexError):
+        reader.roll(3, 100)
+    with pytest.raises(IndexError):
+        reader.roll(10, 0)
+
+    dice = reader.session_dice(3, offset=17)
+    dice.new_episode()  # stays on the session
+    assert [dice.next_roll() for _ in range(83)] == [reader.roll(3, k) for k in range(17, 100)]
+    with pytest.raises(EOFError):
+        dice.next_roll()
+
+    # Replaying episodes steps through sessions by stride
+    replay = reader.dice(episode=8)
+    assert replay.next_roll() == reader.roll(8, 0)
+    replay.new_episode()
+    assert replay.next_roll() == reader.roll(9, 0)
+
+
+def test_reader_pickles_by_path(tmp_path):
+    import pickle
+    path = str(tmp_path / "dice.bin")
+    write_session_dice(path, n_sessions=100, rolls_per_session=1000, seed=0)
+    reader = RollTraceReader(path)
+    data = pickle.dumps(reader)
+    assert len(data) < 1000
+    copy = pickle.loads(data)
+    assert isinstance(copy.rolls, np.memmap)
+    assert np.array_equal(copy.episode(42), reader.episode(42))